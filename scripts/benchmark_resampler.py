@@ -0,0 +1,126 @@
+"""Microbenchmark: per-block FFT resampling vs. StreamingResampler.
+
+Measures per-block CPU time and peak transient allocated bytes for the two
+audio paths used by AudioIOManager:
+- Capture: 48kHz -> 16kHz, 1024-sample blocks
+- Playback: 24kHz -> 48kHz, 1024-sample blocks
+
+tracemalloc only sees the net result of a call once its temporaries are
+freed, so the allocation metric is the peak number of bytes allocated above
+the baseline while one block is processed, not a count of allocations. A
+path that allocates nothing per block reports 0 B.
+
+Usage:
+    python scripts/benchmark_resampler.py [--blocks N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from scipy import signal
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from voice_ai_assistant.voice.resampler import StreamingResampler  # noqa: E402
+
+
+def fft_path(block: np.ndarray, input_rate: int, output_rate: int) -> bytes:
+    """Previous AudioIOManager path: FFT resample, astype, tobytes."""
+    audio_np = block.flatten()
+    num_samples_output = int(len(audio_np) * output_rate / input_rate)
+    resampled = signal.resample(audio_np, num_samples_output)
+    return resampled.astype(np.int16).tobytes()
+
+
+def make_streaming_path(input_rate: int, output_rate: int, block_size: int):
+    """Streaming path: stateful polyphase filter into a preallocated buffer."""
+    resampler = StreamingResampler(input_rate, output_rate, max_block_size=block_size)
+
+    def run(block: np.ndarray) -> memoryview:
+        return memoryview(resampler.process(block))
+
+    return run
+
+
+def measure(func, blocks) -> dict:
+    """Measure per-block time and peak transient bytes allocated by func."""
+    # Warm up caches and lazily-created numpy internals
+    for block in blocks[:10]:
+        func(block)
+
+    start = time.perf_counter()
+    for block in blocks:
+        func(block)
+    elapsed = time.perf_counter() - start
+
+    # Peak traced memory above the baseline while one block is processed
+    tracemalloc.start()
+    worst_block_bytes = 0
+    for block in blocks:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func(block)
+        _, peak = tracemalloc.get_traced_memory()
+        worst_block_bytes = max(worst_block_bytes, peak - baseline)
+    tracemalloc.stop()
+
+    return {
+        "us_per_block": elapsed / len(blocks) * 1e6,
+        "peak_bytes_per_block": worst_block_bytes,
+    }
+
+
+def run_case(
+    name: str, input_rate: int, output_rate: int, block_size: int, num_blocks: int
+) -> None:
+    """Benchmark one resampling direction and print a comparison."""
+    rng = np.random.default_rng(0)
+    blocks = [
+        rng.integers(-8000, 8000, size=(block_size, 1), dtype=np.int16)
+        for _ in range(num_blocks)
+    ]
+    flat_blocks = [block[:, 0] for block in blocks]
+
+    fft = measure(lambda b: fft_path(b, input_rate, output_rate), blocks)
+    streaming = measure(
+        make_streaming_path(input_rate, output_rate, block_size), flat_blocks
+    )
+
+    realtime_us = block_size / input_rate * 1e6
+    print(
+        f"\n=== {name}: {input_rate}Hz -> {output_rate}Hz, "
+        f"{block_size}-sample blocks ==="
+    )
+    print(f"Real-time budget per block: {realtime_us:.0f} us")
+    for label, result in (
+        ("FFT (scipy.signal.resample)", fft),
+        ("StreamingResampler", streaming),
+    ):
+        print(
+            f"{label:<30} {result['us_per_block']:8.1f} us/block  "
+            f"peak transient bytes/block {result['peak_bytes_per_block']:>8} B"
+        )
+    print(f"Speedup: {fft['us_per_block'] / streaming['us_per_block']:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--blocks", type=int, default=2000, help="Blocks per measurement"
+    )
+    parser.add_argument(
+        "--block-size", type=int, default=1024, help="Samples per block"
+    )
+    args = parser.parse_args()
+
+    run_case("Capture", 48000, 16000, args.block_size, args.blocks)
+    run_case("Playback", 24000, 48000, args.block_size, args.blocks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""End-of-speech latency comparison.
+
+Streams a recorded utterance to the Gemini Live API in real time and
+measures the time from the end of speech to the first response, for each
+end-pointing strategy:
+
+- server:       automatic activity detection, trailing silence is uploaded
+- stream_end:   local VAD suppresses silence and sends audioStreamEnd
+- client:       automatic detection disabled, local VAD sends explicit
+                activityStart/activityEnd after the trailing-silence window
+
+Usage:
+    python scripts/end_of_speech_latency_test.py utterance.wav --runs 3
+    python scripts/end_of_speech_latency_test.py utterance.wav --silence-ms 200 300 500
+"""
+
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+import wave
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+try:
+    import numpy as np
+    from dotenv import load_dotenv
+except ImportError:
+    print("Missing dependencies. Please run:")
+    print("pip install numpy python-dotenv")
+    sys.exit(1)
+
+from voice_ai_assistant.voice.resampler import StreamingResampler  # noqa: E402
+from voice_ai_assistant.voice.vad import VADConfig, VoiceActivityDetector  # noqa: E402
+from voice_ai_assistant.voice.vertex_client import VertexLiveClient  # noqa: E402
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+INPUT_RATE = 16000
+CHUNK_MS = 100
+TRAILING_SILENCE_SECONDS = 3.0
+RESPONSE_TIMEOUT_SECONDS = 10.0
+
+
+def load_utterance(path: str) -> np.ndarray:
+    """Load a mono 16-bit WAV file as 16 kHz int16 samples."""
+    with wave.open(path, "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError("Expected 16-bit PCM WAV")
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+        if wav.getnchannels() > 1:
+            samples = samples.reshape(-1, wav.getnchannels())[:, 0]
+        rate = wav.getframerate()
+
+    if rate != INPUT_RATE:
+        resampler = StreamingResampler(rate, INPUT_RATE, max_block_size=len(samples))
+        samples = resampler.process(samples).copy()
+    return samples
+
+
+async def run_once(samples: np.ndarray, mode: str, silence_ms: int) -> float:
+    """Stream the utterance once and return end-of-speech to response latency (ms)."""
+    client = VertexLiveClient(
+        model=os.getenv(
+            "VERTEX_AI_MODEL", "gemini-2.5-flash-native-audio-preview-09-2025"
+        ),
+        automatic_activity_detection=(mode != "client"),
+    )
+    vad = VoiceActivityDetector(
+        VADConfig(sample_rate=INPUT_RATE, hangover_ms=silence_ms)
+    )
+
+    first_response = asyncio.Event()
+    response_time = 0.0
+
+    def on_response(_):
+        nonlocal response_time
+        if not first_response.is_set():
+            response_time = time.monotonic()
+            first_response.set()
+
+    client.set_audio_response_callback(on_response)
+    client.set_text_response_callback(on_response)
+
+    await client.connect()
+    listener = asyncio.create_task(client.listen_for_responses())
+
+    chunk_samples = INPUT_RATE * CHUNK_MS // 1000
+    silence = np.zeros(int(INPUT_RATE * TRAILING_SILENCE_SECONDS), dtype=np.int16)
+    audio = np.concatenate([samples, silence])
+    speech_end_time = None
+
+    try:
+        start = time.monotonic()
+        for index, offset in enumerate(range(0, len(audio), chunk_samples)):
+            # Pace chunks like a live microphone
+            due = start + index * CHUNK_MS / 1000
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            if first_response.is_set():
+                break
+
+            chunk = audio[offset : offset + chunk_samples].tobytes()
+            result = vad.process(chunk)
+            if result.is_speech:
+                speech_end_time = time.monotonic() + CHUNK_MS / 1000
+
+            if mode == "server":
+                await client.send_audio_chunk(chunk)
+                continue
+
+            if result.speech_started and mode == "client":
+                await client.send_activity_start()
+            if result.audio is not None:
+                await client.send_audio_chunk(result.audio)
+            if result.speech_ended:
+                if mode == "client":
+                    await client.send_activity_end()
+                else:
+                    await client.send_audio_stream_end()
+
+        await asyncio.wait_for(first_response.wait(), timeout=RESPONSE_TIMEOUT_SECONDS)
+
+    finally:
+        listener.cancel()
+        await client.disconnect()
+
+    if speech_end_time is None:
+        raise RuntimeError("No speech detected in the utterance")
+    return (response_time - speech_end_time) * 1000
+
+
+async def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compare end-of-speech detection latency"
+    )
+    parser.add_argument(
+        "wav", help="Mono 16-bit WAV file with a single spoken question"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Runs per configuration")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["server", "stream_end", "client"],
+        choices=["server", "stream_end", "client"],
+    )
+    parser.add_argument(
+        "--silence-ms",
+        type=int,
+        nargs="+",
+        default=[400],
+        help="Trailing-silence windows for the local end-pointer",
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    if not os.getenv("GOOGLE_AI_API_KEY"):
+        print("Missing environment variable: GOOGLE_AI_API_KEY")
+        sys.exit(1)
+
+    samples = load_utterance(args.wav)
+    duration = len(samples) / INPUT_RATE
+    print(f"Utterance: {duration:.2f}s, {args.runs} run(s) per configuration\n")
+
+    results = []
+    for mode in args.modes:
+        # The server baseline does not use the local end-pointer
+        windows = [None] if mode == "server" else args.silence_ms
+        for silence_ms in windows:
+            latencies = []
+            for run in range(args.runs):
+                try:
+                    latencies.append(await run_once(samples, mode, silence_ms or 400))
+                except asyncio.TimeoutError:
+                    print(
+                        f"  {mode} run {run + 1}: no response within "
+                        f"{RESPONSE_TIMEOUT_SECONDS:.0f}s"
+                    )
+            label = mode if silence_ms is None else f"{mode} ({silence_ms} ms)"
+            results.append((label, latencies))
+
+    print(
+        f"{'Configuration':<24} {'runs':>4} {'median ms':>10} "
+        f"{'min ms':>8} {'max ms':>8}"
+    )
+    for label, latencies in results:
+        if not latencies:
+            print(f"{label:<24} {0:>4} {'-':>10} {'-':>8} {'-':>8}")
+            continue
+        print(
+            f"{label:<24} {len(latencies):>4} {statistics.median(latencies):>10.0f} "
+            f"{min(latencies):>8.0f} {max(latencies):>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
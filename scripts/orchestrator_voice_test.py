@@ -43,18 +43,22 @@ logging.getLogger('voice_ai_assistant.orchestration.voice_orchestrator').setLeve
 class OrchestratorVoiceTester:
     """Test harness for VoiceOrchestrator with full audio I/O integration."""
 
-    def __init__(self, input_device=None, output_device=None):
+    def __init__(self, input_device=None, output_device=None, end_of_speech_mode="server", silence_ms=400):
         """Initialize the tester.
 
         Args:
             input_device: Sounddevice input device index (None for default)
             output_device: Sounddevice output device index (None for default)
+            end_of_speech_mode: "server" or "client" end-of-speech detection
+            silence_ms: Trailing silence before the local end-pointer fires
         """
         self.orchestrator = None
         self.session_id = None
         self.is_running = False
         self.input_device = input_device
         self.output_device = output_device
+        self.end_of_speech_mode = end_of_speech_mode
+        self.silence_ms = silence_ms
 
     async def setup(self):
         """Initialize the orchestrator."""
@@ -92,7 +96,9 @@ class OrchestratorVoiceTester:
             vertex_output_rate=24000,
             input_device=self.input_device,
             output_device=self.output_device,
-            repository_base_path=repository_base_path
+            repository_base_path=repository_base_path,
+            end_of_speech_mode=self.end_of_speech_mode,
+            vad_hangover_ms=self.silence_ms
         )
 
         # Create and start orchestrator
@@ -135,6 +141,7 @@ class OrchestratorVoiceTester:
         print(f"Output Device: {self.output_device if self.output_device is not None else 'Default'}")
         print(f"Sample Rate: {self.orchestrator.config.hardware_sample_rate} Hz")
         print(f"Repository Base: {self.orchestrator.config.repository_base_path}")
+        print(f"End of Speech: {self.end_of_speech_mode} ({self.silence_ms} ms trailing silence)")
         print("="*60)
         print("\nℹ️  The orchestrator will:")
         print("  1. Capture audio from your microphone (resampled 48kHz → 16kHz)")
@@ -176,6 +183,7 @@ class OrchestratorVoiceTester:
         if self.orchestrator:
             # End conversation session
             if self.session_id:
+                self._print_turn_latency()
                 await self.orchestrator.end_conversation(self.session_id)
 
             # Stop orchestrator
@@ -183,6 +191,18 @@ class OrchestratorVoiceTester:
 
         print("\n👋 Test stopped. Goodbye!")
 
+    def _print_turn_latency(self):
+        """Print end-of-speech to first-response latency for the session."""
+        state = self.orchestrator.get_session_state(self.session_id)
+        if not state or not state['pipeline_state']:
+            return
+
+        metrics = state['pipeline_state']['metrics']
+        print(f"\n⏱️  Turn latency ({self.end_of_speech_mode}, {self.silence_ms} ms): "
+              f"{metrics['turns_measured']} turn(s), "
+              f"avg {metrics['avg_turn_latency_ms']:.0f} ms, "
+              f"p95 {metrics['p95_turn_latency_ms']:.0f} ms")
+
 
 async def main():
     """Main entry point."""
@@ -190,11 +210,17 @@ async def main():
     parser = argparse.ArgumentParser(description='Voice AI Assistant Orchestrator Test')
     parser.add_argument('--input-device', type=int, help='Input device index')
     parser.add_argument('--output-device', type=int, help='Output device index')
+    parser.add_argument('--end-of-speech', choices=['server', 'client'], default='server',
+                        help='Server-side or client-side (local VAD) end-of-speech detection')
+    parser.add_argument('--silence-ms', type=int, default=400,
+                        help='Trailing silence before the local end-pointer fires')
     args = parser.parse_args()
 
     tester = OrchestratorVoiceTester(
         input_device=args.input_device,
-        output_device=args.output_device
+        output_device=args.output_device,
+        end_of_speech_mode=args.end_of_speech,
+        silence_ms=args.silence_ms
     )
 
     try:
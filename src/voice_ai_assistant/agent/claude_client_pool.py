@@ -0,0 +1,368 @@
+"""Pool of Claude Code SDK clients.
+
+Each ClaudeSDKClient drives its own Claude Code subprocess and keeps the
+conversation of the queries sent to it. The pool keeps a bounded number
+of started clients so coding tasks from different voice sessions run in
+parallel, while tasks of one session go to the same client and see its
+earlier context. A client is never handed to another session without
+being restarted, so contexts do not bleed between conversations.
+"""
+
+import asyncio
+import contextvars
+import logging
+import statistics
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Voice session on whose behalf agent work runs; set by the orchestrator
+# so coding tasks can be routed to that session's client
+current_session_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "claude_session_id", default=None
+)
+
+
+@dataclass
+class ClaudeWorker:
+    """A started Claude Code client and its bookkeeping."""
+
+    client: Any
+    worker_id: int
+    session_id: Optional[str] = None  # Session whose context the client holds
+    busy: bool = False
+    healthy: bool = True
+    tasks: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ClaudeClientPool:
+    """Bounded pool of Claude Code clients with per-session affinity."""
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        max_clients: int = 4,
+        min_clients: int = 1,
+        idle_timeout_s: float = 300.0,
+        health_check_interval_s: float = 60.0,
+        health_check_timeout_s: float = 10.0,
+    ):
+        """Initialize client pool.
+
+        Args:
+            client_factory: Creates a new (not yet started) ClaudeSDKClient
+            max_clients: Maximum number of live clients
+            min_clients: Unbound clients started ahead of demand
+            idle_timeout_s: Clients unused for longer are closed
+            health_check_interval_s: Period of idle eviction and health checks
+            health_check_timeout_s: Time a health probe may take
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+
+        self._client_factory = client_factory
+        self.max_clients = max_clients
+        self.min_clients = min(min_clients, max_clients)
+        self.idle_timeout_s = idle_timeout_s
+        self.health_check_interval_s = health_check_interval_s
+        self.health_check_timeout_s = health_check_timeout_s
+
+        self._workers: List[ClaudeWorker] = []
+        self._starting = 0  # Clients being created, counted against max_clients
+        self._next_worker_id = 0
+        self._available = asyncio.Condition()
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Statistics
+        self.acquisitions = 0
+        self.affinity_hits = 0
+        self.rebinds = 0
+        self.clients_created = 0
+        self.clients_evicted = 0
+        self.health_failures = 0
+        self.waiting = 0
+        self.queue_wait_samples: deque = deque(maxlen=100)
+
+    @property
+    def size(self) -> int:
+        """Number of live clients."""
+        return len(self._workers)
+
+    async def start(self) -> None:
+        """Start the minimum number of clients and the maintenance loop."""
+        self._closed = False
+        while len(self._workers) < self.min_clients:
+            self._workers.append(await self._create_worker())
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.create_task(self._maintain())
+        logger.info(
+            f"Claude client pool started ({self.size}/{self.max_clients} clients)"
+        )
+
+    async def close(self) -> None:
+        """Stop the maintenance loop and close every client."""
+        self._closed = True
+        if self._maintenance_task and not self._maintenance_task.done():
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+        self._maintenance_task = None
+
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            await self._close_worker(worker)
+        async with self._available:
+            self._available.notify_all()
+        logger.info("Claude client pool closed")
+
+    @asynccontextmanager
+    async def acquire(
+        self, session_id: Optional[str] = None
+    ) -> AsyncIterator[ClaudeWorker]:
+        """Check out a client for one query.
+
+        Tasks of a session run one at a time on the client holding that
+        session's context; tasks of different sessions run in parallel up
+        to max_clients.
+
+        Args:
+            session_id: Session the task belongs to (None for no affinity)
+
+        Yields:
+            Worker whose client may be used until the block exits. Mark it
+            unhealthy to have the client replaced instead of reused.
+        """
+        started_at = time.monotonic()
+        worker = await self._checkout(session_id)
+        self.acquisitions += 1
+        self.queue_wait_samples.append((time.monotonic() - started_at) * 1000)
+        try:
+            yield worker
+        finally:
+            worker.busy = False
+            worker.last_used = time.monotonic()
+            if not worker.healthy:
+                await self._discard(worker)
+            async with self._available:
+                self._available.notify_all()
+
+    async def _checkout(self, session_id: Optional[str]) -> ClaudeWorker:
+        """Find, create or wait for a client for the session."""
+        self.waiting += 1
+        try:
+            async with self._available:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Claude client pool is closed")
+                    action, worker = self._pick(session_id)
+                    if action != "wait":
+                        break
+                    await self._available.wait()
+
+                if action == "use":
+                    worker.busy = True
+                    if session_id is not None and worker.session_id == session_id:
+                        self.affinity_hits += 1
+                    worker.session_id = session_id
+                    worker.tasks += 1
+                    return worker
+
+                # Reserve the slot before giving up the condition lock
+                self._starting += 1
+                if action == "rebind":
+                    worker.busy = True
+
+            try:
+                if action == "rebind":
+                    # The idle client holds another session's context
+                    self.rebinds += 1
+                    await self._discard(worker)
+                worker = await self._create_worker()
+                worker.busy = True
+                worker.session_id = session_id
+                worker.tasks += 1
+                self._workers.append(worker)
+            finally:
+                self._starting -= 1
+                async with self._available:
+                    self._available.notify_all()
+            return worker
+        finally:
+            self.waiting -= 1
+
+    def _pick(self, session_id: Optional[str]):
+        """Choose what to do for the session.
+
+        Returns:
+            ("use", worker) for a client to use as is, ("rebind", worker) for
+            an idle client to restart for this session, ("create", None) or
+            ("wait", None)
+        """
+        idle = [w for w in self._workers if not w.busy and w.healthy]
+
+        if session_id is not None:
+            for worker in idle:
+                if worker.session_id == session_id:
+                    return "use", worker
+            if any(w.session_id == session_id and w.busy for w in self._workers):
+                # The session's client is running an earlier task of the
+                # same conversation; wait for it rather than fork the context
+                return "wait", None
+
+        for worker in idle:
+            if worker.session_id is None or worker.session_id == session_id:
+                return "use", worker
+
+        if self._has_room():
+            return "create", None
+
+        # Full: take over the least recently used idle client
+        if idle:
+            return "rebind", min(idle, key=lambda w: w.last_used)
+        return "wait", None
+
+    def _has_room(self) -> bool:
+        """Whether another client may be started."""
+        return len(self._workers) + self._starting < self.max_clients
+
+    async def _create_worker(self) -> ClaudeWorker:
+        """Create and start a client."""
+        client = self._client_factory()
+        await client.__aenter__()
+        self._next_worker_id += 1
+        self.clients_created += 1
+        logger.debug(f"Started Claude Code client #{self._next_worker_id}")
+        return ClaudeWorker(client=client, worker_id=self._next_worker_id)
+
+    async def _discard(self, worker: ClaudeWorker) -> None:
+        """Remove a client from the pool and close it."""
+        if worker in self._workers:
+            self._workers.remove(worker)
+        await self._close_worker(worker)
+
+    async def _close_worker(self, worker: ClaudeWorker) -> None:
+        """Close a client, giving up after the health check timeout."""
+        try:
+            await asyncio.wait_for(
+                worker.client.__aexit__(None, None, None),
+                timeout=self.health_check_timeout_s,
+            )
+        except Exception as e:
+            logger.error(f"Error closing Claude Code client #{worker.worker_id}: {e}")
+
+    async def _maintain(self) -> None:
+        """Periodically evict idle clients and check the health of the rest."""
+        while True:
+            await asyncio.sleep(self.health_check_interval_s)
+            try:
+                await self.evict_idle()
+                await self.check_health()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Claude client pool maintenance failed: {e}")
+
+    async def evict_idle(self) -> int:
+        """Close clients idle for longer than idle_timeout_s.
+
+        Session-bound clients go first; unbound ones are kept down to
+        min_clients so a new session does not wait for a cold start.
+
+        Returns:
+            Number of clients closed
+        """
+        now = time.monotonic()
+        expired = [
+            w
+            for w in self._workers
+            if not w.busy and now - w.last_used > self.idle_timeout_s
+        ]
+        expired.sort(key=lambda w: (w.session_id is None, w.last_used))
+
+        evicted = 0
+        for worker in expired:
+            if worker.session_id is None and len(self._workers) <= self.min_clients:
+                continue
+            worker.busy = True
+            await self._discard(worker)
+            evicted += 1
+
+        if evicted:
+            self.clients_evicted += evicted
+            logger.info(f"Evicted {evicted} idle Claude Code client(s)")
+        return evicted
+
+    async def check_health(self) -> int:
+        """Probe idle clients and replace the ones that do not answer.
+
+        Returns:
+            Number of clients found unhealthy
+        """
+        failed = 0
+        for worker in [w for w in self._workers if not w.busy]:
+            probe = getattr(worker.client, "get_server_info", None)
+            if probe is None:
+                continue
+            worker.busy = True
+            try:
+                await asyncio.wait_for(probe(), timeout=self.health_check_timeout_s)
+                worker.healthy = True
+            except Exception as e:
+                logger.warning(
+                    f"Claude Code client #{worker.worker_id} failed health check: {e}"
+                )
+                worker.healthy = False
+            finally:
+                worker.busy = False
+
+            if not worker.healthy:
+                failed += 1
+                self.health_failures += 1
+                await self._discard(worker)
+
+        # Keep the warm minimum
+        while len(self._workers) < self.min_clients and not self._closed:
+            self._workers.append(await self._create_worker())
+        if failed:
+            async with self._available:
+                self._available.notify_all()
+        return failed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary of client counts, affinity and queue wait metrics
+        """
+        samples = self.queue_wait_samples
+        p95 = (
+            sorted(samples)[min(int(0.95 * len(samples)), len(samples) - 1)]
+            if samples
+            else 0.0
+        )
+        return {
+            "clients": self.size,
+            "max_clients": self.max_clients,
+            "busy_clients": sum(1 for w in self._workers if w.busy),
+            "sessions_bound": len(
+                {w.session_id for w in self._workers if w.session_id is not None}
+            ),
+            "waiting": self.waiting,
+            "acquisitions": self.acquisitions,
+            "affinity_hits": self.affinity_hits,
+            "rebinds": self.rebinds,
+            "clients_created": self.clients_created,
+            "clients_evicted": self.clients_evicted,
+            "health_failures": self.health_failures,
+            "avg_queue_wait_ms": statistics.mean(samples) if samples else 0.0,
+            "p95_queue_wait_ms": p95,
+        }
@@ -0,0 +1,230 @@
+"""Bounded conversation memory for the Strands agent.
+
+Strands keeps every message of the conversation and sends all of them
+with each model call, so per-turn latency and token cost grow for as
+long as the session lasts. ConversationMemory keeps the most recent
+turns verbatim and folds older ones into a running summary. The
+summary is produced in the background after a turn has been answered
+and only swapped in while the agent is idle, so no turn waits for it.
+"""
+
+import asyncio
+import json
+import logging
+import statistics
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used for token estimates
+CHARS_PER_TOKEN = 4
+
+# Tool results can be long file dumps; only their start is summarized
+MAX_TOOL_RESULT_CHARS = 500
+
+
+def message_text(message: Dict[str, Any]) -> str:
+    """Render a Strands message as plain text for summarization."""
+    parts = []
+    for block in message.get("content", []):
+        if "text" in block:
+            parts.append(block["text"])
+        elif "toolUse" in block:
+            tool_use = block["toolUse"]
+            arguments = json.dumps(tool_use.get("input", {}))
+            parts.append(f"[called {tool_use.get('name')}: {arguments}]")
+        elif "toolResult" in block:
+            result = " ".join(
+                item["text"]
+                for item in block["toolResult"].get("content", [])
+                if "text" in item
+            )
+            if len(result) > MAX_TOOL_RESULT_CHARS:
+                result = result[:MAX_TOOL_RESULT_CHARS] + "..."
+            parts.append(f"[tool result: {result}]")
+    return " ".join(parts)
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Estimate the prompt tokens of a message list."""
+    return (
+        sum(len(json.dumps(message.get("content", []))) for message in messages)
+        // CHARS_PER_TOKEN
+    )
+
+
+def is_turn_start(message: Dict[str, Any]) -> bool:
+    """Whether a message is a user utterance (not a tool result)."""
+    return message.get("role") == "user" and not any(
+        "toolResult" in block for block in message.get("content", [])
+    )
+
+
+class ConversationMemory:
+    """Sliding window of recent turns plus a summary of older ones."""
+
+    def __init__(
+        self,
+        summarize: Callable[[str, str], Awaitable[str]],
+        window_turns: int = 10,
+        keep_turns: Optional[int] = None,
+        max_summary_chars: int = 2000,
+    ):
+        """Initialize conversation memory.
+
+        Args:
+            summarize: Given the previous summary and a transcript of older
+                turns, returns the new summary
+            window_turns: Turns kept verbatim before compaction starts
+            keep_turns: Turns left verbatim after a compaction (defaults to
+                half the window, so compaction runs every few turns)
+            max_summary_chars: Summaries longer than this are truncated
+        """
+        if window_turns < 1:
+            raise ValueError("window_turns must be at least 1")
+
+        self._summarize = summarize
+        self.window_turns = window_turns
+        self.keep_turns = (
+            keep_turns if keep_turns is not None else max(1, window_turns // 2)
+        )
+        self.max_summary_chars = max_summary_chars
+
+        self.summary = ""
+        self._task: Optional[asyncio.Task] = None
+        self._compacted: List[Dict[str, Any]] = (
+            []
+        )  # Messages covered by the pending summary
+        self._pending_summary: Optional[str] = None
+
+        # Statistics
+        self.compactions = 0
+        self.compaction_failures = 0
+        self.messages_compacted = 0
+        self._compacted_tokens = 0  # Tokens of all messages replaced by the summary
+        self.tokens_before_samples: deque = deque(maxlen=100)
+        self.tokens_after_samples: deque = deque(maxlen=100)
+
+    @property
+    def compacting(self) -> bool:
+        """Whether a summary is being produced."""
+        return self._task is not None and not self._task.done()
+
+    def record_turn(self, messages: List[Dict[str, Any]]) -> None:
+        """Record the prompt size of a turn, with and without compaction.
+
+        Args:
+            messages: Agent history as sent to the model
+        """
+        window_tokens = estimate_tokens(messages)
+        summary_tokens = len(self.summary) // CHARS_PER_TOKEN
+        self.tokens_after_samples.append(window_tokens + summary_tokens)
+        self.tokens_before_samples.append(window_tokens + self._compacted_tokens)
+
+    def maybe_compact(self, messages: List[Dict[str, Any]]) -> bool:
+        """Start summarizing the oldest turns if the window is exceeded.
+
+        Args:
+            messages: Agent history (not modified here)
+
+        Returns:
+            True if a background compaction was started
+        """
+        if self.compacting or self._pending_summary is not None:
+            return False
+
+        starts = [i for i, message in enumerate(messages) if is_turn_start(message)]
+        if len(starts) <= self.window_turns:
+            return False
+
+        cut = starts[len(starts) - self.keep_turns]
+        self._compacted = messages[:cut]
+        transcript = "\n".join(
+            f"{message.get('role')}: {message_text(message)}"
+            for message in self._compacted
+        )
+        self._task = asyncio.create_task(self._run_summary(transcript))
+        logger.debug(
+            f"Compacting {cut} messages ({len(starts) - self.keep_turns} turns)"
+        )
+        return True
+
+    def apply(self, messages: List[Dict[str, Any]]) -> bool:
+        """Swap a finished summary in for the turns it covers.
+
+        Call only while no agent run is using the history.
+
+        Args:
+            messages: Agent history, trimmed in place
+
+        Returns:
+            True if the history was trimmed (the summary changed)
+        """
+        if self._pending_summary is None:
+            return False
+
+        compacted, self._compacted = self._compacted, []
+        summary, self._pending_summary = self._pending_summary, None
+
+        # The history may have been rolled back (e.g. an abandoned run)
+        if len(messages) < len(compacted) or any(
+            a is not b for a, b in zip(messages, compacted)
+        ):
+            logger.debug("History changed during compaction, discarding summary")
+            return False
+
+        del messages[: len(compacted)]
+        self.summary = summary
+        self.compactions += 1
+        self.messages_compacted += len(compacted)
+        self._compacted_tokens += estimate_tokens(compacted)
+        logger.info(
+            f"Compacted {len(compacted)} messages into a {len(summary)} char summary"
+        )
+        return True
+
+    async def close(self) -> None:
+        """Cancel a compaction in progress."""
+        if self.compacting:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run_summary(self, transcript: str) -> None:
+        """Produce the new summary in the background."""
+        try:
+            summary = (await self._summarize(self.summary, transcript)).strip()
+            self._pending_summary = summary[: self.max_summary_chars]
+        except asyncio.CancelledError:
+            self._compacted = []
+            raise
+        except Exception as e:
+            # Keep the turns verbatim; compaction is retried after the next turn
+            self.compaction_failures += 1
+            self._compacted = []
+            logger.error(f"Conversation summary failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memory statistics.
+
+        Returns:
+            Dictionary of compaction counters and estimated prompt tokens
+            per turn with (after) and without (before) compaction
+        """
+        before, after = self.tokens_before_samples, self.tokens_after_samples
+        return {
+            "window_turns": self.window_turns,
+            "compactions": self.compactions,
+            "compaction_failures": self.compaction_failures,
+            "messages_compacted": self.messages_compacted,
+            "summary_chars": len(self.summary),
+            "compacting": self.compacting,
+            "avg_tokens_per_turn_before": statistics.mean(before) if before else 0.0,
+            "avg_tokens_per_turn_after": statistics.mean(after) if after else 0.0,
+            "last_tokens_per_turn_before": before[-1] if before else 0,
+            "last_tokens_per_turn_after": after[-1] if after else 0,
+        }
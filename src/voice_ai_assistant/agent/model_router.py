@@ -0,0 +1,336 @@
+"""Routing of agent turns between a fast conversational path and the coding agent.
+
+Greetings, thanks and clarifications of the last answer do not need the
+coding agent: its long tool-oriented system prompt and tool schema make
+every turn slower, and the prompt pushes the model towards calling
+Claude Code. TurnRouter classifies each turn with a few word lists, so
+the decision costs microseconds, and keeps per-route latency histograms
+that show whether the split pays off. Only known small talk phrases and
+clarification patterns take the fast path; anything else goes to the
+coding agent, including short commands like "undo that" or "try again"
+that name no code at all.
+"""
+
+import logging
+import re
+import statistics
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+CONVERSATIONAL = "conversational"
+CODING = "coding"
+
+# Words that tie a turn to the repository or to work on it
+CODING_TERMS = frozenset(
+    {
+        "code",
+        "codebase",
+        "file",
+        "files",
+        "folder",
+        "directory",
+        "function",
+        "functions",
+        "class",
+        "classes",
+        "method",
+        "methods",
+        "variable",
+        "module",
+        "modules",
+        "package",
+        "import",
+        "repo",
+        "repository",
+        "project",
+        "bug",
+        "bugs",
+        "error",
+        "errors",
+        "exception",
+        "traceback",
+        "crash",
+        "test",
+        "tests",
+        "build",
+        "compile",
+        "commit",
+        "branch",
+        "merge",
+        "diff",
+        "refactor",
+        "implement",
+        "fix",
+        "debug",
+        "line",
+        "lines",
+        "api",
+        "endpoint",
+        "database",
+        "query",
+        "script",
+        "config",
+        "configuration",
+        "dependency",
+        "dependencies",
+        "install",
+        "deploy",
+        "run",
+        "search",
+        "find",
+        "read",
+        "open",
+        "show",
+        "check",
+        "look",
+        "change",
+        "add",
+        "remove",
+        "delete",
+        "rename",
+        "write",
+        "create",
+        "update",
+        "python",
+        "javascript",
+        "typescript",
+        "sql",
+        "readme",
+    }
+)
+
+# Whole utterances (after normalization) that are small talk
+CONVERSATIONAL_PHRASES = frozenset(
+    {
+        "hi",
+        "hello",
+        "hey",
+        "hey there",
+        "hello there",
+        "good morning",
+        "good afternoon",
+        "good evening",
+        "how are you",
+        "how are you doing",
+        "how is it going",
+        "how's it going",
+        "what's up",
+        "thanks",
+        "thank you",
+        "thanks a lot",
+        "thank you very much",
+        "cheers",
+        "great",
+        "cool",
+        "nice",
+        "perfect",
+        "awesome",
+        "got it",
+        "i see",
+        "makes sense",
+        "that makes sense",
+        "sounds good",
+        "okay",
+        "ok",
+        "alright",
+        "bye",
+        "goodbye",
+        "see you",
+        "talk to you later",
+        "who are you",
+        "what can you do",
+        "what's your name",
+    }
+)
+
+# Follow-ups answered from the conversation itself
+CLARIFICATION_PATTERNS = (
+    re.compile(r"^what do you mean\b"),
+    re.compile(r"^(can|could) you (explain|clarify|elaborate)( on)? (that|it|this)\b"),
+    re.compile(r"^(explain|clarify) (that|it|this)\b"),
+    re.compile(r"^(say|tell me) more\b"),
+    re.compile(r"^(in )?(simpler|plain|other) (terms|words)\b"),
+    re.compile(r"^why is that\b"),
+    re.compile(r"^what does that mean\b"),
+)
+
+_PUNCTUATION = re.compile(r"[^\w\s']")
+# File names, paths, snake_case and camelCase identifiers
+_CODE_TOKEN = re.compile(r"\w\.\w|/|\w_\w|[a-z][A-Z]")
+
+# Upper bounds (ms) of the latency histogram buckets
+LATENCY_BUCKETS_MS: Sequence[float] = (
+    100,
+    200,
+    300,
+    500,
+    750,
+    1000,
+    1500,
+    2000,
+    3000,
+    5000,
+    10000,
+    30000,
+)
+
+
+@dataclass
+class RouteDecision:
+    """Route chosen for a turn and why."""
+
+    route: str
+    reason: str
+
+
+class LatencyHistogram:
+    """Bucketed latencies plus recent samples for percentiles."""
+
+    def __init__(
+        self, buckets_ms: Sequence[float] = LATENCY_BUCKETS_MS, max_samples: int = 200
+    ):
+        """Initialize histogram.
+
+        Args:
+            buckets_ms: Ascending bucket upper bounds; slower samples go to
+                an overflow bucket
+            max_samples: Recent samples kept for percentiles
+        """
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.samples: deque = deque(maxlen=max_samples)
+        self.total = 0
+
+    def record(self, latency_ms: float) -> None:
+        """Add a sample."""
+        index = next(
+            (i for i, bound in enumerate(self.buckets_ms) if latency_ms <= bound),
+            len(self.buckets_ms),
+        )
+        self.counts[index] += 1
+        self.samples.append(latency_ms)
+        self.total += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Percentile of the recent samples (0.0 without samples)."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get histogram statistics.
+
+        Returns:
+            Dictionary with count, average, p50/p95 and bucket counts keyed
+            by upper bound ("le_<ms>", "gt_<ms>" for the overflow bucket)
+        """
+        buckets = {
+            f"le_{bound:g}": count for bound, count in zip(self.buckets_ms, self.counts)
+        }
+        buckets[f"gt_{self.buckets_ms[-1]:g}"] = self.counts[-1]
+        return {
+            "count": self.total,
+            "avg_ms": statistics.mean(self.samples) if self.samples else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": buckets,
+        }
+
+
+class TurnRouter:
+    """Cheap classifier of turns into conversational and coding ones."""
+
+    def __init__(self):
+        """Initialize router."""
+        # Statistics
+        self.decisions: Dict[str, int] = {CONVERSATIONAL: 0, CODING: 0}
+        self.reasons: Dict[str, int] = {}
+        self.fallbacks = 0
+        self.ttft: Dict[str, LatencyHistogram] = {
+            CONVERSATIONAL: LatencyHistogram(),
+            CODING: LatencyHistogram(),
+        }
+        self.total: Dict[str, LatencyHistogram] = {
+            CONVERSATIONAL: LatencyHistogram(),
+            CODING: LatencyHistogram(),
+        }
+
+    def classify(self, text: str, last_reply: Optional[str] = None) -> RouteDecision:
+        """Choose the route of a turn.
+
+        Args:
+            text: User utterance
+            last_reply: The assistant's previous reply, if any
+
+        Returns:
+            The route and the rule that chose it
+        """
+        decision = self._classify(text, last_reply)
+        self.decisions[decision.route] += 1
+        self.reasons[decision.reason] = self.reasons.get(decision.reason, 0) + 1
+        logger.debug(f"Routed '{text}' to {decision.route} ({decision.reason})")
+        return decision
+
+    def _classify(self, text: str, last_reply: Optional[str]) -> RouteDecision:
+        """Coding signals win; small talk only when nothing points elsewhere."""
+        if _CODE_TOKEN.search(text):
+            return RouteDecision(CODING, "code_token")
+
+        normalized = " ".join(_PUNCTUATION.sub(" ", text.lower()).split())
+        words = normalized.split()
+        if not words:
+            return RouteDecision(CODING, "empty")
+        if any(word in CODING_TERMS for word in words):
+            return RouteDecision(CODING, "coding_term")
+
+        # "Yes" or "go ahead" may answer the agent's offer to run a task
+        if last_reply and last_reply.rstrip().endswith("?"):
+            return RouteDecision(CODING, "answers_question")
+
+        if normalized in CONVERSATIONAL_PHRASES:
+            return RouteDecision(CONVERSATIONAL, "small_talk")
+        if any(pattern.match(normalized) for pattern in CLARIFICATION_PATTERNS):
+            return RouteDecision(CONVERSATIONAL, "clarification")
+        return RouteDecision(CODING, "default")
+
+    def record_latency(
+        self, route: str, ttft_ms: Optional[float], total_ms: float
+    ) -> None:
+        """Record the latency of a finished turn.
+
+        Args:
+            route: Route the turn actually took
+            ttft_ms: Time to the first response text (None if none came)
+            total_ms: Time until the response was complete
+        """
+        if ttft_ms is not None:
+            self.ttft[route].record(ttft_ms)
+        self.total[route].record(total_ms)
+
+    def record_fallback(self) -> None:
+        """Count a conversational turn that had to be redone by the coding agent."""
+        self.fallbacks += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get routing statistics.
+
+        Returns:
+            Dictionary with decisions per route and rule, and TTFT and
+            total latency histograms per route
+        """
+        return {
+            "decisions": dict(self.decisions),
+            "reasons": dict(self.reasons),
+            "fallbacks": self.fallbacks,
+            "latency": {
+                route: {
+                    "ttft": self.ttft[route].get_stats(),
+                    "total": self.total[route].get_stats(),
+                }
+                for route in (CONVERSATIONAL, CODING)
+            },
+        }
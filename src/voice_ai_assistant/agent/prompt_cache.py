@@ -0,0 +1,171 @@
+"""Anthropic prompt caching for the agent's stable prompt prefix.
+
+Every agent turn sends the same long system prompt and tool schema. With
+cache breakpoints on the last tool definition and on the system prompt,
+Anthropic serves that prefix from its prompt cache on later turns, which
+lowers both time-to-first-token and input token cost. The conversation
+summary, which changes rarely, gets its own breakpoint after the stable
+system prompt so a new summary does not invalidate the rest.
+
+Caching only applies once the cached prefix reaches the model's minimum
+cacheable length; below it the breakpoints are ignored by the API.
+"""
+
+import logging
+import statistics
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from strands.models.anthropic import AnthropicModel
+
+logger = logging.getLogger(__name__)
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+class CachingAnthropicModel(AnthropicModel):
+    """AnthropicModel that marks the tools and system prompt for caching."""
+
+    def __init__(
+        self,
+        *args: Any,
+        stable_system_prompt: Optional[str] = None,
+        cache_summary: bool = True,
+        **kwargs: Any,
+    ):
+        """Initialize caching model.
+
+        Args:
+            stable_system_prompt: Part of the system prompt that never
+                changes; anything appended to it (the conversation summary)
+                is cached separately
+            cache_summary: Also place a breakpoint after the appended part
+            *args, **kwargs: Passed to AnthropicModel
+        """
+        super().__init__(*args, **kwargs)
+        self.stable_system_prompt = stable_system_prompt
+        self.cache_summary = cache_summary
+
+    def format_request(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Build the Anthropic request with cache breakpoints."""
+        request = super().format_request(*args, **kwargs)
+
+        tools = request.get("tools")
+        if tools:
+            # Tools come first in the prompt; one breakpoint covers all of them
+            tools[-1] = {**tools[-1], "cache_control": CACHE_CONTROL}
+
+        system = request.get("system")
+        if isinstance(system, str) and system:
+            request["system"] = self._system_blocks(system)
+        return request
+
+    def format_chunk(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a stream event, keeping the cache token counts of the usage."""
+        chunk = super().format_chunk(event)
+        if event.get("type") == "metadata":
+            api_usage = event.get("usage") or {}
+            usage = chunk.get("metadata", {}).get("usage")
+            if usage is not None:
+                usage["cacheReadInputTokens"] = (
+                    api_usage.get("cache_read_input_tokens") or 0
+                )
+                usage["cacheWriteInputTokens"] = (
+                    api_usage.get("cache_creation_input_tokens") or 0
+                )
+        return chunk
+
+    def _system_blocks(self, system: str) -> List[Dict[str, Any]]:
+        """Split the system prompt into cacheable text blocks."""
+        stable = self.stable_system_prompt
+        if not stable or not system.startswith(stable) or len(system) == len(stable):
+            return [{"type": "text", "text": system, "cache_control": CACHE_CONTROL}]
+
+        rest = {"type": "text", "text": system[len(stable) :]}
+        if self.cache_summary:
+            rest["cache_control"] = CACHE_CONTROL
+        return [{"type": "text", "text": stable, "cache_control": CACHE_CONTROL}, rest]
+
+
+@dataclass
+class TurnUsage:
+    """Token usage and latency of one agent turn (all its model calls)."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    model_calls: int = 0
+    ttft_ms: Optional[float] = None
+
+    def add(self, usage: Dict[str, Any]) -> None:
+        """Add the usage reported at the end of one model call."""
+        self.model_calls += 1
+        self.input_tokens += usage.get("inputTokens", 0) or 0
+        self.output_tokens += usage.get("outputTokens", 0) or 0
+        self.cache_read_tokens += usage.get("cacheReadInputTokens", 0) or 0
+        self.cache_write_tokens += usage.get("cacheWriteInputTokens", 0) or 0
+
+
+class PromptCacheStats:
+    """Per-turn cache token counts and time-to-first-token."""
+
+    def __init__(self, max_turns: int = 100):
+        """Initialize stats.
+
+        Args:
+            max_turns: Number of recent turns kept for averages
+        """
+        self.turns: deque = deque(maxlen=max_turns)
+        self.total_turns = 0
+        self.total_cache_read_tokens = 0
+        self.total_cache_write_tokens = 0
+        self.total_input_tokens = 0
+
+    def record(self, turn: TurnUsage) -> None:
+        """Record a finished turn."""
+        self.turns.append(turn)
+        self.total_turns += 1
+        self.total_cache_read_tokens += turn.cache_read_tokens
+        self.total_cache_write_tokens += turn.cache_write_tokens
+        self.total_input_tokens += turn.input_tokens
+        logger.debug(
+            f"Agent turn: ttft={turn.ttft_ms}ms input={turn.input_tokens} "
+            f"cache_read={turn.cache_read_tokens} cache_write={turn.cache_write_tokens}"
+        )
+
+    @staticmethod
+    def _avg_ttft(turns: List[TurnUsage]) -> float:
+        samples = [turn.ttft_ms for turn in turns if turn.ttft_ms is not None]
+        return statistics.mean(samples) if samples else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get caching statistics.
+
+        Returns:
+            Dictionary of token totals, the share of input served from the
+            cache, and TTFT of turns with and without cache reads
+        """
+        cached = [turn for turn in self.turns if turn.cache_read_tokens]
+        uncached = [turn for turn in self.turns if not turn.cache_read_tokens]
+        prompt_tokens = (
+            self.total_input_tokens
+            + self.total_cache_read_tokens
+            + self.total_cache_write_tokens
+        )
+        last = self.turns[-1] if self.turns else None
+        return {
+            "turns": self.total_turns,
+            "cache_hit_turns": len(cached),
+            "cache_read_tokens": self.total_cache_read_tokens,
+            "cache_write_tokens": self.total_cache_write_tokens,
+            "uncached_input_tokens": self.total_input_tokens,
+            "cache_read_ratio": (
+                self.total_cache_read_tokens / prompt_tokens if prompt_tokens else 0.0
+            ),
+            "avg_ttft_ms": self._avg_ttft(list(self.turns)),
+            "avg_ttft_ms_cached": self._avg_ttft(cached),
+            "avg_ttft_ms_uncached": self._avg_ttft(uncached),
+            "last_turn": last.__dict__ if last else None,
+        }
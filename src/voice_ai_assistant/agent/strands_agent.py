@@ -4,16 +4,58 @@ This module implements the main agent that orchestrates the conversation
 and leverages the Claude Code tool for coding tasks.
 """
 
+import asyncio
 import logging
 import os
-from typing import AsyncGenerator, Optional, Callable, Awaitable
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Callable, Awaitable
 
 from strands import Agent
 from strands.models.anthropic import AnthropicModel
 from .tools import ClaudeCodeTool
+from .conversation_memory import ConversationMemory
+from .prompt_cache import CachingAnthropicModel, PromptCacheStats, TurnUsage
+from .model_router import CODING, CONVERSATIONAL, TurnRouter
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = (
+    "You are a Voice-Enabled AI Coding Assistant. "
+    "Your goal is to help developers by analyzing code and answering questions. "
+    "You have access to a powerful coding tool called 'run_coding_task' which uses Claude Code. "
+    "ALWAYS use 'run_coding_task' for any request involving reading files, searching code, "
+    "or understanding the repository structure. "
+    "Do not try to hallucinate code content. "
+    "\n\n"
+    "CRITICAL: Your responses will be converted to speech. "
+    "DO NOT use markdown formatting (no **, ##, -, *, etc.). "
+    "Use plain conversational text only. "
+    "Keep your voice responses concise and natural. "
+    "When summarizing results, speak naturally as if talking to someone. "
+    "If the user asks to do something, briefly confirm you are doing it, call the tool, "
+    "and then provide a concise spoken summary of the result."
+)
+
+SUMMARY_PROMPT = (
+    "You maintain the memory of a spoken conversation between a developer and a coding assistant. "
+    "Merge the previous summary and the new transcript into one short summary in plain text. "
+    "Keep repository names, file paths, decisions, open questions and results of coding tasks. "
+    "Drop greetings and small talk. Answer with the summary only."
+)
+
+FAST_SYSTEM_PROMPT = (
+    "You are the voice of a coding assistant, handling small talk and follow-up questions. "
+    "Answer from the conversation so far in one or two short spoken sentences. "
+    "Your responses will be converted to speech: plain conversational text only, no markdown. "
+    "You cannot see the repository in this mode; if the user wants code looked at or changed, "
+    "ask them to say what they want done."
+)
+
+# Recent messages given to the conversational path as context
+FAST_CONTEXT_MESSAGES = 12
+FAST_MAX_TOKENS = 300
+
+
 class StrandsAgent:
     """Intelligent agent using Strands framework."""
     
@@ -21,7 +63,15 @@ class StrandsAgent:
         self, 
         model: str = "claude-haiku-4-5-20251001",
         repository_path: Optional[str] = None,
-        status_callback: Optional[Callable[[str], Awaitable[None]]] = None
+        status_callback: Optional[Callable[[str], Awaitable[None]]] = None,
+        activity_callback: Optional[Callable[[bool], Awaitable[None]]] = None,
+        coding_task_timeout_s: Optional[float] = None,
+        max_coding_clients: int = 4,
+        coding_client_idle_timeout_s: float = 300.0,
+        memory_window_turns: Optional[int] = 10,
+        prompt_caching: bool = True,
+        route_turns: bool = True,
+        fast_model: Optional[str] = None
     ):
         """Initialize Strands agent.
         
@@ -29,6 +79,20 @@ class StrandsAgent:
             model: Model identifier to use.
             repository_path: Base path to repositories for Claude Code.
             status_callback: Async callback for streaming status updates.
+            activity_callback: Async callback told when a coding task starts
+                (True) and returns (False).
+            coding_task_timeout_s: Deadline for a single Claude Code task.
+            max_coding_clients: Claude Code clients, i.e. coding tasks that
+                can run in parallel across sessions.
+            coding_client_idle_timeout_s: Idle Claude Code clients are closed
+                after this long.
+            memory_window_turns: Turns kept verbatim in the agent's history;
+                older turns are summarized (None keeps the full history).
+            prompt_caching: Mark the system prompt, tool schema and summary
+                for Anthropic prompt caching.
+            route_turns: Answer conversational turns with a tool-less model
+                call instead of the coding agent.
+            fast_model: Model for conversational turns (defaults to model).
         """
         self.model_name = model
         self.repository_path = repository_path
@@ -37,9 +101,33 @@ class StrandsAgent:
         # Initialize Claude Code tool with repository path and status callback
         self.claude_tool = ClaudeCodeTool(
             repository_path=self.repository_path,
-            status_callback=self.status_callback
+            status_callback=self.status_callback,
+            activity_callback=activity_callback,
+            task_timeout_s=coding_task_timeout_s,
+            max_clients=max_coding_clients,
+            idle_timeout_s=coding_client_idle_timeout_s
         )
         self.agent: Optional[Agent] = None
+        self._model: Optional[AnthropicModel] = None
+        self._active_runs = 0
+        # Messages removed from the front of the history by compaction, so
+        # history positions stay valid across a compaction
+        self._compacted_messages = 0
+        self.prompt_caching = prompt_caching
+        self.cache_stats = PromptCacheStats()
+
+        # Small talk and clarifications skip the coding agent
+        self.router: Optional[TurnRouter] = TurnRouter() if route_turns else None
+        self.fast_model_name = fast_model or model
+        self._fast_model: Optional[AnthropicModel] = None
+
+        # Older turns are folded into a summary in the background
+        self.memory: Optional[ConversationMemory] = None
+        if memory_window_turns:
+            self.memory = ConversationMemory(
+                summarize=self._summarize,
+                window_turns=memory_window_turns
+            )
         
     async def start(self) -> None:
         """Start the agent and its tools."""
@@ -52,44 +140,75 @@ class StrandsAgent:
         if not api_key:
             raise ValueError("CLAUDE_API_KEY or ANTHROPIC_API_KEY environment variable must be set")
         
-        anthropic_model = AnthropicModel(
-            client_args={"api_key": api_key},
-            model_id=self.model_name,
-            max_tokens=4096
-        )
+        model_args = dict(client_args={"api_key": api_key}, model_id=self.model_name, max_tokens=4096)
+        if self.prompt_caching:
+            self._model = CachingAnthropicModel(stable_system_prompt=SYSTEM_PROMPT, **model_args)
+        else:
+            self._model = AnthropicModel(**model_args)
+        if self.router:
+            self._fast_model = AnthropicModel(
+                client_args={"api_key": api_key}, model_id=self.fast_model_name, max_tokens=FAST_MAX_TOKENS
+            )
         
         self.agent = Agent(
-            model=anthropic_model,
+            model=self._model,
             tools=[self.claude_tool.run_coding_task],
-            system_prompt=(
-                "You are a Voice-Enabled AI Coding Assistant. "
-                "Your goal is to help developers by analyzing code and answering questions. "
-                "You have access to a powerful coding tool called 'run_coding_task' which uses Claude Code. "
-                "ALWAYS use 'run_coding_task' for any request involving reading files, searching code, "
-                "or understanding the repository structure. "
-                "Do not try to hallucinate code content. "
-                "\n\n"
-                "CRITICAL: Your responses will be converted to speech. "
-                "DO NOT use markdown formatting (no **, ##, -, *, etc.). "
-                "Use plain conversational text only. "
-                "Keep your voice responses concise and natural. "
-                "When summarizing results, speak naturally as if talking to someone. "
-                "If the user asks to do something, briefly confirm you are doing it, call the tool, "
-                "and then provide a concise spoken summary of the result."
-            )
+            system_prompt=SYSTEM_PROMPT
         )
         logger.info("Strands Agent started")
         
     async def stop(self) -> None:
         """Stop the agent and cleanup."""
+        if self.memory:
+            await self.memory.close()
         await self.claude_tool.stop()
         logger.info("Strands Agent stopped")
         
-    async def process_message(self, text: str) -> AsyncGenerator[str, None]:
+    async def cancel_coding_tasks(self, session_id: Optional[str] = None) -> int:
+        """Stop Claude Code work whose result will not be used.
+
+        Args:
+            session_id: Only stop this session's tasks (None for all)
+
+        Returns:
+            Number of coding tasks cancelled
+        """
+        return await self.claude_tool.cancel(session_id)
+
+    def history_length(self) -> int:
+        """Get the position of the end of the agent's conversation history.
+
+        Counts messages since the start of the conversation, including
+        those already compacted into the summary, so a position taken
+        before a run is still valid if the run applies a compaction.
+        """
+        if not self.agent:
+            return 0
+        return self._compacted_messages + len(self.agent.messages)
+
+    def truncate_history(self, length: int) -> None:
+        """Roll the conversation history back to a previous length.
+
+        Used to forget an abandoned (e.g. speculative) run.
+
+        Args:
+            length: History length returned by history_length()
+        """
+        keep = max(length - self._compacted_messages, 0)
+        if self.agent and len(self.agent.messages) > keep:
+            del self.agent.messages[keep:]
+
+    async def process_message(
+        self,
+        text: str,
+        tool_gate: Optional[asyncio.Event] = None
+    ) -> AsyncGenerator[str, None]:
         """Process a user message and stream the response.
 
         Args:
             text: User input text.
+            tool_gate: If given, the stream pauses at the first tool use
+                until the event is set, so no tool runs before then.
 
         Yields:
             Chunks of the agent's response text.
@@ -99,27 +218,147 @@ class StrandsAgent:
 
         logger.info(f"Processing message: {text}")
 
+        route = CODING
+        if self.router:
+            route = self.router.classify(text, self._last_reply()).route
+
+        if self._active_runs == 0:
+            self._apply_memory()
+        self._active_runs += 1
+        if self.memory:
+            self.memory.record_turn(self.agent.messages)
+        turn = TurnUsage()
+        started_at = time.monotonic()
+
         try:
-            # Use Strands Agent stream_async method
-            # This returns an async generator yielding chunks
-            async for chunk in self.agent.stream_async(text):
-                # Filter out event dictionaries and metadata
-                # Only process actual text content
-                if isinstance(chunk, dict):
-                    # Check if it's a data chunk with text
-                    if 'data' in chunk and isinstance(chunk['data'], str):
-                        yield chunk['data']
-                    # Skip event metadata chunks
-                    elif 'event' in chunk:
-                        continue
-                    # Skip other metadata
-                    else:
-                        continue
-                elif hasattr(chunk, 'text') and chunk.text:
-                    yield chunk.text
-                elif isinstance(chunk, str):
+            if route == CONVERSATIONAL:
+                context = self._text_history()
+                context_length = len(context)
+                fast_agent = Agent(
+                    model=self._fast_model,
+                    system_prompt=self._fast_system_prompt(),
+                    messages=context,
+                    callback_handler=None
+                )
+                replied = False
+                try:
+                    async for chunk in self._stream(fast_agent, text, turn, started_at):
+                        replied = True
+                        yield chunk
+                except Exception as e:
+                    if replied:
+                        raise
+                    # Nothing was said yet; the coding agent answers instead
+                    logger.warning(f"Conversational path failed, using the coding agent: {e}")
+                    self.router.record_fallback()
+                    route = CODING
+                else:
+                    # Keep the exchange in the coding agent's history, unless
+                    # another run is using it
+                    if self._active_runs == 1:
+                        self.agent.messages.extend(fast_agent.messages[context_length:])
+
+            if route == CODING:
+                async for chunk in self._stream(self.agent, text, turn, started_at, tool_gate):
                     yield chunk
 
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
             yield f"I encountered an error: {str(e)}"
+        finally:
+            if route == CODING:
+                self.cache_stats.record(turn)
+            if self.router:
+                self.router.record_latency(route, turn.ttft_ms, (time.monotonic() - started_at) * 1000)
+            self._active_runs -= 1
+            if self.memory and self._active_runs == 0:
+                self.memory.maybe_compact(self.agent.messages)
+
+    async def _stream(
+        self,
+        agent: Agent,
+        text: str,
+        turn: TurnUsage,
+        started_at: float,
+        tool_gate: Optional[asyncio.Event] = None
+    ) -> AsyncGenerator[str, None]:
+        """Stream the text of one agent run, recording its usage in turn."""
+        # Use Strands Agent stream_async method
+        # This returns an async generator yielding chunks
+        async for chunk in agent.stream_async(text):
+            # Filter out event dictionaries and metadata
+            # Only process actual text content
+            if isinstance(chunk, dict):
+                # Tools execute after the model turn; not pulling the
+                # stream holds them back until the gate opens
+                if tool_gate is not None and 'current_tool_use' in chunk and not tool_gate.is_set():
+                    await tool_gate.wait()
+                # Check if it's a data chunk with text
+                if 'data' in chunk and isinstance(chunk['data'], str):
+                    if turn.ttft_ms is None:
+                        turn.ttft_ms = (time.monotonic() - started_at) * 1000
+                    yield chunk['data']
+                # Token usage (incl. cache reads/writes) of each model call
+                elif 'event' in chunk:
+                    metadata = chunk['event'].get('metadata') if isinstance(chunk['event'], dict) else None
+                    if metadata and 'usage' in metadata:
+                        turn.add(metadata['usage'])
+                # Skip other metadata
+                else:
+                    continue
+            elif hasattr(chunk, 'text') and chunk.text:
+                yield chunk.text
+            elif isinstance(chunk, str):
+                yield chunk
+
+    def _last_reply(self) -> Optional[str]:
+        """Text of the agent's most recent reply."""
+        for message in reversed(self.agent.messages):
+            if message.get("role") == "assistant":
+                text = _text_of(message)
+                if text:
+                    return text
+        return None
+
+    def _text_history(self) -> List[Dict[str, Any]]:
+        """Recent conversation as plain text messages (no tool blocks)."""
+        history: List[Dict[str, Any]] = []
+        for message in self.agent.messages[-FAST_CONTEXT_MESSAGES:]:
+            text = _text_of(message)
+            if not text:
+                continue
+            role = message.get("role")
+            if history and history[-1]["role"] == role:
+                history[-1]["content"][0]["text"] += f"\n{text}"
+            elif history or role == "user":
+                history.append({"role": role, "content": [{"text": text}]})
+        return history
+
+    def _fast_system_prompt(self) -> str:
+        """Conversational prompt, with the conversation summary if any."""
+        if self.memory and self.memory.summary:
+            return f"{FAST_SYSTEM_PROMPT}\n\nSummary of the earlier conversation:\n{self.memory.summary}"
+        return FAST_SYSTEM_PROMPT
+
+    def _apply_memory(self) -> None:
+        """Swap in a finished conversation summary (agent must be idle)."""
+        length = len(self.agent.messages)
+        if not self.memory or not self.memory.apply(self.agent.messages):
+            return
+        self._compacted_messages += length - len(self.agent.messages)
+        self.agent.system_prompt = (
+            f"{SYSTEM_PROMPT}\n\nSummary of the earlier conversation:\n{self.memory.summary}"
+        )
+
+    async def _summarize(self, previous_summary: str, transcript: str) -> str:
+        """Summarize older turns with a tool-less agent on the same model."""
+        summarizer = Agent(model=self._model, system_prompt=SUMMARY_PROMPT, callback_handler=None)
+        result = await summarizer.invoke_async(
+            f"Previous summary:\n{previous_summary or '(none)'}\n\nNew transcript:\n{transcript}"
+        )
+        return str(result)
+
+
+def _text_of(message: Dict[str, Any]) -> str:
+    """Text blocks of a Strands message joined together."""
+    return " ".join(block["text"] for block in message.get("content", []) if "text" in block).strip()
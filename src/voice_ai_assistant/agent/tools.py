@@ -5,52 +5,120 @@ with the Claude Code SDK for repository operations.
 """
 
 import logging
-from typing import Optional, Any, Dict, List
+import os
+import time
+from typing import Optional, Any, Dict, List, Callable, Awaitable
 import asyncio
 
 # Assuming strands package structure based on docs
 from strands import tool
 
-from claude_agent_sdk import ClaudeSDKClient, AssistantMessage, TextBlock
+from claude_agent_sdk import ClaudeSDKClient, AssistantMessage, TextBlock, ToolUseBlock
 from ..code.repository_manager import RepositoryManager, RepositoryConfig
+from .claude_client_pool import ClaudeClientPool, current_session_id
 
 logger = logging.getLogger(__name__)
 
+
+def describe_tool_use(name: str, tool_input: Dict[str, Any]) -> Optional[str]:
+    """Turn a Claude Code tool use into a short spoken status.
+
+    Args:
+        name: Claude Code tool name (e.g. "Read")
+        tool_input: Tool arguments
+
+    Returns:
+        Status text, or None for tools not worth announcing
+    """
+    path = tool_input.get("file_path") or tool_input.get("path") or ""
+    file_name = os.path.basename(str(path).rstrip("/\\")) if path else ""
+
+    if name == "Read":
+        return f"Reading {file_name}." if file_name else "Reading a file."
+    if name in ("Edit", "MultiEdit", "Write"):
+        return f"Editing {file_name}." if file_name else "Editing a file."
+    if name in ("Grep", "Glob"):
+        return "Searching the code."
+    if name == "LS":
+        return "Listing files."
+    if name == "Bash":
+        return "Running a command."
+    return None
+
+
 class ClaudeCodeTool:
     """Wrapper for Claude Code SDK to be used as a Strands tool.
     
-    This class manages the Claude SDK client session and exposes
-    a tool method that Strands agents can call.
+    This class manages a pool of Claude SDK client sessions and exposes
+    a tool method that Strands agents can call. Coding tasks of different
+    voice sessions run on separate clients in parallel.
     """
     
-    def __init__(self, repository_path: Optional[str] = None, status_callback: Optional[Any] = None):
+    def __init__(
+        self,
+        repository_path: Optional[str] = None,
+        status_callback: Optional[Any] = None,
+        activity_callback: Optional[Callable[[bool], Awaitable[None]]] = None,
+        task_timeout_s: Optional[float] = None,
+        interrupt_timeout_s: float = 5.0,
+        max_clients: int = 4,
+        idle_timeout_s: float = 300.0
+    ):
         """Initialize Claude Code tool.
         
         Args:
             repository_path: Path to the repository to operate on.
             status_callback: Optional async callback for streaming status updates.
+            activity_callback: Optional async callback called with True when a
+                coding task starts and False when it returns.
+            task_timeout_s: Deadline for a single coding task (None for no limit).
+            interrupt_timeout_s: Time Claude Code gets to acknowledge an
+                interrupt before the client is restarted.
+            max_clients: Maximum number of Claude Code clients (coding tasks
+                running in parallel).
+            idle_timeout_s: Clients unused for longer are closed.
         """
         self.repo_manager = RepositoryManager(repository_path)
         self.options = self.repo_manager.get_options()
-        self.client: Optional[ClaudeSDKClient] = None
-        self._lock = asyncio.Lock()
+        self.pool = ClaudeClientPool(
+            client_factory=lambda: ClaudeSDKClient(options=self.options),
+            max_clients=max_clients,
+            idle_timeout_s=idle_timeout_s
+        )
+        self._started = False
         self.status_callback = status_callback
+        self.activity_callback = activity_callback
+        self.task_timeout_s = task_timeout_s
+        self.interrupt_timeout_s = interrupt_timeout_s
+
+        # Queries in progress (running or waiting for a client) -> session
+        self._queries: Dict[asyncio.Task, Optional[str]] = {}
+
+        # Statistics
+        self.tasks_started = 0
+        self.tasks_completed = 0
+        self.tasks_cancelled = 0
+        self.tasks_timed_out = 0
+        self.client_restarts = 0
+        self.reclaimed_seconds = 0.0
+        self._completed_seconds = 0.0
+        self._cancel_ms_total = 0.0
         
     async def start(self) -> None:
-        """Start the Claude Code SDK client session."""
-        if self.client:
+        """Start the Claude Code SDK client pool."""
+        if self._started:
             return
-            
-        self.client = ClaudeSDKClient(options=self.options)
-        await self.client.__aenter__()
-        logger.info("Claude Code SDK client started")
+
+        await self.pool.start()
+        self._started = True
+        logger.info("Claude Code SDK client pool started")
         
     async def stop(self) -> None:
-        """Stop the Claude Code SDK client session."""
-        if self.client:
-            await self.client.__aexit__(None, None, None)
-            self.client = None
-            logger.info("Claude Code SDK client stopped")
+        """Stop the Claude Code SDK client pool."""
+        if self._started:
+            await self.pool.close()
+            self._started = False
+            logger.info("Claude Code SDK client pool stopped")
 
     @tool
     async def run_coding_task(self, task_description: str) -> str:
@@ -65,33 +133,193 @@ class ClaudeCodeTool:
         Returns:
             The result of the operation as a string.
         """
-        if not self.client:
+        return await self.execute_task(task_description)
+
+    async def execute_task(self, task_description: str) -> str:
+        """Run a coding task for the current session.
+
+        Shared by the Strands tool and direct callers (Gemini function
+        calls). Cancelling the caller interrupts the task in Claude Code.
+
+        Args:
+            task_description: What Claude Code should do.
+
+        Returns:
+            The result of the operation as a string.
+        """
+        if not self._started:
             await self.start()
             
-        if not self.client:
+        if not self._started:
             return "Error: Claude Code client could not be started."
 
-        logger.info(f"Running coding task: {task_description}")
-        
-        response_text = []
-        
+        session_id = current_session_id.get()
+        logger.info(f"Running coding task for session {session_id}: {task_description}")
+        self.tasks_started += 1
+        started_at = time.monotonic()
+
+        await self._notify_activity(True)
+        # The query runs as its own task so cancel() can stop it while the
+        # agent's tool call returns normally
+        query = asyncio.create_task(self._run_query(task_description, session_id))
+        self._queries[query] = session_id
         try:
-            async with self._lock:
+            done, _ = await asyncio.wait({query}, timeout=self.task_timeout_s)
+            if not done:
+                self.tasks_timed_out += 1
+                logger.warning(f"Coding task exceeded {self.task_timeout_s}s, stopping it")
+                await self._cancel_query(query)
+                return f"Error: the task did not finish within {self.task_timeout_s:.0f} seconds and was stopped."
+
+            if query.cancelled():
+                self._record_cancelled(started_at)
+                return "The task was cancelled."
+
+            result = query.result()
+            self.tasks_completed += 1
+            self._completed_seconds += time.monotonic() - started_at
+            return result if result else "Task completed with no output."
+
+        except asyncio.CancelledError:
+            # The turn that asked for this task was abandoned
+            await self._cancel_query(query)
+            self._record_cancelled(started_at)
+            raise
+        except Exception as e:
+            logger.error(f"Error running coding task: {e}")
+            return f"Error executing task: {str(e)}"
+        finally:
+            self._queries.pop(query, None)
+            await self._notify_activity(False)
+
+    async def cancel(self, session_id: Optional[str] = None) -> int:
+        """Cancel running and queued coding tasks.
+
+        Each running query is interrupted in Claude Code; the call returns
+        once its client is free again.
+
+        Args:
+            session_id: Only cancel this session's tasks (None for all)
+
+        Returns:
+            Number of tasks cancelled
+        """
+        queries = [
+            query for query, query_session in self._queries.items()
+            if not query.done() and (session_id is None or query_session == session_id)
+        ]
+        for query in queries:
+            query.cancel()
+        if queries:
+            await asyncio.wait(queries)
+            logger.info(f"Cancelled {len(queries)} coding task(s)")
+        return len(queries)
+
+    async def _run_query(self, task_description: str, session_id: Optional[str]) -> str:
+        """Send one query to the session's Claude Code client and collect its text response."""
+        response_text = []
+
+        async with self.pool.acquire(session_id) as worker:
+            client = worker.client
+            try:
                 # Send query to Claude Code
-                await self.client.query(task_description)
-                
+                await client.query(task_description)
+
                 # Process streamed response (collect but don't stream to callback)
-                async for msg in self.client.receive_response():
+                async for msg in client.receive_response():
                     if isinstance(msg, AssistantMessage):
                         for block in msg.content:
                             if isinstance(block, TextBlock):
                                 text = block.text
                                 response_text.append(text)
                                 # Don't stream individual chunks - let agent summarize
-                                
-            result = "".join(response_text)
-            return result if result else "Task completed with no output."
-            
+                            elif isinstance(block, ToolUseBlock):
+                                # Short progress note, e.g. "Reading main.py."
+                                await self._notify_status(describe_tool_use(block.name, block.input or {}))
+            except asyncio.CancelledError:
+                # Stop Claude Code before returning the client to the pool
+                cancelled_at = time.monotonic()
+                if not await self._interrupt_client(client):
+                    worker.healthy = False
+                self._cancel_ms_total += (time.monotonic() - cancelled_at) * 1000
+                raise
+            except Exception:
+                # The client may be mid-response; do not reuse it
+                worker.healthy = False
+                raise
+
+        return "".join(response_text)
+
+    async def _cancel_query(self, query: asyncio.Task) -> None:
+        """Cancel a query and wait until it has returned its client."""
+        query.cancel()
+        await asyncio.wait({query})
+
+    async def _interrupt_client(self, client: ClaudeSDKClient) -> bool:
+        """Interrupt the running query and drain what is left of its response.
+
+        Returns:
+            True if the client is ready for the next query, False if Claude
+            Code did not stop within interrupt_timeout_s and the client
+            must be replaced
+        """
+        async def interrupt_and_drain() -> None:
+            await client.interrupt()
+            # The response ends with the result of the interrupted query
+            async for _ in client.receive_response():
+                pass
+
+        try:
+            await asyncio.wait_for(interrupt_and_drain(), timeout=self.interrupt_timeout_s)
+            return True
         except Exception as e:
-            logger.error(f"Error running coding task: {e}")
-            return f"Error executing task: {str(e)}"
+            logger.warning(f"Claude Code did not stop cleanly ({e!r}), replacing client")
+            self.client_restarts += 1
+            return False
+
+    def _record_cancelled(self, started_at: float) -> None:
+        """Count a cancelled task and estimate the Claude Code time it saved."""
+        self.tasks_cancelled += 1
+        if self.tasks_completed:
+            average_s = self._completed_seconds / self.tasks_completed
+            self.reclaimed_seconds += max(0.0, average_s - (time.monotonic() - started_at))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coding task statistics.
+
+        Returns:
+            Dictionary of task counters; reclaimed_seconds estimates the
+            Claude Code time saved by cancellation from the average
+            duration of completed tasks
+        """
+        stopped = self.tasks_cancelled + self.tasks_timed_out
+        return {
+            'tasks_started': self.tasks_started,
+            'tasks_completed': self.tasks_completed,
+            'tasks_cancelled': self.tasks_cancelled,
+            'tasks_timed_out': self.tasks_timed_out,
+            'client_restarts': self.client_restarts,
+            'reclaimed_seconds': self.reclaimed_seconds,
+            'avg_task_seconds': self._completed_seconds / self.tasks_completed if self.tasks_completed else 0.0,
+            'avg_cancel_ms': self._cancel_ms_total / stopped if stopped else 0.0,
+            'active_tasks': len(self._queries),
+            'pool': self.pool.get_stats(),
+        }
+
+    async def _notify_status(self, text: Optional[str]) -> None:
+        """Send a status update to the status callback, if any."""
+        if not text or not self.status_callback:
+            return
+        try:
+            await self.status_callback(text)
+        except Exception as e:
+            logger.error(f"Error in status callback: {e}")
+
+    async def _notify_activity(self, active: bool) -> None:
+        """Report coding task start/end to the activity callback, if any."""
+        if not self.activity_callback:
+            return
+        try:
+            await self.activity_callback(active)
+        except Exception as e:
+            logger.error(f"Error in activity callback: {e}")
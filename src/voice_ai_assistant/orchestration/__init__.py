@@ -9,6 +9,10 @@ from .orchestrator_config import OrchestratorConfig
 from .orchestration_session import OrchestrationSession
 from .flow_manager import ConversationFlowManager, ConversationState
 from .pipeline import StreamingPipelineManager
+from .transcript_assembler import TranscriptAssembler
+from .tts_pipeline import TTSSynthesisPipeline
+from .text_segmenter import SentenceSegmenter
+from .local_intents import LocalIntentRecognizer
 
 __all__ = [
     'VoiceOrchestrator',
@@ -16,5 +20,9 @@ __all__ = [
     'OrchestrationSession',
     'ConversationFlowManager',
     'ConversationState',
-    'StreamingPipelineManager'
+    'StreamingPipelineManager',
+    'TranscriptAssembler',
+    'TTSSynthesisPipeline',
+    'SentenceSegmenter',
+    'LocalIntentRecognizer'
 ]
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""Echo-aware confirmation of local barge-in.
+
+While the assistant speaks, the microphone also hears the speaker, so a
+VAD onset alone does not mean the user is talking: the assistant's own
+voice, a cough or a door would cut every response short. BargeInGate
+turns an onset into a candidate and confirms it only once speech has
+lasted long enough at a level the playback cannot explain. Echo reaches
+the microphone well below the level played, so requiring the microphone
+to come within a margin of the playback level rejects it without an
+echo canceller.
+
+Confirmation takes a few hundred milliseconds, so the orchestrator ducks
+playback at the onset: the assistant audibly yields within one output
+block, and full volume returns if the candidate is rejected. The
+reference playback level is taken at the onset, before ducking, so the
+quieter playback does not lower the bar for the echo still in flight.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def level_db(audio: bytes) -> float:
+    """RMS level of 16-bit PCM audio in dBFS (-100 for silence)."""
+    samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32)
+    if not len(samples):
+        return -100.0
+    power = float(np.mean(samples * samples)) / (32768.0 * 32768.0)
+    return 10.0 * float(np.log10(power + 1e-10))
+
+
+class BargeInGate:
+    """Confirms VAD onsets during playback as real user speech."""
+
+    def __init__(self, min_speech_ms: float = 250.0, level_offset_db: float = -10.0):
+        """Initialize gate.
+
+        Args:
+            min_speech_ms: Speech above the echo threshold needed before
+                the response is interrupted
+            level_offset_db: Microphone chunks count as user speech when
+                their level is at least the playback level plus this
+                offset
+        """
+        self.min_speech_ms = min_speech_ms
+        self.level_offset_db = level_offset_db
+
+        self._onset_at: Optional[float] = None
+        self._threshold_db = 0.0
+        self._speech_ms = 0.0
+
+        # Statistics
+        self.confirmed = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> bool:
+        """Whether an onset is waiting for confirmation."""
+        return self._onset_at is not None
+
+    def start(self, detected_at: float, output_level_db: float) -> None:
+        """Open a candidate at a VAD speech onset.
+
+        Args:
+            detected_at: Monotonic time of the onset
+            output_level_db: Level played by the speaker at the onset
+        """
+        if self._onset_at is None:
+            self._onset_at = detected_at
+            self._threshold_db = output_level_db + self.level_offset_db
+            self._speech_ms = 0.0
+
+    def cancel(self) -> None:
+        """Drop the candidate (playback ended or speech stopped)."""
+        if self._onset_at is not None:
+            self.rejected += 1
+            self._onset_at = None
+
+    def update(
+        self, mic_level_db: float, chunk_ms: float, speech_active: bool
+    ) -> Optional[float]:
+        """Feed one microphone chunk that followed the onset.
+
+        Args:
+            mic_level_db: Level of the chunk
+            chunk_ms: Duration of the chunk
+            speech_active: Whether VAD still considers the user speaking
+
+        Returns:
+            Time of the onset once the barge-in is confirmed, else None
+        """
+        if self._onset_at is None:
+            return None
+        if not speech_active:
+            logger.debug("Barge-in candidate ended before confirmation")
+            self.cancel()
+            return None
+
+        if mic_level_db >= self._threshold_db:
+            self._speech_ms += chunk_ms
+        if self._speech_ms < self.min_speech_ms:
+            return None
+
+        onset_at = self._onset_at
+        self._onset_at = None
+        self.confirmed += 1
+        return onset_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get gate statistics.
+
+        Returns:
+            Dictionary with confirmed and rejected barge-in candidates
+        """
+        return {
+            "confirmed": self.confirmed,
+            "rejected": self.rejected,
+        }
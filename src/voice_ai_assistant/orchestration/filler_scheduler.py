@@ -0,0 +1,166 @@
+"""Progress audio while long tool calls run.
+
+A coding task can keep Claude Code busy for many seconds, and without
+feedback the user hears nothing. The filler scheduler watches tool
+calls; once one runs longer than a threshold it speaks progress at a
+controlled interval. It prefers the latest status derived from the tool
+(e.g. "Reading main.py") and otherwise plays a pre-synthesized filler
+phrase. Everything stops as soon as the tool returns.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FILLER_PHRASES = ("working", "still_working", "almost_done")
+
+
+class FillerScheduler:
+    """Schedules filler and status audio during tool calls."""
+
+    def __init__(
+        self,
+        play_phrase: Callable[[str], Awaitable[Any]],
+        speak_text: Callable[[str], Awaitable[Any]],
+        queued_ms: Optional[Callable[[], float]] = None,
+        first_delay_s: float = 2.5,
+        interval_s: float = 6.0,
+        max_status_age_s: float = 10.0,
+        phrases: Sequence[str] = DEFAULT_FILLER_PHRASES,
+    ):
+        """Initialize filler scheduler.
+
+        Args:
+            play_phrase: Plays a phrase bank entry by name
+            speak_text: Synthesizes and plays arbitrary status text
+            queued_ms: Returns the audio still queued for playback; fillers
+                wait until the speaker is free
+            first_delay_s: Tool runtime before the first progress audio
+            interval_s: Minimum time between progress audio
+            max_status_age_s: Status updates older than this are not spoken
+            phrases: Filler phrase names, used in order (the last repeats)
+        """
+        self._play_phrase = play_phrase
+        self._speak_text = speak_text
+        self._queued_ms = queued_ms
+        self.first_delay_s = first_delay_s
+        self.interval_s = interval_s
+        self.max_status_age_s = max_status_age_s
+        self.phrases = tuple(phrases)
+
+        self._active_tools = 0
+        self._task: Optional[asyncio.Task] = None
+        self._status: Optional[str] = None
+        self._status_at = 0.0
+
+        # Statistics
+        self.tool_calls = 0
+        self.long_tool_calls = 0
+        self.fillers_played = 0
+        self.statuses_spoken = 0
+        self.statuses_dropped = 0
+        self.cancelled_while_speaking = 0
+
+    @property
+    def is_active(self) -> bool:
+        """Whether a tool call is in progress."""
+        return self._active_tools > 0
+
+    def tool_started(self) -> None:
+        """Record the start of a tool call and arm the scheduler."""
+        self.tool_calls += 1
+        self._active_tools += 1
+        if self._task is None or self._task.done():
+            self._status = None
+            self._task = asyncio.create_task(self._run())
+
+    async def tool_finished(self) -> None:
+        """Record the end of a tool call; stops progress audio when none remain."""
+        self._active_tools = max(0, self._active_tools - 1)
+        if self._active_tools == 0:
+            await self.cancel()
+
+    def status(self, text: str) -> None:
+        """Offer a status update; only the latest is kept until the next slot."""
+        if self._status is not None:
+            self.statuses_dropped += 1
+        self._status = text
+        self._status_at = time.monotonic()
+
+    async def cancel(self) -> None:
+        """Stop any scheduled or in-progress progress audio."""
+        self._active_tools = 0
+        task, self._task = self._task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        """Speak progress at intervals while the tool runs."""
+        await asyncio.sleep(self.first_delay_s)
+        self.long_tool_calls += 1
+        logger.debug(
+            f"Tool call exceeded {self.first_delay_s}s, starting progress audio"
+        )
+
+        phrase_index = 0
+        while True:
+            await self._wait_for_speaker()
+
+            status = self._take_status()
+            try:
+                if status:
+                    self.statuses_spoken += 1
+                    await self._speak_text(status)
+                elif self.phrases:
+                    self.fillers_played += 1
+                    await self._play_phrase(
+                        self.phrases[min(phrase_index, len(self.phrases) - 1)]
+                    )
+                    phrase_index += 1
+            except asyncio.CancelledError:
+                self.cancelled_while_speaking += 1
+                raise
+            except Exception as e:
+                logger.error(f"Error playing progress audio: {e}")
+
+            await asyncio.sleep(self.interval_s)
+
+    async def _wait_for_speaker(self) -> None:
+        """Wait until audio already queued (e.g. the agent's reply) has played."""
+        if not self._queued_ms:
+            return
+        queued_ms = self._queued_ms()
+        while queued_ms > 0:
+            await asyncio.sleep(queued_ms / 1000)
+            queued_ms = self._queued_ms()
+
+    def _take_status(self) -> Optional[str]:
+        """Take the pending status if it is still fresh."""
+        status, self._status = self._status, None
+        if status and time.monotonic() - self._status_at > self.max_status_age_s:
+            self.statuses_dropped += 1
+            return None
+        return status
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics.
+
+        Returns:
+            Dictionary of tool call and progress audio counters
+        """
+        return {
+            "tool_calls": self.tool_calls,
+            "long_tool_calls": self.long_tool_calls,
+            "fillers_played": self.fillers_played,
+            "statuses_spoken": self.statuses_spoken,
+            "statuses_dropped": self.statuses_dropped,
+            "cancelled_while_speaking": self.cancelled_while_speaking,
+            "active": self.is_active,
+        }
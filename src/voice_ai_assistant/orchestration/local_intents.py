@@ -0,0 +1,241 @@
+"""Local recognition of trivial voice commands.
+
+"Stop", "repeat that" or "slower" do not need a model round-trip. The
+recognizer normalizes an utterance, drops politeness fillers and looks
+the rest up in a small command grammar. An utterance only counts as a
+command when the matched phrase makes up most of it, so "stop the
+build from failing" still goes to the agent.
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Intent name -> phrases that express it
+DEFAULT_INTENTS: Dict[str, Sequence[str]] = {
+    "stop": (
+        "stop",
+        "stop talking",
+        "stop it",
+        "be quiet",
+        "quiet",
+        "shut up",
+        "cancel",
+        "enough",
+        "that's enough",
+        "pause",
+    ),
+    "never_mind": (
+        "never mind",
+        "nevermind",
+        "forget it",
+        "forget about it",
+        "ignore that",
+    ),
+    "repeat": (
+        "repeat",
+        "repeat that",
+        "say that again",
+        "say it again",
+        "come again",
+        "what did you say",
+        "repeat the last answer",
+        "again",
+    ),
+    "louder": (
+        "louder",
+        "speak up",
+        "volume up",
+        "turn it up",
+        "more volume",
+        "speak louder",
+    ),
+    "quieter": (
+        "quieter",
+        "softer",
+        "volume down",
+        "turn it down",
+        "less volume",
+        "speak quieter",
+        "speak softer",
+    ),
+    "slower": ("slower", "slow down", "speak slower", "talk slower", "too fast"),
+    "faster": ("faster", "speed up", "speak faster", "talk faster", "too slow"),
+}
+
+# Words that do not change what a command means
+FILLER_WORDS = frozenset(
+    {
+        "please",
+        "hey",
+        "ok",
+        "okay",
+        "um",
+        "uh",
+        "just",
+        "can",
+        "could",
+        "would",
+        "you",
+        "a",
+        "bit",
+        "little",
+        "now",
+        "thanks",
+        "thank",
+        "oh",
+        "so",
+        "well",
+        "assistant",
+        "claude",
+        "the",
+    }
+)
+
+_PUNCTUATION = re.compile(r"[^\w\s']")
+
+
+@dataclass
+class IntentMatch:
+    """A recognized local command."""
+
+    intent: str
+    confidence: float
+    phrase: str
+
+
+class LocalIntentRecognizer:
+    """Keyword/grammar matcher for commands handled without the agent."""
+
+    def __init__(
+        self,
+        intents: Optional[Dict[str, Sequence[str]]] = None,
+        min_confidence: float = 0.75,
+        max_words: int = 8,
+    ):
+        """Initialize recognizer.
+
+        Args:
+            intents: Intent name to phrases (defaults to DEFAULT_INTENTS)
+            min_confidence: Share of the utterance's words the matched
+                phrase must cover
+            max_words: Longer utterances are never treated as commands
+        """
+        self.min_confidence = min_confidence
+        self.max_words = max_words
+
+        # Normalized phrase -> intent, plus the phrases as word tuples for
+        # matching inside slightly longer utterances
+        self._exact: Dict[str, str] = {}
+        self._phrases: Tuple[Tuple[Tuple[str, ...], str, str], ...] = ()
+        self.set_intents(intents if intents is not None else DEFAULT_INTENTS)
+
+        # Statistics
+        self.utterances = 0
+        self.matches: Dict[str, int] = {}
+        self.rejected_low_confidence = 0
+        self._match_ns_total = 0
+
+    def set_intents(self, intents: Dict[str, Sequence[str]]) -> None:
+        """Replace the command grammar."""
+        exact = {}
+        phrases = []
+        for intent, intent_phrases in intents.items():
+            for phrase in intent_phrases:
+                words = tuple(self._words(phrase, drop_fillers=False))
+                content = tuple(self._words(phrase, drop_fillers=True)) or words
+                exact[" ".join(words)] = intent
+                exact[" ".join(content)] = intent
+                phrases.append((content, intent, phrase))
+        self._exact = exact
+        # Longest first, so "stop talking" wins over "stop"
+        self._phrases = tuple(sorted(phrases, key=lambda p: len(p[0]), reverse=True))
+
+    def match(self, text: str) -> Optional[IntentMatch]:
+        """Recognize a command.
+
+        Args:
+            text: Final transcript of an utterance
+
+        Returns:
+            The command, or None if the utterance should go to the agent
+        """
+        started_ns = time.perf_counter_ns()
+        self.utterances += 1
+        try:
+            return self._match(text)
+        finally:
+            self._match_ns_total += time.perf_counter_ns() - started_ns
+
+    def _match(self, text: str) -> Optional[IntentMatch]:
+        """Exact lookup first, then phrases inside the utterance."""
+        words = self._words(text, drop_fillers=False)
+        if not words or len(words) > self.max_words:
+            return None
+
+        intent = self._exact.get(" ".join(words))
+        if intent:
+            return self._accept(intent, 1.0, " ".join(words))
+
+        content = self._words(text, drop_fillers=True)
+        if not content:
+            return None
+        intent = self._exact.get(" ".join(content))
+        if intent:
+            return self._accept(intent, 1.0, " ".join(content))
+
+        for phrase_words, intent, phrase in self._phrases:
+            if self._contains(content, phrase_words):
+                confidence = len(phrase_words) / len(content)
+                if confidence >= self.min_confidence:
+                    return self._accept(intent, confidence, phrase)
+                self.rejected_low_confidence += 1
+                return None
+        return None
+
+    def _accept(self, intent: str, confidence: float, phrase: str) -> IntentMatch:
+        """Count and return a match."""
+        self.matches[intent] = self.matches.get(intent, 0) + 1
+        logger.debug(f"Local intent '{intent}' ({confidence:.2f}) from '{phrase}'")
+        return IntentMatch(intent=intent, confidence=confidence, phrase=phrase)
+
+    @staticmethod
+    def _words(text: str, drop_fillers: bool) -> list:
+        """Lowercase words without punctuation (and optionally fillers)."""
+        words = _PUNCTUATION.sub(" ", text.lower()).split()
+        if drop_fillers:
+            words = [word for word in words if word not in FILLER_WORDS]
+        return words
+
+    @staticmethod
+    def _contains(words: Sequence[str], phrase: Sequence[str]) -> bool:
+        """Whether phrase occurs as consecutive words."""
+        size = len(phrase)
+        return any(
+            tuple(words[i : i + size]) == tuple(phrase)
+            for i in range(len(words) - size + 1)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recognizer statistics.
+
+        Returns:
+            Dictionary with matches per intent; every match is an agent
+            (LLM) call saved
+        """
+        matched = sum(self.matches.values())
+        return {
+            "utterances": self.utterances,
+            "llm_calls_saved": matched,
+            "matches": dict(self.matches),
+            "rejected_low_confidence": self.rejected_low_confidence,
+            "avg_match_us": (
+                self._match_ns_total / self.utterances / 1000
+                if self.utterances
+                else 0.0
+            ),
+        }
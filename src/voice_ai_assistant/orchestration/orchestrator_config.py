@@ -1,7 +1,7 @@
 """Configuration for voice orchestrator."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
 
 @dataclass
@@ -12,6 +12,22 @@ class OrchestratorConfig:
     project_id: Optional[str] = None
     region: str = "us-central1"
     model: str = "gemini-2.5-flash-native-audio-preview-09-2025"  # Latest Live API model with improved function calling
+    # Live session mode: "transcription" uses Gemini for speech-to-text only
+    # (no audio generated); "audio" also requests spoken Gemini responses
+    live_session_mode: str = "transcription"
+    transcription_model: str = "gemini-live-2.5-flash-preview"  # Text-output Live model for STT sessions
+    # Who answers the user: "strands" answers transcripts with the Strands
+    # agent and TTS; "gemini" lets the Live model answer in its own voice
+    # and run its run_coding_task calls on Claude Code directly (requires
+    # live_session_mode "audio")
+    agent_mode: str = "strands"
+
+    # Speech-to-text backend: "gemini_live" transcribes through the Live
+    # session; "google_speech" (Cloud Speech-to-Text streaming) or "fake"
+    # use a standalone recognizer. Can be overridden per conversation.
+    stt_backend: str = "gemini_live"
+    stt_language_code: str = "en-US"
+    stt_model: str = "latest_short"
 
     # Session settings
     session_timeout_minutes: int = 30
@@ -21,13 +37,84 @@ class OrchestratorConfig:
     max_response_latency_ms: int = 300
     audio_chunk_size: int = 1024
 
+    # Voice activity detection (suppress silent microphone audio)
+    enable_vad: bool = True
+    vad_hangover_ms: int = 400         # Trailing silence before the local end-pointer fires
+    vad_pre_roll_ms: int = 300
+    # End-of-speech detection: "server" keeps the Live API's automatic
+    # activity detection; "client" disables it and sends explicit
+    # activity start/end markers from the local VAD (requires enable_vad)
+    end_of_speech_mode: str = "server"
+
     # Agent settings
     agent_model: str = "claude-haiku-4-5-20251001"
     enable_code_tools: bool = True
+    # Claude Code tasks running longer are interrupted (None for no limit)
+    coding_task_timeout_s: Optional[float] = 120.0
+    # Claude Code clients (subprocesses) shared by all sessions; a session's
+    # tasks stick to one client, different sessions run in parallel
+    max_coding_clients: int = 4
+    coding_client_idle_timeout_s: float = 300.0
+    # Turns kept verbatim in the agent's history; older turns are summarized
+    # in the background (None keeps the whole history)
+    agent_memory_window_turns: Optional[int] = 10
+    # Anthropic prompt caching of the agent's system prompt, tools and summary
+    enable_prompt_caching: bool = True
+    # Small talk and clarifications answered by a tool-less model call
+    # instead of the coding agent
+    enable_turn_routing: bool = True
+    fast_agent_model: Optional[str] = None  # None uses agent_model
+
+    # Speculative agent execution on partial transcripts
+    enable_speculation: bool = False
+    speculation_similarity_threshold: float = 0.85  # Final vs partial similarity to keep a run
+    speculation_min_stability: float = 0.8          # Partial stability needed to speculate
+    speculation_min_words: int = 3
+
+    # Response synthesis: segments synthesized concurrently while the
+    # agent keeps streaming; audio is still played in order
+    tts_max_in_flight: int = 3
+    tts_streaming: bool = True  # Play audio as it streams in (supported voices only)
+    tts_max_concurrent_requests: int = 8  # Process-wide TTS requests in flight
+    # Segment sizes: the first segment may end at a clause to start speech
+    # early; later ones grow with the audio already queued for playback
+    tts_first_segment_min_chars: int = 12
+    tts_min_segment_chars: int = 30
+    tts_max_segment_chars: int = 250
+    # Synthesized clip cache: in-memory LRU plus a disk tier that survives
+    # restarts (set tts_cache_dir to None to keep it memory-only); least
+    # recently used files are deleted beyond tts_cache_disk_mb
+    enable_tts_cache: bool = True
+    tts_cache_memory_mb: int = 32
+    tts_cache_dir: Optional[str] = "~/.cache/voice_ai_assistant/tts"
+    tts_cache_disk_mb: int = 256
+    # Short phrases pre-synthesized at startup and kept as hardware-rate PCM
+    enable_phrase_bank: bool = True
+    phrase_bank_phrases: Optional[Dict[str, str]] = None  # Name -> text (None uses the defaults)
+    # Progress audio while a coding task runs longer than filler_first_delay_s
+    enable_fillers: bool = True
+    filler_first_delay_s: float = 2.5
+    filler_interval_s: float = 6.0
+
+    # Trivial commands ("stop", "repeat that", "slower") handled locally
+    # without the agent
+    enable_local_intents: bool = True
+    local_intent_min_confidence: float = 0.75
 
     # Safety settings
     max_conversation_turns: int = 50
     enable_interruption: bool = True
+    # Interrupt the response when local VAD hears the user, without
+    # waiting for the server's interrupted signal
+    enable_local_barge_in: bool = True
+    # Local barge-in must last this long at a level within the offset of
+    # the playback level, so speaker echo does not interrupt. Playback is
+    # ducked to barge_in_duck_gain at the onset, so the assistant yields
+    # within one output block; the response is flushed on confirmation or
+    # restored to full volume if the onset is rejected
+    barge_in_min_speech_ms: float = 250.0
+    barge_in_level_offset_db: float = -10.0
+    barge_in_duck_gain: float = 0.1
 
     # Audio I/O settings
     hardware_sample_rate: int = 48000  # Hardware interface sample rate (e.g., Scarlett)
@@ -35,6 +122,9 @@ class OrchestratorConfig:
     vertex_output_rate: int = 24000    # Vertex AI output rate
     input_device: Optional[int] = None  # Sounddevice input device index
     output_device: Optional[int] = None # Sounddevice output device index
+    playback_buffer_seconds: float = 60.0  # Playback ring buffer capacity
+    playback_target_buffer_ms: int = 60    # Buffer depth before playback (re)starts
+    capture_max_staleness_ms: int = 500    # Drop captured audio older than this
 
     # Repository settings
     repository_base_path: Optional[str] = None  # Base path for all projects (e.g., C:\Users\japi\Documents\git\)
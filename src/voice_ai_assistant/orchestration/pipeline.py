@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from collections import deque
 import statistics
 
+from ..voice.vad import VoiceActivityDetector, VADConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +26,13 @@ class StreamingMetrics:
     total_processing_time_ms: float = 0.0
     latency_samples: deque = field(default_factory=lambda: deque(maxlen=100))
     throughput_samples: deque = field(default_factory=lambda: deque(maxlen=50))
+    turn_latency_samples: deque = field(default_factory=lambda: deque(maxlen=50))
+    synthesis_latency_samples: deque = field(default_factory=lambda: deque(maxlen=100))
+    speaker_gap_samples: deque = field(default_factory=lambda: deque(maxlen=100))
+    barge_in_latency_samples: deque = field(default_factory=lambda: deque(maxlen=50))
     error_count: int = 0
+    chunks_suppressed: int = 0
+    bytes_suppressed: int = 0
     last_activity: float = field(default_factory=time.time)
     
     def add_latency_sample(self, latency_ms: float) -> None:
@@ -37,15 +45,41 @@ class StreamingMetrics:
         """Add a throughput measurement sample."""
         self.throughput_samples.append(chunks_per_second)
         
+    def add_turn_latency_sample(self, latency_ms: float) -> None:
+        """Add an end-of-speech to first-response latency sample."""
+        self.turn_latency_samples.append(latency_ms)
+
+    def add_synthesis_samples(self, synthesis_ms: List[float], gap_ms: List[float]) -> None:
+        """Add per-segment TTS latency and speaker gap samples of one turn."""
+        self.synthesis_latency_samples.extend(synthesis_ms)
+        self.speaker_gap_samples.extend(gap_ms)
+
+    def add_barge_in_sample(self, latency_ms: float) -> None:
+        """Add a speech-detected to playback-silenced latency sample."""
+        self.barge_in_latency_samples.append(latency_ms)
+
     def get_avg_latency_ms(self) -> float:
         """Get average latency in milliseconds."""
         return statistics.mean(self.latency_samples) if self.latency_samples else 0.0
         
     def get_p95_latency_ms(self) -> float:
         """Get 95th percentile latency in milliseconds."""
-        if not self.latency_samples:
+        return self._p95(self.latency_samples)
+
+    def get_avg_turn_latency_ms(self) -> float:
+        """Get average end-of-speech to first-response latency in milliseconds."""
+        return statistics.mean(self.turn_latency_samples) if self.turn_latency_samples else 0.0
+
+    def get_p95_turn_latency_ms(self) -> float:
+        """Get 95th percentile end-of-speech to first-response latency."""
+        return self._p95(self.turn_latency_samples)
+
+    @staticmethod
+    def _p95(samples: deque) -> float:
+        """Get the 95th percentile of a sample window."""
+        if not samples:
             return 0.0
-        sorted_samples = sorted(self.latency_samples)
+        sorted_samples = sorted(samples)
         index = int(0.95 * len(sorted_samples))
         return sorted_samples[min(index, len(sorted_samples) - 1)]
         
@@ -63,6 +97,23 @@ class StreamingMetrics:
             'p95_latency_ms': self.get_p95_latency_ms(),
             'avg_throughput_cps': self.get_avg_throughput(),
             'error_count': self.error_count,
+            'chunks_suppressed': self.chunks_suppressed,
+            'bytes_suppressed': self.bytes_suppressed,
+            'turns_measured': len(self.turn_latency_samples),
+            'avg_turn_latency_ms': self.get_avg_turn_latency_ms(),
+            'p95_turn_latency_ms': self.get_p95_turn_latency_ms(),
+            'tts_segments_measured': len(self.synthesis_latency_samples),
+            'avg_synthesis_latency_ms': (
+                statistics.mean(self.synthesis_latency_samples) if self.synthesis_latency_samples else 0.0
+            ),
+            'p95_synthesis_latency_ms': self._p95(self.synthesis_latency_samples),
+            'avg_speaker_gap_ms': statistics.mean(self.speaker_gap_samples) if self.speaker_gap_samples else 0.0,
+            'p95_speaker_gap_ms': self._p95(self.speaker_gap_samples),
+            'barge_ins_measured': len(self.barge_in_latency_samples),
+            'avg_barge_in_latency_ms': (
+                statistics.mean(self.barge_in_latency_samples) if self.barge_in_latency_samples else 0.0
+            ),
+            'p95_barge_in_latency_ms': self._p95(self.barge_in_latency_samples),
             'uptime_seconds': time.time() - (self.last_activity - self.total_processing_time_ms / 1000)
         }
 
@@ -105,27 +156,36 @@ class StreamingPipelineManager:
     - Throughput measurement
     - Pipeline performance metrics
     - Stream interruption and recovery
+    - Voice activity detection (suppressing silent input audio)
     """
     
     def __init__(self, 
                  max_latency_ms: int = 300,
                  buffer_size: int = 1000,
-                 metrics_window_size: int = 100):
+                 metrics_window_size: int = 100,
+                 enable_vad: bool = False,
+                 vad_config: Optional[VADConfig] = None):
         """Initialize streaming pipeline manager.
         
         Args:
             max_latency_ms: Maximum acceptable latency in milliseconds
             buffer_size: Maximum buffer size for audio chunks
             metrics_window_size: Size of metrics sampling window
+            enable_vad: Whether to suppress non-speech input chunks
+            vad_config: Voice activity detection configuration
         """
         self.max_latency_ms = max_latency_ms
         self.buffer_size = buffer_size
         self.metrics_window_size = metrics_window_size
+        self.enable_vad = enable_vad
+        self.vad_config = vad_config or VADConfig()
         
         # Active pipeline sessions
         self._sessions: Dict[str, PipelineBuffer] = {}
         self._metrics: Dict[str, StreamingMetrics] = {}
+        self._vad: Dict[str, VoiceActivityDetector] = {}
         self._processing_tasks: Dict[str, asyncio.Task] = {}
+        self._speech_ended_at: Dict[str, float] = {}
         
         self._is_running = False
         
@@ -137,6 +197,8 @@ class StreamingPipelineManager:
         self._on_latency_alert: Optional[Callable[[str, float], None]] = None
         self._on_throughput_alert: Optional[Callable[[str, float], None]] = None
         self._on_buffer_overflow: Optional[Callable[[str], None]] = None
+        self._on_speech_start: Optional[Callable[[str], None]] = None
+        self._on_speech_end: Optional[Callable[[str], None]] = None
         
     async def start(self) -> None:
         """Start the streaming pipeline manager."""
@@ -182,6 +244,8 @@ class StreamingPipelineManager:
         # Create buffer and metrics
         self._sessions[session_id] = PipelineBuffer(max_size=self.buffer_size)
         self._metrics[session_id] = StreamingMetrics(session_id=session_id)
+        if self.enable_vad:
+            self._vad[session_id] = VoiceActivityDetector(self.vad_config)
         
         logger.info(f"Initialized streaming pipeline for session: {session_id}")
         
@@ -212,19 +276,27 @@ class StreamingPipelineManager:
             metrics = self._metrics[session_id]
             logger.info(f"Final metrics for session {session_id}: {metrics.to_dict()}")
             del self._metrics[session_id]
+        if session_id in self._vad:
+            logger.info(f"Final VAD stats for session {session_id}: {self._vad[session_id].get_stats()}")
+            del self._vad[session_id]
+        self._speech_ended_at.pop(session_id, None)
             
         logger.info(f"Cleaned up streaming pipeline for session: {session_id}")
         
-    async def process_audio_chunk(self, session_id: str, audio_data: bytes) -> None:
+    async def process_audio_chunk(self, session_id: str, audio_data: bytes) -> Optional[bytes]:
         """Process an audio chunk through the pipeline.
         
         Args:
             session_id: Session identifier
             audio_data: PCM audio data
+            
+        Returns:
+            Audio to forward upstream (may include VAD pre-roll), or None
+            if the chunk was suppressed as silence
         """
         if session_id not in self._sessions:
             logger.error(f"Pipeline session not found: {session_id}")
-            return
+            return None
             
         start_time = time.time()
         
@@ -235,13 +307,16 @@ class StreamingPipelineManager:
             # Add chunk to buffer
             buffer.add_chunk(audio_data)
             
-            # Process chunk (placeholder for actual processing)
-            await self._process_chunk(session_id, audio_data)
+            # Process chunk (validation and voice activity detection)
+            forward = await self._process_chunk(session_id, audio_data)
             
             # Update metrics
             processing_time_ms = (time.time() - start_time) * 1000
             metrics.add_latency_sample(processing_time_ms)
             metrics.total_chunks_processed += 1
+            if forward is None:
+                metrics.chunks_suppressed += 1
+                metrics.bytes_suppressed += len(audio_data)
             
             # Check latency threshold
             if processing_time_ms > self.max_latency_ms:
@@ -249,10 +324,14 @@ class StreamingPipelineManager:
                 if self._on_latency_alert:
                     self._on_latency_alert(session_id, processing_time_ms)
                     
+            return forward
+                    
         except Exception as e:
             logger.error(f"Error processing audio chunk for {session_id}: {e}")
             if session_id in self._metrics:
                 self._metrics[session_id].error_count += 1
+            # Fail open: never lose user audio because of a pipeline error
+            return audio_data
                 
     async def process_audio_response(self, session_id: str, audio_data: bytes) -> None:
         """Process audio response from agent back to voice output.
@@ -274,6 +353,64 @@ class StreamingPipelineManager:
         except Exception as e:
             logger.error(f"Error processing audio response for {session_id}: {e}")
             
+    def record_response_start(self, session_id: str) -> Optional[float]:
+        """Record the first response audio after the user stopped speaking.
+
+        Call when response audio is handed to playback (not for transcripts
+        of the user's own speech).
+
+        Latency is measured from the last speech audio, i.e. the speech end
+        event minus the VAD hangover, so it includes the end-pointing delay
+        of whichever side detected the end of the turn.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Turn latency in milliseconds, or None if no speech end is pending
+        """
+        ended_at = self._speech_ended_at.pop(session_id, None)
+        if ended_at is None or session_id not in self._metrics:
+            return None
+
+        latency_ms = (time.monotonic() - ended_at) * 1000 + self.vad_config.hangover_ms
+        self._metrics[session_id].add_turn_latency_sample(latency_ms)
+        logger.debug(f"Turn latency for {session_id}: {latency_ms:.0f}ms")
+        return latency_ms
+
+    def record_synthesis(self, session_id: str, synthesis_ms: List[float], gap_ms: List[float]) -> None:
+        """Record TTS timings of one agent response.
+
+        Args:
+            session_id: Session identifier
+            synthesis_ms: Per-segment synthesis latencies
+            gap_ms: Speaker idle time before each segment after the first
+        """
+        if session_id in self._metrics:
+            self._metrics[session_id].add_synthesis_samples(synthesis_ms, gap_ms)
+
+    def record_barge_in(self, session_id: str, latency_ms: float) -> None:
+        """Record how long it took to silence playback after the user spoke.
+
+        Args:
+            session_id: Session identifier
+            latency_ms: Interruption detected to speaker silent
+        """
+        if session_id in self._metrics:
+            self._metrics[session_id].add_barge_in_sample(latency_ms)
+
+    def is_speech_active(self, session_id: str) -> bool:
+        """Whether voice activity detection currently hears the user.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True between a speech start and the matching speech end
+        """
+        detector = self._vad.get(session_id)
+        return detector is not None and detector.is_speaking
+
     async def handle_interruption(self, session_id: str) -> None:
         """Handle pipeline interruption (barge-in).
         
@@ -304,32 +441,58 @@ class StreamingPipelineManager:
         except Exception as e:
             logger.error(f"Error handling interruption for {session_id}: {e}")
             
-    async def _process_chunk(self, session_id: str, audio_data: bytes) -> None:
+    async def _process_chunk(self, session_id: str, audio_data: bytes) -> Optional[bytes]:
         """Process individual audio chunk.
 
-        Currently performs basic validation and logging.
-        Future enhancements could include:
-        - Audio preprocessing/filtering
-        - Voice activity detection
-        - Noise reduction
+        Performs basic validation and, when enabled, voice activity
+        detection. Speech start/end events are dispatched to the registered
+        callbacks before the chunk is returned, so a speech-start handler
+        runs before the first speech audio is forwarded.
 
         Args:
             session_id: Session identifier
             audio_data: Audio chunk to process
+
+        Returns:
+            Audio to forward, or None to suppress the chunk
         """
         # Basic validation
         if not audio_data:
             logger.warning(f"Empty audio chunk received for session {session_id}")
-            return
+            return None
 
         # Log chunk size for monitoring
         chunk_size = len(audio_data)
         logger.debug(f"Processing audio chunk for {session_id}: {chunk_size} bytes")
 
-        # Future: Add audio preprocessing here
-        # - Voice activity detection
-        # - Noise reduction
-        # - Echo cancellation
+        detector = self._vad.get(session_id)
+        if detector is None:
+            return audio_data
+
+        result = detector.process(audio_data)
+
+        if result.speech_started:
+            logger.debug(f"Speech started for session {session_id}")
+            self._speech_ended_at.pop(session_id, None)
+            await self._dispatch(self._on_speech_start, session_id)
+        if result.speech_ended:
+            logger.debug(f"Speech ended for session {session_id}")
+            self._speech_ended_at[session_id] = time.monotonic()
+            await self._dispatch(self._on_speech_end, session_id)
+
+        return result.audio
+
+    async def _dispatch(self, callback: Optional[Callable[[str], Any]], session_id: str) -> None:
+        """Invoke a sync or async session event callback."""
+        if not callback:
+            return
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                await callback(session_id)
+            else:
+                callback(session_id)
+        except Exception as e:
+            logger.error(f"Error in pipeline event callback for {session_id}: {e}")
         
     async def _process_response_audio(self, session_id: str, audio_data: bytes) -> None:
         """Process response audio for output.
@@ -419,6 +582,7 @@ class StreamingPipelineManager:
             'buffer_bytes': buffer.total_bytes,
             'metrics': metrics.to_dict(),
             'has_processing_task': session_id in self._processing_tasks,
+            'vad': self._vad[session_id].get_stats() if session_id in self._vad else None,
             'is_active': True
         }
         
@@ -472,4 +636,12 @@ class StreamingPipelineManager:
         
     def set_buffer_overflow_callback(self, callback: Callable[[str], None]) -> None:
         """Set callback for buffer overflow events."""
-        self._on_buffer_overflow = callback
\ No newline at end of file
+        self._on_buffer_overflow = callback
+
+    def set_speech_start_callback(self, callback: Callable[[str], None]) -> None:
+        """Set callback for VAD speech start events."""
+        self._on_speech_start = callback
+
+    def set_speech_end_callback(self, callback: Callable[[str], None]) -> None:
+        """Set callback for VAD speech end events."""
+        self._on_speech_end = callback
@@ -0,0 +1,273 @@
+"""Speculative agent execution on partial transcripts.
+
+Waiting for the final transcript before starting the agent adds the
+whole end-of-turn delay to time-to-first-audio. The executor starts the
+agent on a stable partial transcript and keeps its output in a holding
+buffer. When the final transcript arrives:
+- hit: the final is similar enough to the partial, so the buffered
+  output is replayed and the run continues streaming live
+- miss: the speculative run is cancelled, its conversation history is
+  rolled back, and the agent runs again on the final text
+
+Speculative runs are paused before any tool executes until the final
+transcript confirms them, so a misheard request never triggers a tool.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from ..agent.claude_client_pool import current_session_id
+from ..agent.strands_agent import StrandsAgent
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio for English text, used to estimate waste
+CHARS_PER_TOKEN = 4
+
+
+def transcript_similarity(a: str, b: str) -> float:
+    """Word-level similarity of two transcripts, from 0.0 to 1.0.
+
+    Case and punctuation are ignored.
+    """
+
+    def words(text: str) -> List[str]:
+        return "".join(
+            c.lower() if c.isalnum() or c.isspace() else " " for c in text
+        ).split()
+
+    return SequenceMatcher(None, words(a), words(b)).ratio()
+
+
+@dataclass
+class SpeculativeRun:
+    """An agent run started on a partial transcript."""
+
+    session_id: str
+    text: str
+    history_length: int
+    started_at: float = field(default_factory=time.monotonic)
+    chunks: List[str] = field(default_factory=list)
+    finished: bool = False
+    tool_gate: asyncio.Event = field(default_factory=asyncio.Event)
+    updated: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+
+
+class SpeculativeAgentExecutor:
+    """Runs the agent ahead of the final transcript and reconciles the result."""
+
+    def __init__(
+        self,
+        agent: StrandsAgent,
+        enabled: bool = True,
+        similarity_threshold: float = 0.85,
+        min_stability: float = 0.8,
+        min_words: int = 3,
+    ):
+        """Initialize speculative executor.
+
+        Args:
+            agent: Agent that produces responses
+            enabled: Whether speculation is used at all
+            similarity_threshold: Minimum final/partial similarity to keep a run
+            min_stability: Minimum partial stability required to speculate
+            min_words: Minimum words in a partial before speculating
+        """
+        self.agent = agent
+        self.enabled = enabled
+        self.similarity_threshold = similarity_threshold
+        self.min_stability = min_stability
+        self.min_words = min_words
+
+        # One run at a time: the agent's conversation history is shared
+        self._run: Optional[SpeculativeRun] = None
+        self._final_runs = 0
+
+        # Statistics
+        self.speculations_started = 0
+        self.restarts = 0
+        self.hits = 0
+        self.misses = 0
+        self.no_speculation = 0
+        self.wasted_chunks = 0
+        self.wasted_chars = 0
+        self.head_start_ms: List[float] = []
+
+    async def speculate(
+        self, session_id: str, text: str, stability: float = 1.0
+    ) -> bool:
+        """Offer a partial transcript for speculative execution.
+
+        Args:
+            session_id: Session identifier
+            text: Partial transcript
+            stability: Backend estimate that the partial will not change
+
+        Returns:
+            True if a new speculative run was started
+        """
+        if not self.enabled or self._final_runs:
+            return False
+        if stability < self.min_stability or len(text.split()) < self.min_words:
+            return False
+
+        run = self._run
+        if run is not None:
+            if run.session_id != session_id:
+                return False
+            if transcript_similarity(run.text, text) >= self.similarity_threshold:
+                # Current run still matches what the user is saying
+                return False
+            # The partial moved on; restart on the newer text
+            self.restarts += 1
+            await self._discard(run)
+
+        run = SpeculativeRun(
+            session_id=session_id, text=text, history_length=self.agent.history_length()
+        )
+        run.task = asyncio.create_task(self._produce(run))
+        self._run = run
+        self.speculations_started += 1
+        logger.debug(f"Speculating for session {session_id} on: {text}")
+        return True
+
+    async def stream(self, session_id: str, text: str) -> AsyncGenerator[str, None]:
+        """Stream the agent response for a final transcript.
+
+        Reuses a matching speculative run or falls back to a fresh run.
+
+        Args:
+            session_id: Session identifier
+            text: Final transcript
+
+        Yields:
+            Chunks of the agent's response text
+        """
+        run = None
+        if self._run is not None:
+            run, self._run = self._run, None
+            if run.session_id != session_id:
+                # Another session's speculation cannot share the agent
+                await self._discard(run)
+                run = None
+
+        self._final_runs += 1
+        try:
+            if (
+                run
+                and transcript_similarity(run.text, text) >= self.similarity_threshold
+            ):
+                self.hits += 1
+                self.head_start_ms.append((time.monotonic() - run.started_at) * 1000)
+                logger.debug(
+                    f"Speculation hit for session {session_id} "
+                    f"({len(run.chunks)} chunks buffered)"
+                )
+                run.tool_gate.set()
+                try:
+                    async for chunk in self._replay(run):
+                        yield chunk
+                finally:
+                    # Consumer stopped early (e.g. barge-in): stop the run too
+                    if run.task and not run.task.done():
+                        run.task.cancel()
+                return
+
+            if run:
+                self.misses += 1
+                logger.debug(
+                    f"Speculation miss for session {session_id}: "
+                    f"'{run.text}' vs '{text}'"
+                )
+                await self._discard(run)
+            else:
+                self.no_speculation += 1
+
+            async for chunk in self.agent.process_message(text):
+                yield chunk
+        finally:
+            self._final_runs -= 1
+
+    async def cancel(self, session_id: str) -> None:
+        """Cancel any speculative run for a session (barge-in, session end)."""
+        if self._run and self._run.session_id == session_id:
+            run, self._run = self._run, None
+            await self._discard(run)
+
+    async def _produce(self, run: SpeculativeRun) -> None:
+        """Run the agent into the holding buffer."""
+        # Tool calls of this run belong to the session (own task, own context)
+        current_session_id.set(run.session_id)
+        try:
+            async for chunk in self.agent.process_message(
+                run.text, tool_gate=run.tool_gate
+            ):
+                run.chunks.append(chunk)
+                run.updated.set()
+        finally:
+            run.finished = True
+            run.updated.set()
+
+    async def _replay(self, run: SpeculativeRun) -> AsyncGenerator[str, None]:
+        """Yield buffered chunks, then follow the run until it finishes.
+
+        An error of the agent run is re-raised once its output is replayed,
+        as a non-speculative stream would raise it.
+        """
+        index = 0
+        while True:
+            while index < len(run.chunks):
+                yield run.chunks[index]
+                index += 1
+            if run.finished:
+                break
+            run.updated.clear()
+            if index == len(run.chunks) and not run.finished:
+                await run.updated.wait()
+        if run.task:
+            # Done right after finished is set; raises the run's exception
+            await run.task
+
+    async def _discard(self, run: SpeculativeRun) -> None:
+        """Cancel a run and forget it from the agent's history."""
+        if run.task:
+            if not run.task.done():
+                run.task.cancel()
+            try:
+                await run.task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.debug(f"Discarded speculative run had failed: {e}")
+        self.agent.truncate_history(run.history_length)
+        self.wasted_chunks += len(run.chunks)
+        self.wasted_chars += sum(len(chunk) for chunk in run.chunks)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get speculation statistics.
+
+        Returns:
+            Dictionary of hit/miss and waste counters
+        """
+        decided = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "speculations_started": self.speculations_started,
+            "restarts": self.restarts,
+            "hits": self.hits,
+            "misses": self.misses,
+            "no_speculation": self.no_speculation,
+            "hit_rate": self.hits / decided if decided else 0.0,
+            "wasted_chunks": self.wasted_chunks,
+            "wasted_tokens_est": self.wasted_chars // CHARS_PER_TOKEN,
+            "avg_head_start_ms": (
+                sum(self.head_start_ms) / len(self.head_start_ms)
+                if self.head_start_ms
+                else 0.0
+            ),
+        }
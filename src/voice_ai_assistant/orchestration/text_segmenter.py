@@ -0,0 +1,282 @@
+"""Incremental segmentation of streamed agent text for speech synthesis.
+
+The agent streams its answer in small chunks. Each chunk is scanned once
+for segment boundaries, so segmenting a response costs time linear in its
+length. Boundaries are chosen for speech:
+- sentence ends, ignoring abbreviations ("e.g.", "Dr."), decimals,
+  dotted code identifiers ("os.path.join") and numbered list markers
+- paragraph breaks and markdown list items / headings
+- inside fenced code blocks only line ends
+
+The first segment of a response is released at the first clause boundary
+so speech starts quickly. Later segments grow with the amount of audio
+already queued for playback: a well-fed speaker allows longer, more
+natural sounding segments and fewer synthesis requests.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Typical speaking rate, used to convert queued audio into text length
+SPEECH_CHARS_PER_SECOND = 15
+
+ABBREVIATIONS = frozenset(
+    {
+        "mr",
+        "mrs",
+        "ms",
+        "dr",
+        "prof",
+        "sr",
+        "jr",
+        "st",
+        "vs",
+        "e.g",
+        "i.e",
+        "approx",
+        "no",
+        "fig",
+        "ver",
+        "inc",
+        "ltd",
+        "jan",
+        "feb",
+        "mar",
+        "apr",
+        "jun",
+        "jul",
+        "aug",
+        "sep",
+        "sept",
+        "oct",
+        "nov",
+        "dec",
+    }
+)
+
+SENTENCE_END = ".!?"
+CLAUSE_END = ",;:"
+# Closing characters that may follow sentence punctuation ("done.)" "**ok.**")
+CLOSERS = "\"')]}*_`"
+
+_EMPHASIS = re.compile(r"(\*\*|__|\*|`)")
+_LINE_MARKER = re.compile(r"^\s*(#{1,6}\s+|[-*+]\s+|>\s*)", re.MULTILINE)
+
+
+@dataclass
+class _Boundary:
+    """A candidate cut position in the pending text."""
+
+    position: int
+    sentence: bool
+
+
+class SentenceSegmenter:
+    """Splits streamed text into speakable segments."""
+
+    def __init__(
+        self,
+        queued_ms: Optional[Callable[[], float]] = None,
+        first_segment_min_chars: int = 12,
+        min_segment_chars: int = 30,
+        max_segment_chars: int = 250,
+    ):
+        """Initialize sentence segmenter.
+
+        Args:
+            queued_ms: Returns the audio (in ms) queued ahead of the next
+                segment; later segments grow with it
+            first_segment_min_chars: Minimum length of the first segment,
+                which may end at a clause boundary
+            min_segment_chars: Minimum length of later segments
+            max_segment_chars: Length at which a segment is cut even
+                without a sentence boundary
+        """
+        self._queued_ms = queued_ms
+        self.first_segment_min_chars = first_segment_min_chars
+        self.min_segment_chars = min_segment_chars
+        self.max_segment_chars = max_segment_chars
+
+        self._buffer = ""
+        self._scan_pos = 0
+        self._boundaries: List[_Boundary] = []
+        self._in_code_block = False
+
+        # Statistics
+        self.segments_emitted = 0
+        self.chars_emitted = 0
+        self.forced_splits = 0
+        self.first_segment_chars: Optional[int] = None
+
+    def feed(self, text: str) -> List[str]:
+        """Add streamed text and return segments that are ready to speak.
+
+        Args:
+            text: Next chunk of agent output
+
+        Returns:
+            Zero or more segments, in order
+        """
+        self._buffer += text
+        self._scan()
+
+        segments = []
+        while True:
+            cut = self._choose_cut()
+            if cut is None:
+                break
+            segment = self._take(cut)
+            if segment:
+                segments.append(segment)
+        return segments
+
+    def flush(self) -> Optional[str]:
+        """Return whatever text is left at the end of the response."""
+        segment = self._take(len(self._buffer))
+        return segment or None
+
+    def _target_chars(self) -> int:
+        """Minimum length of the next segment given the queued audio."""
+        if self.segments_emitted == 0:
+            return self.first_segment_min_chars
+
+        queued_chars = 0
+        if self._queued_ms:
+            queued_chars = int(self._queued_ms() / 1000 * SPEECH_CHARS_PER_SECOND)
+        return min(self.max_segment_chars, max(self.min_segment_chars, queued_chars))
+
+    def _choose_cut(self) -> Optional[int]:
+        """Pick where to cut the pending text, or None to keep waiting."""
+        target = self._target_chars()
+        first = self.segments_emitted == 0
+
+        for boundary in self._boundaries:
+            if boundary.position >= target and (boundary.sentence or first):
+                return boundary.position
+
+        if len(self._buffer) < self.max_segment_chars:
+            return None
+
+        # Too long without a usable boundary: cut at the latest one we have
+        self.forced_splits += 1
+        within = [b for b in self._boundaries if b.position <= self.max_segment_chars]
+        sentences = [b.position for b in within if b.sentence]
+        if sentences:
+            return sentences[-1]
+        if within:
+            return within[-1].position
+        space = self._buffer.rfind(" ", 0, self.max_segment_chars)
+        return space if space > 0 else self.max_segment_chars
+
+    def _take(self, cut: int) -> str:
+        """Remove the first cut characters and return them cleaned for speech."""
+        raw, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        self._scan_pos = max(0, self._scan_pos - cut)
+        self._boundaries = [
+            _Boundary(b.position - cut, b.sentence)
+            for b in self._boundaries
+            if b.position > cut
+        ]
+
+        segment = self._clean(raw)
+        if segment:
+            if self.first_segment_chars is None:
+                self.first_segment_chars = len(segment)
+            self.segments_emitted += 1
+            self.chars_emitted += len(segment)
+        return segment
+
+    def _scan(self) -> None:
+        """Record boundaries in text not scanned yet.
+
+        Stops early where deciding needs characters that have not arrived.
+        """
+        buffer = self._buffer
+        i = self._scan_pos
+        while i < len(buffer):
+            char = buffer[i]
+
+            if char == "`":
+                if len(buffer) - i < 3:
+                    break
+                if buffer.startswith("```", i):
+                    self._in_code_block = not self._in_code_block
+                    i += 3
+                    continue
+
+            elif char == "\n":
+                if i + 1 >= len(buffer):
+                    break
+                if self._in_code_block or self._starts_block(buffer, i + 1):
+                    self._boundaries.append(_Boundary(i + 1, sentence=True))
+
+            elif not self._in_code_block and (
+                char in SENTENCE_END or char in CLAUSE_END
+            ):
+                end = i + 1
+                while end < len(buffer) and buffer[end] in CLOSERS:
+                    end += 1
+                if end >= len(buffer):
+                    break
+                if buffer[end].isspace():
+                    if char in CLAUSE_END:
+                        self._boundaries.append(_Boundary(end, sentence=False))
+                    elif char != "." or not self._is_non_terminal_period(buffer, i):
+                        self._boundaries.append(_Boundary(end, sentence=True))
+                i = end
+                continue
+
+            i += 1
+        self._scan_pos = i
+
+    @staticmethod
+    def _starts_block(buffer: str, start: int) -> bool:
+        """Whether a line starting at start opens a new block of text."""
+        line = buffer[start : start + 4].lstrip(" ")
+        return not line or line[0] in "\n#>-*+" or line[0].isdigit()
+
+    @staticmethod
+    def _is_non_terminal_period(buffer: str, index: int) -> bool:
+        """Whether the period at index belongs to an abbreviation or list marker."""
+        start = index
+        while start > 0 and not buffer[start - 1].isspace():
+            start -= 1
+        word = buffer[start:index].lstrip("([\"'*_").lower()
+
+        if word in ABBREVIATIONS:
+            return True
+        if len(word) == 1 and word.isalpha():
+            # An initial, as in "J. Smith"
+            return True
+        # "1. Install" at the start of a line is a numbered list marker
+        at_line_start = start == 0 or buffer[start - 1] == "\n"
+        return at_line_start and word.isdigit()
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        """Strip markdown markers that should not be spoken."""
+        text = text.replace("```", " ")
+        text = _LINE_MARKER.sub("", text)
+        text = _EMPHASIS.sub("", text)
+        return " ".join(text.split())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get segmentation statistics.
+
+        Returns:
+            Dictionary of segment counts and sizes
+        """
+        return {
+            "segments": self.segments_emitted,
+            "first_segment_chars": self.first_segment_chars,
+            "avg_segment_chars": (
+                self.chars_emitted / self.segments_emitted
+                if self.segments_emitted
+                else 0.0
+            ),
+            "forced_splits": self.forced_splits,
+        }
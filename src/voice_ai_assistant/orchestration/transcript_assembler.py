@@ -0,0 +1,175 @@
+"""Transcript assembly for user turns.
+
+The Live API delivers the user's speech as many small transcript
+fragments. Running the agent on each fragment would start several LLM
+runs per spoken sentence. The assembler collects the fragments of a
+session and releases them as one utterance when the server signals that
+the turn is complete.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TranscriptBuffer:
+    """Fragments of the current user turn and per-session counters."""
+
+    session_id: str
+    fragments: List[str] = field(default_factory=list)
+    fragments_received: int = 0
+    turns_dispatched: int = 0
+    empty_completions: int = 0
+    interruptions: int = 0
+
+    @property
+    def agent_calls_avoided(self) -> int:
+        """Agent runs saved compared to one run per fragment."""
+        return max(0, self.fragments_received - self.turns_dispatched)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert counters to dictionary."""
+        return {
+            "session_id": self.session_id,
+            "pending_fragments": len(self.fragments),
+            "fragments_received": self.fragments_received,
+            "turns_dispatched": self.turns_dispatched,
+            "empty_completions": self.empty_completions,
+            "interruptions": self.interruptions,
+            "agent_calls_avoided": self.agent_calls_avoided,
+        }
+
+
+class TranscriptAssembler:
+    """Accumulates transcript fragments and dispatches one text per user turn."""
+
+    # Server signals that close the user's turn
+    COMPLETION_EVENTS = ("turn_complete", "generation_complete")
+
+    def __init__(self, on_turn: Optional[Callable[[str, str], Awaitable[None]]] = None):
+        """Initialize transcript assembler.
+
+        Args:
+            on_turn: Async callback receiving (session_id, utterance) once
+                per completed user turn
+        """
+        self._on_turn = on_turn
+        self._buffers: Dict[str, TranscriptBuffer] = {}
+
+    def set_turn_callback(
+        self, callback: Callable[[str, str], Awaitable[None]]
+    ) -> None:
+        """Set callback for completed user turns."""
+        self._on_turn = callback
+
+    def add_fragment(self, session_id: str, text: str) -> None:
+        """Add a transcript fragment to the session's current turn.
+
+        Args:
+            session_id: Session identifier
+            text: Transcript fragment as received (may start with a space)
+        """
+        buffer = self._get_buffer(session_id)
+        buffer.fragments.append(text)
+        buffer.fragments_received += 1
+
+    def pending_text(self, session_id: str) -> str:
+        """Get the text assembled so far for the session's open turn."""
+        buffer = self._buffers.get(session_id)
+        return " ".join("".join(buffer.fragments).split()) if buffer else ""
+
+    async def handle_event(self, session_id: str, event: str) -> Optional[str]:
+        """Handle a turn signal from the server.
+
+        turn_complete and generation_complete close the turn and dispatch it;
+        whichever arrives first wins and the other finds an empty buffer.
+        interrupted means the user spoke over the model, so the turn stays
+        open and keeps accumulating.
+
+        Args:
+            session_id: Session identifier
+            event: "turn_complete", "generation_complete" or "interrupted"
+
+        Returns:
+            The dispatched utterance, or None if nothing was dispatched
+        """
+        if event == "interrupted":
+            self._get_buffer(session_id).interruptions += 1
+            logger.debug(
+                f"Turn interrupted for session {session_id}, keeping transcript open"
+            )
+            return None
+
+        if event in self.COMPLETION_EVENTS:
+            return await self.complete_turn(session_id)
+
+        logger.debug(f"Ignoring unknown turn event for session {session_id}: {event}")
+        return None
+
+    async def complete_turn(self, session_id: str) -> Optional[str]:
+        """Close the current turn and dispatch its assembled text.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            The dispatched utterance, or None if the turn was empty
+        """
+        buffer = self._get_buffer(session_id)
+        utterance = self.pending_text(session_id)
+        buffer.fragments.clear()
+
+        if not utterance:
+            buffer.empty_completions += 1
+            return None
+
+        buffer.turns_dispatched += 1
+        logger.debug(
+            f"Assembled user turn for session {session_id} "
+            f"({buffer.agent_calls_avoided} agent calls avoided so far): {utterance}"
+        )
+
+        if self._on_turn:
+            try:
+                await self._on_turn(session_id, utterance)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error handling user turn for {session_id}: {e}")
+
+        return utterance
+
+    def discard(self, session_id: str) -> None:
+        """Drop any pending fragments for a session."""
+        if session_id in self._buffers:
+            self._buffers[session_id].fragments.clear()
+
+    def cleanup_session(self, session_id: str) -> None:
+        """Remove a session's buffer."""
+        buffer = self._buffers.pop(session_id, None)
+        if buffer:
+            logger.info(
+                f"Final transcript stats for session {session_id}: {buffer.to_dict()}"
+            )
+
+    def get_stats(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get transcript counters for a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Counter dictionary or None if the session has no buffer
+        """
+        buffer = self._buffers.get(session_id)
+        return buffer.to_dict() if buffer else None
+
+    def _get_buffer(self, session_id: str) -> TranscriptBuffer:
+        """Get or create the buffer for a session."""
+        if session_id not in self._buffers:
+            self._buffers[session_id] = TranscriptBuffer(session_id=session_id)
+        return self._buffers[session_id]
@@ -0,0 +1,276 @@
+"""Pipelined text-to-speech for agent responses.
+
+Synthesizing each sentence inline stalls the agent stream for a full TTS
+round-trip per sentence. The synthesis pipeline starts a synthesis task
+for every submitted segment, keeps up to a bounded number in flight, and
+hands the audio to playback strictly in submission order from a single
+delivery task. With a streaming synthesizer the segment being spoken is
+played chunk by chunk as its audio arrives.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SynthesisSegment:
+    """A text segment moving through the synthesis pipeline."""
+
+    index: int
+    text: str
+    submitted_at: float = field(default_factory=time.monotonic)
+    task: Optional[asyncio.Task] = None
+    chunks: List[bytes] = field(default_factory=list)
+    updated: asyncio.Event = field(default_factory=asyncio.Event)
+    first_chunk_at: Optional[float] = None
+
+
+@dataclass
+class SynthesisStats:
+    """Timing of one turn's synthesis pipeline."""
+
+    segments: int = 0
+    failed_segments: int = 0
+    synthesis_ms: List[float] = field(
+        default_factory=list
+    )  # Submit to first audio chunk
+    order_wait_ms: List[float] = field(
+        default_factory=list
+    )  # Ready but waiting on earlier segments
+    gap_ms: List[float] = field(
+        default_factory=list
+    )  # Speaker idle before each later chunk
+    first_audio_ms: Optional[float] = None  # Pipeline start to first playback
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary."""
+
+        def avg(values: List[float]) -> float:
+            return sum(values) / len(values) if values else 0.0
+
+        return {
+            "segments": self.segments,
+            "failed_segments": self.failed_segments,
+            "avg_synthesis_ms": avg(self.synthesis_ms),
+            "max_synthesis_ms": max(self.synthesis_ms, default=0.0),
+            "avg_order_wait_ms": avg(self.order_wait_ms),
+            "avg_gap_ms": avg(self.gap_ms),
+            "max_gap_ms": max(self.gap_ms, default=0.0),
+            "total_gap_ms": sum(self.gap_ms),
+            "first_audio_ms": self.first_audio_ms,
+        }
+
+
+class TTSSynthesisPipeline:
+    """Concurrent, order-preserving synthesis for one response turn."""
+
+    def __init__(
+        self,
+        synthesize: Optional[Callable[[str], Awaitable[Optional[bytes]]]] = None,
+        play: Optional[Callable[[bytes], None]] = None,
+        max_in_flight: int = 3,
+        buffered_ms: Optional[Callable[[], float]] = None,
+        on_segment_played: Optional[Callable[[str], None]] = None,
+        synthesize_stream: Optional[Callable[[str], AsyncIterator[bytes]]] = None,
+    ):
+        """Initialize synthesis pipeline.
+
+        Args:
+            synthesize: Async text-to-speech function returning PCM audio
+            play: Function queueing audio for playback (must not block)
+            max_in_flight: Segments synthesizing or awaiting delivery at once
+            buffered_ms: Returns the audio still queued at the speaker, used
+                to measure gaps between segments
+            on_segment_played: Called with each segment's text once its
+                audio has been queued for playback
+            synthesize_stream: Text-to-speech function yielding PCM chunks
+                as they are synthesized; used instead of synthesize
+        """
+        if synthesize is None and synthesize_stream is None:
+            raise ValueError("A synthesize or synthesize_stream function is required")
+        if play is None:
+            raise ValueError("A play function is required")
+
+        self._synthesize = synthesize
+        self._synthesize_stream = synthesize_stream
+        self._play = play
+        self._buffered_ms = buffered_ms
+        self._on_segment_played = on_segment_played
+
+        self._window = asyncio.Semaphore(max_in_flight)
+        self._segments: Deque[SynthesisSegment] = deque()
+        self._segment_ready = asyncio.Event()
+        self._closed = False
+        self._cancelled = False
+        self._started_at = time.monotonic()
+        self._speaker_drained_at: Optional[float] = None
+        self._delivery_task = asyncio.create_task(self._deliver())
+
+        self.stats = SynthesisStats()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the pipeline was cancelled."""
+        return self._cancelled
+
+    @property
+    def pending_chars(self) -> int:
+        """Characters submitted but not yet handed to playback."""
+        return sum(len(segment.text) for segment in self._segments)
+
+    async def submit(self, text: str) -> None:
+        """Start synthesizing a segment.
+
+        Only waits when max_in_flight segments are already pending, so the
+        caller keeps consuming the agent stream while synthesis runs.
+
+        Segments submitted after cancel() are dropped.
+
+        Args:
+            text: Text to speak
+        """
+        if self._cancelled:
+            return
+        if self._closed:
+            raise RuntimeError("Synthesis pipeline already finished")
+
+        await self._window.acquire()
+        if self._cancelled:
+            return
+        segment = SynthesisSegment(index=self.stats.segments, text=text)
+        segment.task = asyncio.create_task(self._synthesize_segment(segment))
+        self.stats.segments += 1
+        self._segments.append(segment)
+        self._segment_ready.set()
+
+    async def finish(self) -> SynthesisStats:
+        """Wait until every submitted segment has been delivered.
+
+        Returns:
+            Timing statistics for the turn
+        """
+        self._closed = True
+        self._segment_ready.set()
+        await self._delivery_task
+        return self.stats
+
+    async def cancel(self) -> None:
+        """Abandon pending segments (barge-in or agent error)."""
+        self._closed = True
+        if self._delivery_task.done():
+            return
+
+        self._cancelled = True
+        for segment in self._segments:
+            if segment.task:
+                segment.task.cancel()
+        self._delivery_task.cancel()
+        try:
+            await self._delivery_task
+        except asyncio.CancelledError:
+            pass
+
+        # Wake any submit() still waiting for a slot
+        while self._segments:
+            self._segments.popleft()
+            self._window.release()
+
+    async def _synthesize_segment(self, segment: SynthesisSegment) -> None:
+        """Synthesize one segment into its chunk list."""
+        try:
+            if self._synthesize_stream:
+                async for chunk in self._synthesize_stream(segment.text):
+                    self._add_chunk(segment, chunk)
+            else:
+                self._add_chunk(segment, await self._synthesize(segment.text))
+        finally:
+            segment.updated.set()
+
+    @staticmethod
+    def _add_chunk(segment: SynthesisSegment, chunk: Optional[bytes]) -> None:
+        """Make a synthesized chunk available to the delivery task."""
+        if not chunk:
+            return
+        if segment.first_chunk_at is None:
+            segment.first_chunk_at = time.monotonic()
+        segment.chunks.append(chunk)
+        segment.updated.set()
+
+    async def _deliver(self) -> None:
+        """Hand synthesized audio to playback in submission order."""
+        while True:
+            if not self._segments:
+                if self._closed:
+                    return
+                self._segment_ready.clear()
+                await self._segment_ready.wait()
+                continue
+
+            segment = self._segments[0]
+            try:
+                played = await self._deliver_segment(segment)
+            finally:
+                self._segments.popleft()
+                self._window.release()
+
+            if not played:
+                self.stats.failed_segments += 1
+                continue
+
+            if self._on_segment_played:
+                self._on_segment_played(segment.text)
+
+    async def _deliver_segment(self, segment: SynthesisSegment) -> bool:
+        """Play a segment's chunks as they arrive.
+
+        Returns:
+            True if any audio was played
+        """
+        index = 0
+        while True:
+            while index < len(segment.chunks):
+                if index == 0:
+                    self._record_segment_start(segment)
+                self._play_chunk(segment.chunks[index])
+                index += 1
+            if segment.task.done():
+                break
+            segment.updated.clear()
+            if index == len(segment.chunks) and not segment.task.done():
+                await segment.updated.wait()
+
+        if not segment.task.cancelled() and segment.task.exception():
+            logger.error(
+                f"Synthesis failed for segment {segment.index}: "
+                f"{segment.task.exception()}"
+            )
+        return index > 0
+
+    def _record_segment_start(self, segment: SynthesisSegment) -> None:
+        """Record synthesis and ordering latency when a segment starts playing."""
+        now = time.monotonic()
+        self.stats.synthesis_ms.append(
+            (segment.first_chunk_at - segment.submitted_at) * 1000
+        )
+        self.stats.order_wait_ms.append((now - segment.first_chunk_at) * 1000)
+        if self.stats.first_audio_ms is None:
+            self.stats.first_audio_ms = (now - self._started_at) * 1000
+
+    def _play_chunk(self, chunk: bytes) -> None:
+        """Queue a chunk for playback, recording any speaker gap before it."""
+        now = time.monotonic()
+        if self._speaker_drained_at is not None:
+            gap_ms = max(0.0, (now - self._speaker_drained_at) * 1000)
+            self.stats.gap_ms.append(gap_ms)
+            if gap_ms > 0:
+                logger.debug(f"Speaker idle {gap_ms:.0f}ms before next chunk")
+
+        self._play(chunk)
+        if self._buffered_ms:
+            self._speaker_drained_at = time.monotonic() + self._buffered_ms() / 1000
@@ -1,15 +1,29 @@
 import asyncio
 import logging
+import time
+import uuid
 from typing import Optional, Dict, Any, Callable, List
 
 from ..voice.session_manager import VoiceSessionManager
 from ..voice.audio_io_manager import AudioIOManager
 from ..voice.gemini_tools import get_all_tool_declarations
 from ..voice.tts_manager import TTSManager
+from ..voice.tts_cache import TTSCache
+from ..voice.phrase_bank import PhraseBank
+from ..voice.vad import VADConfig
+from ..voice.stt_backend import STTBackend, TranscriptResult, create_stt_backend
+from ..agent.claude_client_pool import current_session_id
 from ..agent.strands_agent import StrandsAgent
 from .orchestrator_config import OrchestratorConfig
 from .flow_manager import ConversationFlowManager
 from .pipeline import StreamingPipelineManager
+from .transcript_assembler import TranscriptAssembler
+from .speculative_agent import SpeculativeAgentExecutor
+from .tts_pipeline import TTSSynthesisPipeline
+from .text_segmenter import SentenceSegmenter, SPEECH_CHARS_PER_SECOND
+from .filler_scheduler import FillerScheduler
+from .local_intents import LocalIntentRecognizer, IntentMatch
+from .barge_in import BargeInGate, level_db
 
 logger = logging.getLogger(__name__)
 
@@ -32,38 +46,94 @@ class VoiceOrchestrator:
         """
         self.config = config or OrchestratorConfig()
 
+        if self.config.end_of_speech_mode not in ("server", "client"):
+            raise ValueError(f"Unknown end_of_speech_mode: {self.config.end_of_speech_mode}")
+        if self.config.live_session_mode not in ("audio", "transcription"):
+            raise ValueError(f"Unknown live_session_mode: {self.config.live_session_mode}")
+        if self.config.agent_mode not in ("strands", "gemini"):
+            raise ValueError(f"Unknown agent_mode: {self.config.agent_mode}")
+        if self.config.agent_mode == "gemini" and self.config.live_session_mode != "audio":
+            raise ValueError("agent_mode 'gemini' requires live_session_mode 'audio'")
+        if self.config.end_of_speech_mode == "client" and not self.config.enable_vad:
+            raise ValueError("Client-side end-of-speech detection requires enable_vad")
+        self._client_end_of_speech = self.config.end_of_speech_mode == "client"
+        self._transcription_only = self.config.live_session_mode == "transcription"
+        # Gemini answers and calls tools itself; Strands is not in the loop
+        self._gemini_brain = self.config.agent_mode == "gemini"
+
         # Get tool declarations for Gemini (kept for compatibility, though Strands drives now)
         self.tools = get_all_tool_declarations()
         
         # Initialize TTS Manager
-        self.tts_manager = TTSManager(project_id=self.config.project_id)
+        tts_cache = None
+        if self.config.enable_tts_cache:
+            tts_cache = TTSCache(
+                max_memory_bytes=self.config.tts_cache_memory_mb * 1024 * 1024,
+                disk_dir=self.config.tts_cache_dir,
+                max_disk_bytes=self.config.tts_cache_disk_mb * 1024 * 1024
+            )
+        self.tts_manager = TTSManager(
+            project_id=self.config.project_id,
+            cache=tts_cache,
+            streaming=self.config.tts_streaming,
+            max_concurrent_requests=self.config.tts_max_concurrent_requests
+        )
 
         # Initialize Strands Agent
         # Pass callback for streaming status updates from tools and repository path
         self.strands_agent = StrandsAgent(
             model=self.config.agent_model, # Use specific agent model (Claude)
             repository_path=self.config.repository_base_path,
-            status_callback=self._on_tool_status_update
+            status_callback=self._on_tool_status_update,
+            activity_callback=self._on_tool_activity,
+            coding_task_timeout_s=self.config.coding_task_timeout_s,
+            max_coding_clients=self.config.max_coding_clients,
+            coding_client_idle_timeout_s=self.config.coding_client_idle_timeout_s,
+            memory_window_turns=self.config.agent_memory_window_turns,
+            prompt_caching=self.config.enable_prompt_caching,
+            route_turns=self.config.enable_turn_routing,
+            fast_model=self.config.fast_agent_model
+        )
+
+        # Starts the agent on stable partial transcripts
+        self.speculative_executor = SpeculativeAgentExecutor(
+            self.strands_agent,
+            enabled=self.config.enable_speculation,
+            similarity_threshold=self.config.speculation_similarity_threshold,
+            min_stability=self.config.speculation_min_stability,
+            min_words=self.config.speculation_min_words
         )
 
         # Core components
         self.session_manager = VoiceSessionManager(
             project_id=self.config.project_id,
             region=self.config.region,
-            model=self.config.model,
+            model=self.config.transcription_model if self._transcription_only else self.config.model,
             session_timeout_minutes=self.config.session_timeout_minutes,
-            tools=self.tools
+            tools=self.tools,
+            automatic_activity_detection=not self._client_end_of_speech,
+            response_mode=self.config.live_session_mode
         )
         
         self.flow_manager = ConversationFlowManager(
             max_turns=self.config.max_conversation_turns,
-            enable_interruption=self.config.enable_interruption
+            enable_interruption=self.config.enable_interruption,
+            context_window_size=self.config.agent_memory_window_turns or 10
         )
         
         self.pipeline_manager = StreamingPipelineManager(
-            max_latency_ms=self.config.max_response_latency_ms
+            max_latency_ms=self.config.max_response_latency_ms,
+            enable_vad=self.config.enable_vad,
+            vad_config=VADConfig(
+                sample_rate=self.config.vertex_input_rate,
+                hangover_ms=self.config.vad_hangover_ms,
+                pre_roll_ms=self.config.vad_pre_roll_ms
+            )
         )
 
+        # Collects transcript fragments into one utterance per user turn
+        self.transcript_assembler = TranscriptAssembler(on_turn=self._on_user_turn)
+
         # Audio I/O Manager
         self.audio_io_manager = AudioIOManager(
             hardware_sample_rate=self.config.hardware_sample_rate,
@@ -73,11 +143,57 @@ class VoiceOrchestrator:
             block_size=self.config.audio_chunk_size,
             dtype='int16',
             input_device=self.config.input_device,
-            output_device=self.config.output_device
+            output_device=self.config.output_device,
+            playback_buffer_seconds=self.config.playback_buffer_seconds,
+            playback_target_buffer_ms=self.config.playback_target_buffer_ms,
+            capture_max_staleness_ms=self.config.capture_max_staleness_ms
         )
 
+        # Pre-synthesized acknowledgements and status prompts
+        self.phrase_bank: Optional[PhraseBank] = None
+        if self.config.enable_phrase_bank:
+            self.phrase_bank = PhraseBank(
+                self.tts_manager,
+                hardware_sample_rate=self.config.hardware_sample_rate,
+                source_sample_rate=self.config.vertex_output_rate,
+                phrases=self.config.phrase_bank_phrases
+            )
+
+        # Progress audio during long coding tasks
+        self.filler_scheduler: Optional[FillerScheduler] = None
+        if self.config.enable_fillers:
+            self.filler_scheduler = FillerScheduler(
+                play_phrase=self.play_phrase,
+                speak_text=self._speak_status,
+                queued_ms=lambda: self.audio_io_manager.get_playback_stats()['buffered_ms'],
+                first_delay_s=self.config.filler_first_delay_s,
+                interval_s=self.config.filler_interval_s
+            )
+
+        # Commands answered without the agent
+        self.intent_recognizer: Optional[LocalIntentRecognizer] = None
+        if self.config.enable_local_intents:
+            self.intent_recognizer = LocalIntentRecognizer(
+                min_confidence=self.config.local_intent_min_confidence
+            )
+
         # Active sessions (just track session IDs, Gemini handles conversation)
         self._active_sessions: set = set()
+        # Standalone speech-to-text backends for sessions not using Gemini Live
+        self._stt_backends: Dict[str, STTBackend] = {}
+        # Response synthesis in progress per session
+        self._synthesis_pipelines: Dict[str, TTSSynthesisPipeline] = {}
+        # Agent response (agent stream plus synthesis) per session
+        self._response_tasks: Dict[str, asyncio.Task] = {}
+        # User turns dispatched from STT backends, which must not wait for them
+        self._turn_tasks: set = set()
+        # Local barge-in candidates awaiting confirmation against echo
+        self._barge_in_gates: Dict[str, BargeInGate] = {}
+        # Synthesized audio of the last response, for "repeat that"
+        self._last_response_audio: Dict[str, List[bytes]] = {}
+        # Gemini function calls being executed, per session and call ID
+        self._gemini_tool_calls: Dict[str, Dict[str, asyncio.Task]] = {}
+        self._gemini_tool_stats: Dict[str, int] = {'calls': 0, 'completed': 0, 'failed': 0, 'cancelled': 0}
         self._is_running = False
 
         # Event callbacks
@@ -107,9 +223,21 @@ class VoiceOrchestrator:
         # We might ignore audio response from Gemini if Strands is driving
         self.session_manager.set_audio_response_callback(self._on_audio_response)
         self.session_manager.set_text_response_callback(self._on_text_response)
+        # Transcription sessions deliver the user's speech as input transcripts
+        self.session_manager.set_input_transcription_callback(self._on_text_response)
+        self.session_manager.set_turn_event_callback(self._on_turn_event)
         self.session_manager.set_tool_call_callback(self._on_tool_call)
+        self.session_manager.set_tool_call_cancellation_callback(self._on_tool_call_cancellation)
         self.session_manager.set_error_callback(self._on_voice_error)
 
+        # VAD speech boundary events from the input pipeline
+        self.pipeline_manager.set_speech_start_callback(self._on_speech_start)
+        self.pipeline_manager.set_speech_end_callback(self._on_speech_end)
+
+        # Synthesize the phrase bank without delaying startup
+        if self.phrase_bank:
+            self.phrase_bank.schedule_refresh()
+
         self._is_running = True
         logger.info("Voice orchestrator started successfully")
         
@@ -124,6 +252,10 @@ class VoiceOrchestrator:
         self.stop_audio_capture()
         self.stop_audio_playback()
 
+        for task in list(self._turn_tasks) + list(self._response_tasks.values()):
+            task.cancel()
+        self._response_tasks.clear()
+
         # End all active sessions
         for session_id in list(self._active_sessions):
             await self.end_conversation(session_id)
@@ -131,6 +263,11 @@ class VoiceOrchestrator:
         # Shutdown audio I/O manager
         self.audio_io_manager.shutdown()
 
+        if self.phrase_bank:
+            await self.phrase_bank.close()
+        if self.filler_scheduler:
+            await self.filler_scheduler.cancel()
+
         # Stop underlying components
         await self.session_manager.stop()
         await self.flow_manager.stop()
@@ -142,12 +279,17 @@ class VoiceOrchestrator:
         self._is_running = False
         logger.info("Voice orchestrator stopped")
         
-    async def start_conversation(self, user_id: Optional[str] = None, enable_audio_capture: bool = True) -> str:
+    async def start_conversation(self,
+                                 user_id: Optional[str] = None,
+                                 enable_audio_capture: bool = True,
+                                 stt_backend: Optional[str] = None) -> str:
         """Start a new voice conversation.
 
         Args:
             user_id: Optional user identifier
             enable_audio_capture: Whether to start microphone capture automatically
+            stt_backend: Speech-to-text backend for this session (defaults
+                to config.stt_backend)
 
         Returns:
             Session ID for the conversation
@@ -161,9 +303,14 @@ class VoiceOrchestrator:
         if len(self._active_sessions) >= self.config.max_concurrent_sessions:
             raise RuntimeError("Maximum concurrent sessions reached")
 
+        stt_backend = stt_backend or self.config.stt_backend
+
         try:
-            # Create voice session (Gemini handles conversation + tools)
-            voice_session_id = await self.session_manager.create_session(user_id)
+            if stt_backend == "gemini_live":
+                # Create voice session (Gemini handles conversation + tools)
+                voice_session_id = await self.session_manager.create_session(user_id)
+            else:
+                voice_session_id = await self._create_stt_session(stt_backend)
 
             # Initialize conversation flow
             await self.flow_manager.initialize_conversation(voice_session_id)
@@ -206,9 +353,23 @@ class VoiceOrchestrator:
 
             # Clean up pipeline manager
             await self.pipeline_manager.cleanup_session(session_id)
-
-            # End voice session
-            await self.session_manager.end_session(session_id)
+            self.transcript_assembler.cleanup_session(session_id)
+            await self.speculative_executor.cancel(session_id)
+            response = self._response_tasks.pop(session_id, None)
+            if response and not response.done():
+                response.cancel()
+            self._last_response_audio.pop(session_id, None)
+            gate = self._barge_in_gates.pop(session_id, None)
+            if gate and gate.pending:
+                self.audio_io_manager.restore_playback()
+            await self._cancel_gemini_tool_calls(session_id)
+
+            # End voice session (or standalone recognizer)
+            backend = self._stt_backends.pop(session_id, None)
+            if backend:
+                await backend.stop()
+            else:
+                await self.session_manager.end_session(session_id)
 
             # Remove from active sessions
             self._active_sessions.discard(session_id)
@@ -231,32 +392,90 @@ class VoiceOrchestrator:
         """
         if session_id not in self._active_sessions:
             raise ValueError(f"Session not found: {session_id}")
-            
+
+        backend = self._stt_backends.get(session_id)
+        if backend:
+            await backend.send_audio(audio_data)
+            return
+
         # Forward to session manager
         await self.session_manager.send_audio_chunk(session_id, audio_data)
         
-    async def interrupt_conversation(self, session_id: str) -> None:
+    async def interrupt_conversation(self, session_id: str, detected_at: Optional[float] = None) -> None:
         """Interrupt current conversation (barge-in).
-        
+
+        Playback is silenced first; the agent stream, pending synthesis and
+        progress audio are cancelled after, since none of them can reach
+        the speaker any more.
+
         Args:
             session_id: Session to interrupt
+            detected_at: Monotonic time the user's speech was detected,
+                used to measure barge-in latency (defaults to now)
         """
         if session_id not in self._active_sessions:
             logger.warning(f"Session not found for interruption: {session_id}")
             return
-            
+
+        if detected_at is None:
+            detected_at = time.monotonic()
+
         try:
+            # Drop queued audio; the output callback goes silent at its next block
+            discarded_ms = self.audio_io_manager.flush_playback()
+
+            # Stop the agent stream and the synthesis of the rest of the response
+            response = self._response_tasks.pop(session_id, None)
+            if response and not response.done():
+                response.cancel()
+            synthesis = self._synthesis_pipelines.pop(session_id, None)
+            if synthesis:
+                await synthesis.cancel()
+            if self.filler_scheduler:
+                await self.filler_scheduler.cancel()
+
+            # Drop any response prepared ahead of the final transcript
+            await self.speculative_executor.cancel(session_id)
+
+            # Free Claude Code for work someone will hear (Gemini cancels
+            # its own calls with toolCallCancellation)
+            if not self._gemini_brain:
+                await self.strands_agent.cancel_coding_tasks(session_id)
+
             # Handle interruption in flow manager
             await self.flow_manager.handle_interruption(session_id)
-            
+
             # Handle interruption in pipeline
             await self.pipeline_manager.handle_interruption(session_id)
-            
-            logger.info(f"Interrupted conversation: {session_id}")
-            
+
+            flushed_at = await self.audio_io_manager.wait_for_flush()
+            if flushed_at is not None:
+                # Audio already handed to the device still plays out
+                latency_ms = (max(0.0, flushed_at - detected_at) * 1000
+                              + self.audio_io_manager.output_latency_ms)
+                self.pipeline_manager.record_barge_in(session_id, latency_ms)
+                logger.info(
+                    f"Interrupted conversation: {session_id} "
+                    f"(barge-in {latency_ms:.0f}ms, dropped {discarded_ms:.0f}ms of audio)"
+                )
+            else:
+                logger.warning(f"Interrupted conversation: {session_id} (playback flush not confirmed)")
+
         except Exception as e:
             logger.error(f"Error interrupting conversation {session_id}: {e}")
-            
+
+    def _is_responding(self, session_id: str) -> bool:
+        """Whether an agent response for the session is still running."""
+        response = self._response_tasks.get(session_id)
+        return bool(response and not response.done())
+
+    def _is_speaking(self, session_id: str) -> bool:
+        """Whether the assistant is audible or about to be."""
+        return (
+            session_id in self._synthesis_pipelines
+            or self.audio_io_manager.get_playback_stats()['buffered_ms'] > 0
+        )
+
     def get_session_state(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get current session state.
 
@@ -270,6 +489,8 @@ class VoiceOrchestrator:
             return None
 
         voice_state = self.session_manager.get_session_state(session_id)
+        backend = self._stt_backends.get(session_id)
+        gate = self._barge_in_gates.get(session_id)
         flow_state = self.flow_manager.get_conversation_state(session_id)
         pipeline_state = self.pipeline_manager.get_session_state(session_id)
 
@@ -278,6 +499,21 @@ class VoiceOrchestrator:
             'voice_state': voice_state.__dict__ if voice_state else None,
             'flow_state': flow_state,
             'pipeline_state': pipeline_state,
+            'playback_stats': self.audio_io_manager.get_playback_stats(),
+            'capture_stats': self.audio_io_manager.get_capture_stats(),
+            'stt_stats': backend.get_stats() if backend else None,
+            'transcript_stats': self.transcript_assembler.get_stats(session_id),
+            'speculation_stats': self.speculative_executor.get_stats(),
+            'tts_stats': self.tts_manager.get_stats(),
+            'phrase_bank_stats': self.phrase_bank.get_stats() if self.phrase_bank else None,
+            'filler_stats': self.filler_scheduler.get_stats() if self.filler_scheduler else None,
+            'local_intent_stats': self.intent_recognizer.get_stats() if self.intent_recognizer else None,
+            'barge_in_stats': gate.get_stats() if gate else None,
+            'coding_task_stats': self.strands_agent.claude_tool.get_stats(),
+            'agent_memory_stats': self.strands_agent.memory.get_stats() if self.strands_agent.memory else None,
+            'prompt_cache_stats': self.strands_agent.cache_stats.get_stats(),
+            'route_stats': self.strands_agent.router.get_stats() if self.strands_agent.router else None,
+            'gemini_tool_stats': dict(self._gemini_tool_stats) if self._gemini_brain else None,
             'is_active': True
         }
 
@@ -304,9 +540,15 @@ class VoiceOrchestrator:
         if session_id not in self._active_sessions:
             raise ValueError(f"Session not found: {session_id}")
 
-        # Create audio callback that sends to Vertex AI
+        # Create audio callback that sends to Vertex AI, skipping audio
+        # the pipeline's voice activity detection suppressed as silence
         async def audio_callback(audio_data: bytes):
-            await self.send_audio_chunk(session_id, audio_data)
+            forward = await self.pipeline_manager.process_audio_chunk(session_id, audio_data)
+            gate = self._barge_in_gates.get(session_id)
+            if gate and gate.pending:
+                await self._confirm_barge_in(session_id, gate, audio_data)
+            if forward:
+                await self.send_audio_chunk(session_id, forward)
 
         # Start capture with the callback
         event_loop = asyncio.get_running_loop()
@@ -324,6 +566,68 @@ class VoiceOrchestrator:
         self.audio_io_manager.stop_playback()
         logger.info("Stopped audio playback")
 
+    async def play_phrase(self, name: str) -> bool:
+        """Play a phrase from the phrase bank.
+
+        Falls back to synthesizing the phrase text if the bank is not
+        loaded yet.
+
+        Args:
+            name: Phrase name (e.g. "acknowledge", "error")
+
+        Returns:
+            True if the phrase was played from the bank without a TTS call
+        """
+        if not self.phrase_bank:
+            return False
+
+        samples = self.phrase_bank.get(name)
+        if samples is not None:
+            self.audio_io_manager.play_prepared_audio(samples)
+            return True
+
+        text = self.phrase_bank.text(name)
+        if text:
+            audio_data = await self.tts_manager.synthesize(text)
+            if audio_data:
+                self.audio_io_manager.play_audio(audio_data)
+        return False
+
+    def set_tts_voice(self, name: str, language_code: Optional[str] = None) -> None:
+        """Switch the TTS voice; the phrase bank refreshes in the background.
+
+        Args:
+            name: Voice name
+            language_code: Language of the voice (defaults to the current one)
+        """
+        self.tts_manager.set_voice(name, language_code)
+        if self.phrase_bank:
+            self.phrase_bank.refresh_if_changed()
+
+    async def _create_stt_session(self, backend_name: str) -> str:
+        """Create a session transcribed by a standalone STT backend.
+
+        Args:
+            backend_name: Backend name understood by create_stt_backend
+
+        Returns:
+            New session ID
+        """
+        session_id = str(uuid.uuid4())
+        options: Dict[str, Any] = {'sample_rate': self.config.vertex_input_rate}
+        if backend_name == "google_speech":
+            options.update(language_code=self.config.stt_language_code, model=self.config.stt_model)
+
+        backend = create_stt_backend(backend_name, **options)
+        backend.set_transcript_callback(
+            lambda result: self._on_stt_transcript(session_id, result)
+        )
+        await backend.start()
+        self._stt_backends[session_id] = backend
+
+        logger.info(f"Created {backend_name} STT session: {session_id}")
+        return session_id
+
     # Internal event handlers
     
     async def _on_voice_session_created(self, session_id: str) -> None:
@@ -341,19 +645,23 @@ class VoiceOrchestrator:
     async def _on_audio_response(self, session_id: str, audio_data: bytes) -> None:
         """Handle audio response from Vertex AI.
 
-        Plays back audio through the AudioIOManager with proper resampling.
-        NOTE: In the new workflow, we might want to suppress this if Strands is speaking.
-        For now, we will allow it but logging it.
+        Plays back audio through the AudioIOManager with proper resampling
+        when Gemini is the conversational model; otherwise Strands speaks
+        and Gemini's audio is suppressed.
         """
         if session_id not in self._active_sessions:
             return
 
         try:
+            self.pipeline_manager.record_response_start(session_id)
+
             # Process through pipeline manager
             await self.pipeline_manager.process_audio_response(session_id, audio_data)
 
-            # Play back audio (with resampling from 24kHz to hardware rate)
-            # self.audio_io_manager.play_audio(audio_data)
+            if self._gemini_brain:
+                # Play back audio (with resampling from 24kHz to hardware rate)
+                self.audio_io_manager.play_audio(audio_data)
+                return
 
             logger.debug(f"Received audio response from Gemini for session: {session_id} (Suppressed in favor of Strands)")
 
@@ -365,12 +673,69 @@ class VoiceOrchestrator:
     async def _on_text_response(self, session_id: str, text: str) -> None:
         """Handle text response from Gemini (STT).
 
-        This represents transcribed user speech.
-        We pass this to Strands Agent to drive the conversation.
+        This represents a fragment of transcribed user speech (an input
+        transcript in transcription mode). Fragments are buffered until the
+        server signals the end of the turn; see _on_turn_event.
         """
         if session_id not in self._active_sessions:
             return
 
+        if self._gemini_brain:
+            # Gemini's own reply (it is also spoken); no user turn to answer
+            self.pipeline_manager.record_response_start(session_id)
+            logger.debug(f"Gemini text for session {session_id}: {text}")
+            return
+
+        # The user's own words: the response starts when its audio plays
+        self.transcript_assembler.add_fragment(session_id, text)
+
+    async def _on_turn_event(self, session_id: str, event: str) -> None:
+        """Handle turn signals (turn/generation complete, interrupted) from Gemini."""
+        if session_id not in self._active_sessions:
+            return
+
+        if event == "interrupted" and self.config.enable_interruption and (
+                self._is_responding(session_id) or (self._gemini_brain and self._is_speaking(session_id))):
+            await self.interrupt_conversation(session_id)
+
+        await self.transcript_assembler.handle_event(session_id, event)
+
+    async def _on_user_turn(self, session_id: str, text: str) -> None:
+        """Handle a complete user utterance.
+
+        The response runs as its own task so a barge-in can cancel it
+        without cancelling the caller. A new utterance supersedes any
+        response still running.
+        """
+        if session_id not in self._active_sessions:
+            return
+
+        if self.intent_recognizer:
+            match = self.intent_recognizer.match(text)
+            if match:
+                await self._handle_local_intent(session_id, text, match)
+                return
+
+        previous = self._response_tasks.pop(session_id, None)
+        if previous and not previous.done():
+            previous.cancel()
+            await asyncio.wait({previous})
+
+        response = asyncio.create_task(self._respond(session_id, text))
+        self._response_tasks[session_id] = response
+        try:
+            await asyncio.wait({response})
+        except asyncio.CancelledError:
+            response.cancel()
+            raise
+        finally:
+            if self._response_tasks.get(session_id) is response:
+                del self._response_tasks[session_id]
+
+    async def _respond(self, session_id: str, text: str) -> None:
+        """Pass an utterance to Strands Agent and speak its response."""
+        # Route this response's coding tasks to the session's Claude Code client
+        current_session_id.set(session_id)
         try:
             # Process through flow manager
             await self.flow_manager.process_user_input(session_id, text)
@@ -385,87 +750,232 @@ class VoiceOrchestrator:
             # Pass text to Strands Agent and buffer chunks for better audio quality
             logger.info(f"Passing text to Strands Agent: {text}")
 
-            text_buffer = []
-            min_buffer_size = 150  # Larger minimum for smoother audio
-
-            async for chunk in self.strands_agent.process_message(text):
-                if chunk:
-                    logger.info(f"Strands Agent response chunk: {chunk}")
-                    text_buffer.append(chunk)
-
-                    # Join buffer to check conditions
-                    buffered_text = "".join(text_buffer)
-
-                    # Trigger synthesis when:
-                    # 1. We have a sentence ending (. ! ?)
-                    # 2. We've accumulated enough text (150+ chars for smoother audio)
-                    # 3. Double newline (paragraph break)
-                    has_sentence_end = buffered_text.rstrip().endswith(('.', '!', '?'))
-                    has_paragraph_break = '\n\n' in buffered_text
-                    has_minimum_size = len(buffered_text) >= min_buffer_size
-
-                    should_synthesize = (has_sentence_end or has_paragraph_break) and len(buffered_text) >= 30
-
-                    if should_synthesize or has_minimum_size:
-                        # Synthesize speech for the buffered text
-                        logger.debug(f"Synthesizing {len(buffered_text)} chars (sentence_end={has_sentence_end}, min_size={has_minimum_size})")
-                        audio_data = await self.tts_manager.synthesize(buffered_text)
-
-                        if audio_data:
-                            self.audio_io_manager.play_audio(audio_data)
-
-                            # Notify conversation turn callback (agent response)
-                            if self._on_conversation_turn:
-                                self._on_conversation_turn(session_id, "agent", buffered_text)
-
-                        # Clear buffer
-                        text_buffer = []
-
-            # Synthesize any remaining buffered text (important for final phrases)
-            if text_buffer:
-                buffered_text = "".join(text_buffer).strip()
-                if buffered_text:  # Only if there's actual text
-                    logger.debug(f"Synthesizing remaining text: {len(buffered_text)} chars")
-                    audio_data = await self.tts_manager.synthesize(buffered_text)
-                    if audio_data:
-                        self.audio_io_manager.play_audio(audio_data)
-                    if self._on_conversation_turn:
-                        self._on_conversation_turn(session_id, "agent", buffered_text)
+            def on_segment_played(segment_text: str) -> None:
+                # Notify conversation turn callback (agent response)
+                if self._on_conversation_turn:
+                    self._on_conversation_turn(session_id, "agent", segment_text)
+
+            response_audio: List[bytes] = []
+            self._last_response_audio[session_id] = response_audio
+
+            def play(audio: bytes) -> None:
+                if not response_audio:
+                    # Turn latency ends with the first response audio played
+                    self.pipeline_manager.record_response_start(session_id)
+                response_audio.append(audio)
+                self.audio_io_manager.play_audio(audio)
+
+            # Segments are synthesized while the agent keeps streaming and
+            # are played strictly in order
+            synthesis = TTSSynthesisPipeline(
+                synthesize_stream=self.tts_manager.synthesize_stream,
+                play=play,
+                max_in_flight=self.config.tts_max_in_flight,
+                buffered_ms=lambda: self.audio_io_manager.get_playback_stats()['buffered_ms'],
+                on_segment_played=on_segment_played
+            )
+            self._synthesis_pipelines[session_id] = synthesis
+
+            def queued_ms() -> float:
+                # Audio at the speaker plus text still being synthesized
+                playback_ms = self.audio_io_manager.get_playback_stats()['buffered_ms']
+                return playback_ms + synthesis.pending_chars * 1000 / SPEECH_CHARS_PER_SECOND
+
+            segmenter = SentenceSegmenter(
+                queued_ms=queued_ms,
+                first_segment_min_chars=self.config.tts_first_segment_min_chars,
+                min_segment_chars=self.config.tts_min_segment_chars,
+                max_segment_chars=self.config.tts_max_segment_chars
+            )
+
+            try:
+                async for chunk in self.speculative_executor.stream(session_id, text):
+                    if synthesis.cancelled:
+                        # Barge-in: the rest of the response will not be spoken
+                        break
+                    if chunk:
+                        logger.info(f"Strands Agent response chunk: {chunk}")
+                        for segment in segmenter.feed(chunk):
+                            logger.debug(f"Synthesizing {len(segment)} chars")
+                            await synthesis.submit(segment)
+
+                # Synthesize any remaining text (important for final phrases)
+                remaining = segmenter.flush()
+                if remaining and not synthesis.cancelled:
+                    logger.debug(f"Synthesizing remaining text: {len(remaining)} chars")
+                    await synthesis.submit(remaining)
+
+                stats = await synthesis.finish()
+                self.pipeline_manager.record_synthesis(session_id, stats.synthesis_ms, stats.gap_ms)
+                logger.debug(
+                    f"Response synthesis stats for {session_id}: {stats.to_dict()}, "
+                    f"segmentation: {segmenter.get_stats()}"
+                )
+            finally:
+                # No-op after finish(); stops pending synthesis on errors
+                await synthesis.cancel()
+                if self._synthesis_pipelines.get(session_id) is synthesis:
+                    del self._synthesis_pipelines[session_id]
 
         except Exception as e:
             logger.error(f"Error processing text response for {session_id}: {e}")
+            await self.play_phrase("error")
             if self._on_error:
                 self._on_error(session_id, e)
 
+    async def _handle_local_intent(self, session_id: str, text: str, match: IntentMatch) -> None:
+        """Carry out a recognized command without the agent."""
+        logger.info(f"Local command '{match.intent}' (confidence {match.confidence:.2f}): {text}")
+        if self._on_conversation_turn:
+            self._on_conversation_turn(session_id, "user", text)
+
+        # A response prepared from the partial transcript is not wanted
+        await self.speculative_executor.cancel(session_id)
+
+        try:
+            if match.intent in ("stop", "never_mind"):
+                if self._is_responding(session_id) or self._is_speaking(session_id):
+                    await self.interrupt_conversation(session_id)
+
+            elif match.intent == "repeat":
+                audio = self._last_response_audio.get(session_id)
+                if not audio or self._is_responding(session_id):
+                    await self.play_phrase("not_understood")
+                    return
+                self.audio_io_manager.flush_playback()
+                for chunk in audio:
+                    self.audio_io_manager.play_audio(chunk)
+
+            elif match.intent in ("louder", "quieter"):
+                factor = 1.4 if match.intent == "louder" else 1 / 1.4
+                self.audio_io_manager.set_output_gain(self.audio_io_manager.output_gain * factor)
+                await self.play_phrase("ok")
+
+            elif match.intent in ("slower", "faster"):
+                step = -0.15 if match.intent == "slower" else 0.15
+                self.tts_manager.set_speaking_rate(self.tts_manager.audio_config.speaking_rate + step)
+                # The repeated audio was synthesized at the old rate
+                self._last_response_audio.pop(session_id, None)
+                if self.phrase_bank:
+                    self.phrase_bank.refresh_if_changed()
+                await self.play_phrase("ok")
+
+        except Exception as e:
+            logger.error(f"Error handling local command '{match.intent}' for {session_id}: {e}")
+
     async def _on_tool_call(self, session_id: str, function_calls: List[Dict[str, Any]]) -> None:
         """Handle tool/function call request from Gemini.
 
-        Gemini is requesting to execute tools.
-        In the new workflow, Strands handles tools internally, so this might not be used
-        unless Gemini itself decides to call tools (which we might want to disable or ignore).
+        When Gemini is the conversational model, each call runs as its own
+        task and its result goes back with send_tool_response, after which
+        Gemini speaks the answer itself. Otherwise Strands handles tools and
+        the request is ignored.
         """
         if session_id not in self._active_sessions:
             return
 
+        logger.info(f"Gemini requested {len(function_calls)} tool call(s) for session {session_id}")
+        if not self._gemini_brain:
+            return
+
+        calls = self._gemini_tool_calls.setdefault(session_id, {})
+        for call in function_calls:
+            call_id = call.get("id") or uuid.uuid4().hex
+            self._gemini_tool_stats['calls'] += 1
+            calls[call_id] = asyncio.create_task(
+                self._run_gemini_tool_call(session_id, call_id, call.get("name", ""), call.get("args") or {})
+            )
+
+    async def _run_gemini_tool_call(self,
+                                    session_id: str,
+                                    call_id: str,
+                                    name: str,
+                                    args: Dict[str, Any]) -> None:
+        """Execute one Gemini function call and send back its result."""
+        # Coding tasks of this session go to its Claude Code client
+        current_session_id.set(session_id)
         try:
-            logger.info(f"Gemini requested {len(function_calls)} tool call(s) for session {session_id}")
-            # We log this but might not need to execute if Strands is driving.
-            # However, if we are using Gemini as the brain (hybrid), we might need this.
-            # For now, assuming Strands is the main brain, we can ignore or log.
-            
+            if name == "run_coding_task":
+                result = await self.strands_agent.claude_tool.execute_task(args.get("task_description", ""))
+                response = {"result": result}
+                self._gemini_tool_stats['completed'] += 1
+            else:
+                logger.warning(f"Gemini called unknown function: {name}")
+                response = {"error": f"Unknown function: {name}"}
+                self._gemini_tool_stats['failed'] += 1
+        except asyncio.CancelledError:
+            # Gemini no longer expects a response
+            self._gemini_tool_stats['cancelled'] += 1
+            logger.info(f"Cancelled Gemini tool call {call_id} for session {session_id}")
+            raise
         except Exception as e:
-            logger.error(f"Error executing tool call for {session_id}: {e}")
+            logger.error(f"Error executing tool call {call_id} for {session_id}: {e}")
+            response = {"error": str(e)}
+            self._gemini_tool_stats['failed'] += 1
             if self._on_error:
                 self._on_error(session_id, e)
-                
+        finally:
+            self._gemini_tool_calls.get(session_id, {}).pop(call_id, None)
+
+        if session_id not in self._active_sessions:
+            return
+        try:
+            await self.session_manager.send_tool_response(
+                session_id, [{"id": call_id, "name": name, "response": response}]
+            )
+        except Exception as e:
+            logger.error(f"Failed to return tool call {call_id} result for {session_id}: {e}")
+
+    async def _on_tool_call_cancellation(self, session_id: str, call_ids: List[str]) -> None:
+        """Cancel Gemini function calls whose results are no longer wanted."""
+        calls = self._gemini_tool_calls.get(session_id, {})
+        tasks = [calls[call_id] for call_id in call_ids if call_id in calls]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            # Returns once Claude Code has stopped and freed its client
+            await asyncio.wait(tasks)
+
+    async def _cancel_gemini_tool_calls(self, session_id: str) -> None:
+        """Cancel all Gemini function calls of a session."""
+        calls = self._gemini_tool_calls.pop(session_id, {})
+        for task in calls.values():
+            task.cancel()
+        if calls:
+            await asyncio.wait(list(calls.values()))
+
     async def _on_tool_status_update(self, text: str) -> None:
         """Handle streaming status updates from tools.
         
-        Synthesizes speech for the status update and plays it back.
+        While a coding task runs, updates go to the filler scheduler, which
+        speaks the latest one at its next slot. Otherwise they are spoken
+        right away.
         """
+        logger.info(f"Tool status update: {text}")
+
+        if self.filler_scheduler and self.filler_scheduler.is_active:
+            self.filler_scheduler.status(text)
+            return
+
+        await self._speak_status(text)
+
+    async def _on_tool_activity(self, active: bool) -> None:
+        """Handle a coding task starting (True) or returning (False)."""
+        if not self.filler_scheduler:
+            return
+        if active:
+            self.filler_scheduler.tool_started()
+        else:
+            await self.filler_scheduler.tool_finished()
+
+    async def _speak_status(self, text: str) -> None:
+        """Speak a status update, using the phrase bank when it has the text."""
         try:
-            logger.info(f"Tool status update: {text}")
-            
+            # Recurring prompts are already synthesized
+            phrase = self.phrase_bank.find(text) if self.phrase_bank else None
+            if phrase and await self.play_phrase(phrase):
+                return
+
             # Synthesize speech
             audio_data = await self.tts_manager.synthesize(text)
             
@@ -476,6 +986,116 @@ class VoiceOrchestrator:
         except Exception as e:
             logger.error(f"Error handling tool status update: {e}")
 
+    async def _on_speech_start(self, session_id: str) -> None:
+        """Handle VAD speech start on the microphone input.
+
+        In client end-of-speech mode this opens the user's activity on the
+        Live API; it runs before the first speech chunk is sent.
+        """
+        if session_id not in self._active_sessions:
+            return
+
+        detected_at = time.monotonic()
+        logger.debug(f"User started speaking: {session_id}")
+
+        if (self.config.enable_interruption and self.config.enable_local_barge_in
+                and self._is_speaking(session_id)):
+            # Confirmed chunk by chunk in the capture path: the onset may
+            # be the assistant's own voice picked up by the microphone.
+            # Until then the response is ducked, so it yields at once.
+            gate = self._barge_in_gates.get(session_id)
+            if gate is None:
+                gate = self._barge_in_gates[session_id] = BargeInGate(
+                    min_speech_ms=self.config.barge_in_min_speech_ms,
+                    level_offset_db=self.config.barge_in_level_offset_db,
+                )
+            if not gate.pending:
+                gate.start(detected_at, self.audio_io_manager.output_level_db)
+                self.audio_io_manager.duck_playback(self.config.barge_in_duck_gain)
+
+        if session_id in self._stt_backends:
+            return
+        if self._client_end_of_speech:
+            await self.session_manager.send_activity_start(session_id)
+
+    async def _confirm_barge_in(
+        self, session_id: str, gate: BargeInGate, audio_data: bytes
+    ) -> None:
+        """Feed a microphone chunk to a pending barge-in candidate.
+
+        Interrupts the response once the gate confirms the user is really
+        speaking over it; the latency is still measured from the onset.
+        Playback ducked at the onset returns to full volume when the
+        candidate is rejected.
+        """
+        if not self._is_speaking(session_id):
+            gate.cancel()
+            self.audio_io_manager.restore_playback()
+            return
+
+        chunk_ms = len(audio_data) / 2 * 1000 / self.config.vertex_input_rate
+        detected_at = gate.update(
+            level_db(audio_data),
+            chunk_ms,
+            self.pipeline_manager.is_speech_active(session_id),
+        )
+        if detected_at is not None:
+            await self.interrupt_conversation(session_id, detected_at)
+            self.audio_io_manager.restore_playback()
+        elif not gate.pending:
+            logger.debug(f"Barge-in rejected as echo or noise: {session_id}")
+            self.audio_io_manager.restore_playback()
+
+    async def _on_speech_end(self, session_id: str) -> None:
+        """Handle VAD speech end on the microphone input.
+
+        In client end-of-speech mode the local end-pointer closes the turn
+        with an explicit activity end, so the response starts without the
+        server's own end-pointing delay. Otherwise silence after this point
+        is not uploaded, so tell the Live API the audio stream paused;
+        it would wait for trailing silence to close the user's turn.
+        """
+        if session_id not in self._active_sessions:
+            return
+
+        logger.debug(f"User stopped speaking: {session_id}")
+        backend = self._stt_backends.get(session_id)
+        if backend:
+            await backend.end_utterance()
+            return
+
+        if self._client_end_of_speech:
+            await self.session_manager.send_activity_end(session_id)
+        else:
+            await self.session_manager.send_audio_stream_end(session_id)
+
+        # The transcript so far is unlikely to change once the user stopped
+        # speaking, so the agent can start before the server closes the turn
+        pending = self.transcript_assembler.pending_text(session_id)
+        if pending:
+            await self.speculative_executor.speculate(session_id, pending)
+
+    async def _on_stt_transcript(self, session_id: str, result: TranscriptResult) -> None:
+        """Handle a hypothesis from a standalone STT backend.
+
+        Stable interim hypotheses may start a speculative agent run; each
+        final result is already a complete utterance and goes to the agent.
+        The backend awaits this callback, so the turn is handled in its own
+        task and recognition (of "stop", say) continues meanwhile.
+        """
+        if session_id not in self._active_sessions:
+            return
+
+        if not result.is_final:
+            logger.debug(f"Interim transcript ({result.stability:.2f}): {result.text}")
+            await self.speculative_executor.speculate(session_id, result.text, result.stability)
+            return
+
+        if result.text.strip():
+            task = asyncio.create_task(self._on_user_turn(session_id, result.text))
+            self._turn_tasks.add(task)
+            task.add_done_callback(self._turn_tasks.discard)
+
     async def _on_voice_error(self, session_id: str, error: Exception) -> None:
         """Handle voice session errors."""
         logger.error(f"Voice session error for {session_id}: {error}")
@@ -0,0 +1,185 @@
+"""Thread-to-asyncio handoff for captured audio blocks.
+
+The PortAudio callback thread pushes blocks into a bounded deque and wakes
+the event loop at most once per drain via ``loop.call_soon_threadsafe``.
+A single long-lived consumer task drains everything that is pending,
+drops blocks that have gone stale while the loop was busy, and delivers
+the rest to the async consumer as one batch.
+
+Producers that reuse a fixed set of buffers ask claim_slot() before
+overwriting one: blocks the consumer has popped but not yet copied are
+still being read, and audio is dropped rather than overwritten.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AudioHandoff:
+    """Coalescing single-consumer channel from an audio thread to asyncio."""
+
+    def __init__(
+        self,
+        consumer: Callable[[bytes], Awaitable[None]],
+        event_loop: asyncio.AbstractEventLoop,
+        max_pending_blocks: int = 30,
+        max_staleness_ms: int = 500,
+    ):
+        """Initialize handoff channel.
+
+        Args:
+            consumer: Async callable receiving each batch as one bytes object
+            event_loop: Event loop that runs the consumer task
+            max_pending_blocks: Blocks held before the oldest are dropped
+            max_staleness_ms: Blocks older than this when drained are dropped
+        """
+        self._consumer = consumer
+        self._loop = event_loop
+        self._max_staleness = max_staleness_ms / 1000
+        self._pending: Deque[Tuple[int, float, Any]] = deque(maxlen=max_pending_blocks)
+        self._next_seq = 0  # Written by the producer only
+        # Oldest block the consumer is copying (set by the consumer only)
+        self._busy_from: Optional[int] = None
+        self._wakeup = asyncio.Event()
+        self._wakeup_scheduled = False
+        self._is_running = False
+        self._consumer_future: Optional[asyncio.Future] = None
+
+        # Statistics
+        self.blocks_received = 0
+        self.blocks_delivered = 0
+        self.batches_delivered = 0
+        self.dropped_stale = 0
+        self.dropped_overflow = 0
+        self.dropped_in_use = 0
+        self.max_batch_blocks = 0
+
+    def start(self) -> None:
+        """Start the consumer task (callable from any thread)."""
+        if self._is_running:
+            return
+        self._is_running = True
+        self._consumer_future = asyncio.run_coroutine_threadsafe(
+            self._consume(), self._loop
+        )
+
+    def stop(self) -> None:
+        """Stop the consumer task and discard pending blocks."""
+        if not self._is_running:
+            return
+        self._is_running = False
+        self._pending.clear()
+        self._busy_from = None
+        if self._consumer_future:
+            self._consumer_future.cancel()
+            self._consumer_future = None
+
+    def claim_slot(self, num_slots: int) -> bool:
+        """Check from the producer thread whether a reused buffer is free.
+
+        A producer cycling through num_slots buffers overwrites the block
+        pushed num_slots pushes ago. That is only safe once the consumer
+        has copied it; otherwise the new block must be dropped.
+
+        Args:
+            num_slots: Number of buffers the producer cycles through
+
+        Returns:
+            True if the next buffer may be written and pushed
+        """
+        busy_from = self._busy_from
+        if busy_from is not None and self._next_seq - busy_from >= num_slots:
+            self.dropped_in_use += 1
+            return False
+        return True
+
+    def push(self, block: Any) -> None:
+        """Queue a block from the producer thread.
+
+        Args:
+            block: Bytes-like audio block; a reused buffer must stay valid
+                until claim_slot() allows overwriting it
+        """
+        if not self._is_running:
+            return
+
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped_overflow += 1
+        self._pending.append((self._next_seq, time.monotonic(), block))
+        self._next_seq += 1
+        self.blocks_received += 1
+
+        # One wakeup per drain, however many blocks arrive meanwhile
+        if not self._wakeup_scheduled:
+            self._wakeup_scheduled = True
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _consume(self) -> None:
+        """Drain pending blocks on each wakeup and deliver them as one batch."""
+        pending = self._pending
+        while self._is_running:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Clear before draining so a push racing with the drain
+            # schedules a fresh wakeup instead of being stranded
+            self._wakeup_scheduled = False
+
+            # Popped blocks stay in use until they are copied into the batch
+            try:
+                self._busy_from = pending[0][0]
+            except IndexError:
+                continue
+
+            cutoff = time.monotonic() - self._max_staleness
+            batch = []
+            try:
+                while pending:
+                    _, captured_at, block = pending.popleft()
+                    if captured_at < cutoff:
+                        self.dropped_stale += 1
+                        continue
+                    batch.append(block)
+                data = b"".join(batch)
+            finally:
+                self._busy_from = None
+
+            if not batch:
+                continue
+
+            self.batches_delivered += 1
+            self.blocks_delivered += len(batch)
+            self.max_batch_blocks = max(self.max_batch_blocks, len(batch))
+
+            try:
+                await self._consumer(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in audio handoff consumer: {e}", exc_info=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get handoff statistics.
+
+        Returns:
+            Dictionary of delivery and drop counters
+        """
+        return {
+            "blocks_received": self.blocks_received,
+            "blocks_delivered": self.blocks_delivered,
+            "batches_delivered": self.batches_delivered,
+            "avg_batch_blocks": (
+                self.blocks_delivered / self.batches_delivered
+                if self.batches_delivered
+                else 0.0
+            ),
+            "max_batch_blocks": self.max_batch_blocks,
+            "dropped_stale": self.dropped_stale,
+            "dropped_overflow": self.dropped_overflow,
+            "dropped_in_use": self.dropped_in_use,
+            "pending_blocks": len(self._pending),
+        }
@@ -9,20 +9,24 @@ Supports multi-rate audio system:
 
 import asyncio
 import logging
-import threading
-from typing import Optional, Callable
+import math
+import time
+from typing import Optional, Callable, Dict, Any, List
 import queue
 
 try:
     import sounddevice as sd
     import numpy as np
-    from scipy import signal
 except ImportError as e:
     raise ImportError(
         "Audio dependencies not installed. Please run: "
         "pip install sounddevice numpy scipy"
     ) from e
 
+from .audio_handoff import AudioHandoff
+from .resampler import StreamingResampler
+from .ring_buffer import AudioRingBuffer
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +43,10 @@ class AudioIOManager:
         dtype: str = 'int16',
         input_device: Optional[int] = None,
         output_device: Optional[int] = None,
+        playback_buffer_seconds: float = 60.0,
+        playback_target_buffer_ms: int = 60,
+        capture_buffer_blocks: int = 32,
+        capture_max_staleness_ms: int = 500,
     ):
         """Initialize audio I/O manager.
 
@@ -51,6 +59,12 @@ class AudioIOManager:
             dtype: Audio data type
             input_device: Sounddevice input device index (None for default)
             output_device: Sounddevice output device index (None for default)
+            playback_buffer_seconds: Capacity of the playback ring buffer in seconds
+            playback_target_buffer_ms: Audio to accumulate before (re)starting playback
+            capture_buffer_blocks: Number of reusable capture output buffers; a
+                memoryview handed downstream stays valid for this many blocks
+            capture_max_staleness_ms: Captured audio older than this when the
+                event loop gets to it is dropped instead of sent
         """
         self.hardware_sample_rate = hardware_sample_rate
         self.vertex_input_rate = vertex_input_rate
@@ -61,16 +75,64 @@ class AudioIOManager:
         self.input_device = input_device
         self.output_device = output_device
 
+        # Streaming resamplers (filter state carried across blocks)
+        self._input_resampler = StreamingResampler(
+            hardware_sample_rate, vertex_input_rate, max_block_size=block_size
+        )
+        self._output_resampler = StreamingResampler(
+            vertex_output_rate, hardware_sample_rate
+        )
+        self._output_gain = 1.0  # Applied to audio as it is queued
+
         # Audio capture
         self._input_stream: Optional[sd.InputStream] = None
-        self._audio_callback: Optional[Callable[[bytes], None]] = None
+        self._audio_callback: Optional[Callable[[memoryview], None]] = None
+        self._callback_is_async = False
         self._is_capturing = False
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._capture_handoff: Optional[AudioHandoff] = None
+        self._capture_max_staleness_ms = capture_max_staleness_ms
 
-        # Audio playback
-        self._audio_buffer = []  # Accumulate audio chunks for current turn
-        self._is_playing = False  # Flag to prevent overlapping playback
-        self._playback_thread: Optional[threading.Thread] = None
+        # Preallocated capture output slots, reused round-robin
+        self._capture_slots = np.zeros(
+            (capture_buffer_blocks, self._input_resampler.output_samples_for(block_size) + 1),
+            dtype=np.int16
+        )
+        self._capture_views = [memoryview(slot).cast('B') for slot in self._capture_slots]
+        self._capture_slot_index = 0
+
+        # Level metering (only computed while someone is subscribed)
+        self._level_callbacks: List[Callable[[float], None]] = []
+        self._level_scratch = np.zeros(block_size, dtype=np.float32)
+
+        # Audio playback: persistent callback stream fed from a SPSC ring buffer
+        self._output_stream: Optional[sd.OutputStream] = None
+        self._playback_buffer = AudioRingBuffer(
+            int(playback_buffer_seconds * hardware_sample_rate)
+        )
+        self._playback_block = np.zeros(block_size, dtype=np.int16)
+        # Mean power of the last block played, for echo-aware barge-in
+        self._output_scratch = np.zeros(block_size, dtype=np.float32)
+        self._output_power = 0.0
+        self._target_buffer_samples = int(
+            playback_target_buffer_ms * hardware_sample_rate / 1000
+        )
+        self._target_buffer_seconds = playback_target_buffer_ms / 1000
+        self._is_prebuffering = True  # Wait for target depth before playing
+        self._last_write_time = 0.0
+        self._underrun_count = 0
+
+        # Barge-in flush, performed by the output callback on request
+        self._flush_requested_at: Optional[float] = None
+        self._flush_done_at: Optional[float] = None
+        self._last_flush_latency_ms = 0.0
+        self._flush_count = 0
+
+        # Barge-in ducking, applied by the output callback to queued audio too
+        self._duck_gain = 1.0
+        self._duck_requested_at: Optional[float] = None
+        self._last_duck_latency_ms = 0.0
+        self._duck_count = 0
 
         logger.info(
             f"AudioIOManager initialized: "
@@ -81,11 +143,17 @@ class AudioIOManager:
 
     def start_capture(
         self,
-        audio_callback: Callable[[bytes], None],
+        audio_callback: Callable[[memoryview], None],
         event_loop: Optional[asyncio.AbstractEventLoop] = None
     ) -> None:
         """Start capturing audio from microphone.
 
+        Sync callbacks receive each block on the audio thread as a memoryview
+        over a reusable buffer (PCM int16 at vertex_input_rate), valid for
+        capture_buffer_blocks blocks. Async callbacks are fed by a single
+        consumer task that batches all blocks pending at each wakeup into
+        one bytes object and drops audio that went stale while the loop lagged.
+
         Args:
             audio_callback: Async callback to handle captured audio chunks (resampled to vertex_input_rate)
             event_loop: Event loop for async callback (defaults to current running loop)
@@ -95,7 +163,20 @@ class AudioIOManager:
             return
 
         self._audio_callback = audio_callback
+        self._callback_is_async = asyncio.iscoroutinefunction(audio_callback)
         self._event_loop = event_loop or asyncio.get_running_loop()
+        self._input_resampler.reset()
+
+        if self._callback_is_async:
+            self._capture_handoff = AudioHandoff(
+                audio_callback,
+                self._event_loop,
+                # Keep every pending memoryview within the live slot window
+                max_pending_blocks=max(1, len(self._capture_slots) - 2),
+                max_staleness_ms=self._capture_max_staleness_ms
+            )
+            self._capture_handoff.start()
+
         self._is_capturing = True
 
         logger.info(f"Starting audio capture from device {self.input_device or 'default'}")
@@ -124,10 +205,35 @@ class AudioIOManager:
             self._input_stream.close()
             self._input_stream = None
 
+        if self._capture_handoff:
+            logger.info(f"Capture handoff stats: {self._capture_handoff.get_stats()}")
+            self._capture_handoff.stop()
+            self._capture_handoff = None
+
         logger.info("Audio capture stopped")
 
+    def add_level_callback(self, callback: Callable[[float], None]) -> None:
+        """Subscribe to input level updates.
+
+        The callback runs on the audio thread once per captured block with
+        the mean absolute amplitude normalized to [0, 1]. It must be cheap.
+
+        Args:
+            callback: Function receiving the block level
+        """
+        self._level_callbacks.append(callback)
+
+    def remove_level_callback(self, callback: Callable[[float], None]) -> None:
+        """Unsubscribe from input level updates."""
+        if callback in self._level_callbacks:
+            self._level_callbacks.remove(callback)
+
     def play_audio(self, data: bytes) -> None:
-        """Play back received audio with resampling and buffering.
+        """Queue received audio for playback with resampling.
+
+        Resampled blocks are written straight into the playback ring buffer;
+        the output stream callback pulls from it, so chunks play back-to-back
+        without waiting for earlier audio to finish.
 
         Args:
             data: Audio data from Vertex AI (PCM int16 at vertex_output_rate)
@@ -136,79 +242,264 @@ class AudioIOManager:
             # Convert bytes to numpy array (Vertex AI sends at 24kHz)
             audio_np = np.frombuffer(data, dtype=np.int16)
 
-            # Resample from vertex_output_rate to hardware_sample_rate
-            num_samples_output = int(
-                len(audio_np) * self.hardware_sample_rate / self.vertex_output_rate
-            )
-            resampled = signal.resample(audio_np, num_samples_output)
-
-            # Convert back to int16
-            resampled_int16 = resampled.astype(np.int16)
+            # Resample from vertex_output_rate to hardware_sample_rate,
+            # block by block so filter state carries across chunks
+            resampler = self._output_resampler
+            written = 0
+            for start in range(0, len(audio_np), resampler.max_block_size):
+                block = resampler.process(audio_np[start:start + resampler.max_block_size])
+                written += self._playback_buffer.write(self._apply_gain(block))
+            self._last_write_time = time.monotonic()
 
             logger.debug(
-                f"Resampled audio: {len(audio_np)} @ {self.vertex_output_rate}Hz -> "
-                f"{len(resampled_int16)} @ {self.hardware_sample_rate}Hz samples"
+                f"Queued audio: {len(audio_np)} @ {self.vertex_output_rate}Hz -> "
+                f"{written} @ {self.hardware_sample_rate}Hz samples "
+                f"({self._playback_buffer.available()} buffered)"
             )
 
-            # Accumulate chunks in buffer
-            self._audio_buffer.append(resampled_int16)
-
-            # If we're not currently playing, start playback in a thread
-            if not self._is_playing:
-                self._is_playing = True
-                self._playback_thread = threading.Thread(
-                    target=self._play_buffered_audio,
-                    daemon=True
-                )
-                self._playback_thread.start()
+            self._ensure_output_stream()
 
         except Exception as e:
             logger.error(f"Error processing audio for playback: {e}", exc_info=True)
 
+    def play_prepared_audio(self, samples: np.ndarray) -> None:
+        """Queue audio that is already at the hardware sample rate.
+
+        Skips decoding and resampling, e.g. for pre-synthesized phrases.
+
+        Args:
+            samples: int16 PCM samples at hardware_sample_rate
+        """
+        try:
+            written = self._playback_buffer.write(self._apply_gain(samples))
+            self._last_write_time = time.monotonic()
+            logger.debug(f"Queued {written} prepared samples ({self._playback_buffer.available()} buffered)")
+            self._ensure_output_stream()
+        except Exception as e:
+            logger.error(f"Error queueing prepared audio: {e}", exc_info=True)
+
+    def set_output_gain(self, gain: float) -> float:
+        """Set the playback volume for audio queued from now on.
+
+        Args:
+            gain: Linear gain (1.0 is unchanged), clamped to 0.1-4.0
+
+        Returns:
+            The gain in effect
+        """
+        self._output_gain = min(4.0, max(0.1, gain))
+        logger.info(f"Output gain set to {self._output_gain:.2f}")
+        return self._output_gain
+
+    @property
+    def output_gain(self) -> float:
+        """Linear gain applied to queued playback audio."""
+        return self._output_gain
+
+    def _apply_gain(self, samples: np.ndarray) -> np.ndarray:
+        """Scale samples by the output gain, clipping to int16."""
+        if self._output_gain == 1.0:
+            return samples
+        scaled = samples * np.float32(self._output_gain)
+        return np.clip(scaled, -32768, 32767).astype(np.int16)
+
+    def flush_playback(self) -> float:
+        """Drop queued audio without stopping the output stream (barge-in).
+
+        The output callback discards the ring buffer at its next block, so
+        the speaker goes quiet within one block plus the device latency and
+        the stream stays open for the next response.
+
+        Returns:
+            Milliseconds of queued audio that will not be played
+        """
+        discarded_ms = self._playback_buffer.available() * 1000 / self.hardware_sample_rate
+        self._output_resampler.reset()
+        self._flush_count += 1
+
+        if self._output_stream and self._output_stream.active:
+            self._flush_done_at = None
+            self._flush_requested_at = time.monotonic()
+        else:
+            # No consumer running: clear directly
+            self._playback_buffer.clear()
+            self._flush_requested_at = None
+            self._flush_done_at = time.monotonic()
+            self._last_flush_latency_ms = 0.0
+            self._is_prebuffering = True
+
+        logger.debug(f"Flushing {discarded_ms:.0f}ms of queued playback")
+        return discarded_ms
+
+    def duck_playback(self, gain: float) -> None:
+        """Attenuate playback, including audio already queued, until restored.
+
+        Lets a possible barge-in take effect at once while it is confirmed;
+        the output callback applies the gain from its next block on.
+
+        Args:
+            gain: Linear gain applied to the played audio
+        """
+        if self._duck_gain == 1.0:
+            self._duck_count += 1
+            self._duck_requested_at = time.monotonic()
+        self._duck_gain = gain
+
+    def restore_playback(self) -> None:
+        """Undo duck_playback()."""
+        self._duck_gain = 1.0
+        self._duck_requested_at = None
+
+    @property
+    def is_ducked(self) -> bool:
+        """Whether playback is attenuated by duck_playback()."""
+        return self._duck_gain != 1.0
+
+    async def wait_for_flush(self, timeout: float = 0.1) -> Optional[float]:
+        """Wait until a requested flush has been performed by the output callback.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Monotonic time the flush completed, or None on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self._flush_requested_at is not None and time.monotonic() < deadline:
+            await asyncio.sleep(0.001)
+        return self._flush_done_at
+
+    @property
+    def output_latency_ms(self) -> float:
+        """Latency of the output device (audio already handed to the hardware)."""
+        if self._output_stream is None:
+            return 0.0
+        return float(self._output_stream.latency) * 1000
+
+    @property
+    def output_level_db(self) -> float:
+        """Level of the audio currently played (dBFS, -100 when silent)."""
+        return 10.0 * math.log10(self._output_power / (32768.0 * 32768.0) + 1e-10)
+
     def stop_playback(self) -> None:
         """Stop audio playback and clear buffer."""
-        self._is_playing = False
-        self._audio_buffer = []
+        if self._output_stream and self._output_stream.active:
+            # abort() discards audio already queued in the device buffers
+            self._output_stream.abort()
 
-        # Wait for playback thread to finish
-        if self._playback_thread and self._playback_thread.is_alive():
-            self._playback_thread.join(timeout=1.0)
+        self._playback_buffer.clear()
+        self._output_resampler.reset()
+        self._is_prebuffering = True
+        self._output_power = 0.0
 
         logger.info("Audio playback stopped")
 
-    def _play_buffered_audio(self) -> None:
-        """Play all accumulated audio chunks in a separate thread.
+    def get_playback_stats(self) -> Dict[str, Any]:
+        """Get playback buffer statistics.
 
-        This runs in a background thread to avoid blocking the async event loop.
-        It continuously plays accumulated chunks until playback is stopped.
+        Returns:
+            Dictionary with buffer depth and underrun/overrun counters
         """
-        try:
-            while self._is_playing or len(self._audio_buffer) > 0:
-                if len(self._audio_buffer) > 0:
-                    # Concatenate all buffered chunks
-                    full_audio = np.concatenate(self._audio_buffer)
-                    duration = len(full_audio) / self.hardware_sample_rate
-
-                    logger.info(
-                        f"Playing {len(full_audio)} samples ({duration:.2f}s) "
-                        f"@ {self.hardware_sample_rate}Hz"
-                    )
-
-                    # Clear buffer before playing
-                    self._audio_buffer = []
-
-                    # Play the full audio (blocking in this thread)
-                    sd.play(full_audio, self.hardware_sample_rate, device=self.output_device)
-                    sd.wait()  # Wait for playback to complete
-                else:
-                    # Small delay to avoid busy waiting
-                    import time
-                    time.sleep(0.01)
+        buffered = self._playback_buffer.available()
+        return {
+            'buffered_samples': buffered,
+            'buffered_ms': buffered * 1000 / self.hardware_sample_rate,
+            'target_buffer_ms': self._target_buffer_seconds * 1000,
+            'underrun_count': self._underrun_count,
+            'overrun_count': self._playback_buffer.overrun_count,
+            'dropped_samples': self._playback_buffer.dropped_samples,
+            'flush_count': self._flush_count,
+            'last_flush_latency_ms': self._last_flush_latency_ms,
+            'duck_count': self._duck_count,
+            'last_duck_latency_ms': self._last_duck_latency_ms,
+            'output_latency_ms': self.output_latency_ms,
+            'is_active': bool(self._output_stream and self._output_stream.active),
+        }
+
+    def _ensure_output_stream(self) -> None:
+        """Open the persistent output stream on first use and (re)start it."""
+        if self._output_stream is None:
+            logger.info(f"Opening audio output stream on device {self.output_device or 'default'}")
+            self._output_stream = sd.OutputStream(
+                device=self.output_device,
+                samplerate=self.hardware_sample_rate,
+                channels=self.channels,
+                dtype=self.dtype,
+                blocksize=self.block_size,
+                callback=self._audio_output_callback
+            )
 
-        except Exception as e:
-            logger.error(f"Error playing buffered audio: {e}", exc_info=True)
-        finally:
-            self._is_playing = False
+        if not self._output_stream.active:
+            self._is_prebuffering = True
+            self._output_stream.start()
+
+    def _audio_output_callback(self, outdata, frames, time_info, status) -> None:
+        """Callback for sounddevice output pulling from the ring buffer.
+
+        This runs in the PortAudio thread. Playback (re)starts once the
+        target buffer depth is reached, or once the producer has gone quiet
+        so the tail of an utterance is not held back.
+
+        Args:
+            outdata: Output buffer to fill
+            frames: Number of frames requested
+            time_info: Timestamp info
+            status: Status flags
+        """
+        if status.output_underflow:
+            self._underrun_count += 1
+
+        ring = self._playback_buffer
+
+        requested_at = self._flush_requested_at
+        if requested_at is not None:
+            # Barge-in: drop queued audio and output silence from now on
+            ring.discard_available()
+            now = time.monotonic()
+            self._last_flush_latency_ms = (now - requested_at) * 1000
+            self._flush_done_at = now
+            self._flush_requested_at = None
+            self._is_prebuffering = True
+            self._output_power = 0.0
+            outdata.fill(0)
+            return
+
+        producer_idle = time.monotonic() - self._last_write_time >= self._target_buffer_seconds
+
+        if self._is_prebuffering:
+            if ring.available() < self._target_buffer_samples and not producer_idle:
+                self._output_power = 0.0
+                outdata.fill(0)
+                return
+            self._is_prebuffering = False
+
+        if frames > len(self._playback_block):
+            self._playback_block = np.zeros(frames, dtype=np.int16)
+            self._output_scratch = np.zeros(frames, dtype=np.float32)
+        block = self._playback_block[:frames]
+        count = ring.read_into(block)
+        scratch = self._output_scratch[:frames]
+
+        duck_gain = self._duck_gain
+        if duck_gain != 1.0:
+            np.multiply(block, np.float32(duck_gain), out=scratch)
+            np.copyto(block, scratch, casting="unsafe")
+            duck_requested_at = self._duck_requested_at
+            if duck_requested_at is not None:
+                now = time.monotonic()
+                self._last_duck_latency_ms = (now - duck_requested_at) * 1000
+                self._duck_requested_at = None
+        outdata[:] = block[:, np.newaxis]
+
+        np.square(block, out=scratch, dtype=np.float32)
+        self._output_power = float(scratch.mean())
+
+        if count < frames:
+            # Ran dry while audio is still arriving: genuine underrun.
+            # Re-prime to the target depth to restore constant latency.
+            if not producer_idle:
+                self._underrun_count += 1
+            self._is_prebuffering = True
 
     def _audio_input_callback(self, indata, frames, time, status) -> None:
         """Callback for sounddevice input with resampling.
@@ -230,36 +521,34 @@ class AudioIOManager:
             return
 
         try:
-            # Convert to numpy array for resampling
-            audio_np = indata.flatten()
+            # Mono view of the device buffer (no copy)
+            audio_np = indata[:, 0]
 
-            # Log audio level for debugging
-            audio_level = np.abs(audio_np).mean()
+            if self._level_callbacks:
+                scratch = self._level_scratch[:frames]
+                np.abs(audio_np, out=scratch, dtype=np.float32)
+                audio_level = float(scratch.mean()) / 32768.0
+                for level_callback in self._level_callbacks:
+                    level_callback(audio_level)
+
+            # The next slot may still be copied by the handoff consumer
+            handoff = self._capture_handoff
+            if handoff and not handoff.claim_slot(len(self._capture_slots)):
+                return
 
             # Resample from hardware_sample_rate to vertex_input_rate
-            num_samples_output = int(
-                len(audio_np) * self.vertex_input_rate / self.hardware_sample_rate
+            # into the next reusable capture slot
+            slot_index = self._capture_slot_index
+            self._capture_slot_index = (slot_index + 1) % len(self._capture_slots)
+            resampled_int16 = self._input_resampler.process(
+                audio_np, out=self._capture_slots[slot_index]
             )
-            resampled = signal.resample(audio_np, num_samples_output)
-
-            # Convert back to int16 and then to bytes
-            resampled_int16 = resampled.astype(np.int16)
-            data = resampled_int16.tobytes()
-
-            if audio_level > 0.01:  # Only log if there's significant audio
-                logger.debug(
-                    f"Audio captured: {frames} frames @ {self.hardware_sample_rate}Hz -> "
-                    f"{len(resampled_int16)} samples @ {self.vertex_input_rate}Hz, "
-                    f"level: {audio_level:.4f}"
-                )
+            data = self._capture_views[slot_index][:resampled_int16.nbytes]
 
             # Send resampled audio to async callback
-            # If callback is async, schedule it on the event loop
-            if asyncio.iscoroutinefunction(self._audio_callback):
-                asyncio.run_coroutine_threadsafe(
-                    self._audio_callback(data),
-                    self._event_loop
-                )
+            # If callback is async, hand off to the event loop consumer task
+            if self._capture_handoff:
+                self._capture_handoff.push(data)
             else:
                 # If callback is sync, call it directly
                 self._audio_callback(data)
@@ -267,12 +556,20 @@ class AudioIOManager:
         except Exception as e:
             logger.error(f"Error in audio input callback: {e}", exc_info=True)
 
+    def get_capture_stats(self) -> Optional[Dict[str, Any]]:
+        """Get capture handoff statistics, if an async consumer is active."""
+        return self._capture_handoff.get_stats() if self._capture_handoff else None
+
     def shutdown(self) -> None:
         """Shutdown audio I/O manager and cleanup resources."""
         logger.info("Shutting down AudioIOManager")
         self.stop_capture()
         self.stop_playback()
 
+        if self._output_stream:
+            self._output_stream.close()
+            self._output_stream = None
+
     def __enter__(self):
         """Context manager entry."""
         return self
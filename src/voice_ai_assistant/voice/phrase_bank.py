@@ -0,0 +1,229 @@
+"""Bank of pre-synthesized short phrases.
+
+Acknowledgements, status prompts and apologies are needed exactly when
+latency matters most: right after the user stops speaking or while a
+tool runs. The phrase bank synthesizes them once in the background,
+resamples them to the hardware rate and keeps the PCM ready, so they
+can be queued for playback without a network round-trip or resampling.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "Audio dependencies not installed. Please run: " "pip install numpy scipy"
+    ) from e
+
+from .resampler import StreamingResampler
+from .tts_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PHRASES: Dict[str, str] = {
+    "acknowledge": "Let me check that.",
+    "ok": "Okay.",
+    "looking": "Looking at the repository now.",
+    "working": "Working on it.",
+    "still_working": "Still working on it, one moment.",
+    "almost_done": "Almost there.",
+    "error": "Sorry, something went wrong. Could you try that again?",
+    "not_understood": "Sorry, I didn't catch that.",
+}
+
+
+class PhraseBank:
+    """Pre-synthesized phrases held as PCM at the hardware sample rate."""
+
+    def __init__(
+        self,
+        tts_manager: Any,
+        hardware_sample_rate: int = 48000,
+        source_sample_rate: int = 24000,
+        phrases: Optional[Dict[str, str]] = None,
+    ):
+        """Initialize phrase bank.
+
+        Args:
+            tts_manager: TTSManager used to synthesize the phrases
+            hardware_sample_rate: Output device sample rate
+            source_sample_rate: Sample rate of synthesized audio
+            phrases: Phrase name to text (defaults to DEFAULT_PHRASES)
+        """
+        self.tts_manager = tts_manager
+        self.hardware_sample_rate = hardware_sample_rate
+        self.source_sample_rate = source_sample_rate
+        self._phrases = dict(phrases if phrases is not None else DEFAULT_PHRASES)
+
+        self._entries: Dict[str, np.ndarray] = {}
+        self._texts: Dict[str, str] = {}  # Normalized text -> phrase name
+        self._loaded_signature: Optional[Tuple] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.loads = 0
+        self.load_failures = 0
+        self.last_load_ms = 0.0
+        self.plays = 0
+        self.misses = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether phrases have been loaded at least once."""
+        return self._loaded_signature is not None
+
+    def get(self, name: str) -> Optional[np.ndarray]:
+        """Get a phrase's PCM samples at the hardware rate.
+
+        Args:
+            name: Phrase name
+
+        Returns:
+            int16 samples, or None if the phrase is not loaded
+        """
+        samples = self._entries.get(name)
+        if samples is None:
+            self.misses += 1
+        else:
+            self.plays += 1
+        return samples
+
+    def text(self, name: str) -> Optional[str]:
+        """Get the configured text of a phrase."""
+        return self._phrases.get(name)
+
+    def find(self, text: str) -> Optional[str]:
+        """Find the loaded phrase whose text matches (whitespace-insensitive)."""
+        return self._texts.get(normalize_text(text))
+
+    def set_phrases(self, phrases: Dict[str, str]) -> None:
+        """Replace the phrase list and refresh in the background.
+
+        Previously loaded phrases stay playable until the refresh completes.
+        """
+        self._phrases = dict(phrases)
+        self.refresh_if_changed()
+
+    def refresh_if_changed(self) -> bool:
+        """Start a background refresh if the voice, rate or phrases changed.
+
+        Returns:
+            True if a refresh was scheduled
+        """
+        if self._signature() == self._loaded_signature:
+            return False
+        self.schedule_refresh()
+        return True
+
+    def schedule_refresh(self) -> asyncio.Task:
+        """Start (or restart) loading the phrases in the background."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = asyncio.create_task(self._refresh())
+        return self._refresh_task
+
+    async def load(self) -> int:
+        """Synthesize and resample every phrase.
+
+        The new entries replace the old ones in one step once all are ready.
+
+        Returns:
+            Number of phrases loaded
+        """
+        signature = self._signature()
+        phrases = dict(self._phrases)
+        started_at = time.monotonic()
+
+        names = list(phrases)
+        results = await asyncio.gather(
+            *(self.tts_manager.synthesize(phrases[name]) for name in names),
+            return_exceptions=True,
+        )
+
+        entries: Dict[str, np.ndarray] = {}
+        for name, audio in zip(names, results):
+            if isinstance(audio, BaseException) or not audio:
+                self.load_failures += 1
+                logger.warning(f"Could not synthesize phrase '{name}': {audio}")
+                continue
+            entries[name] = self._to_hardware_rate(audio)
+
+        self._entries = entries
+        self._texts = {normalize_text(phrases[name]): name for name in entries}
+        self._loaded_signature = signature
+        self.loads += 1
+        self.last_load_ms = (time.monotonic() - started_at) * 1000
+
+        logger.info(
+            f"Phrase bank loaded {len(entries)}/{len(names)} phrases "
+            f"in {self.last_load_ms:.0f}ms"
+        )
+        return len(entries)
+
+    async def close(self) -> None:
+        """Cancel any background refresh."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _refresh(self) -> None:
+        """Background load that logs instead of raising."""
+        try:
+            await self.load()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Phrase bank refresh failed: {e}")
+
+    def _signature(self) -> Tuple:
+        """Everything that changes the loaded audio."""
+        return (
+            getattr(self.tts_manager, "voice_signature", None),
+            self.hardware_sample_rate,
+            self.source_sample_rate,
+            tuple(sorted(self._phrases.items())),
+        )
+
+    def _to_hardware_rate(self, audio: bytes) -> np.ndarray:
+        """Resample a synthesized clip to the hardware rate, with the filter tail."""
+        samples = np.frombuffer(audio[: len(audio) - len(audio) % 2], dtype=np.int16)
+        if self.source_sample_rate == self.hardware_sample_rate:
+            return samples.copy()
+
+        resampler = StreamingResampler(
+            self.source_sample_rate, self.hardware_sample_rate
+        )
+        block_size = resampler.max_block_size
+        tail = np.zeros(resampler.taps_per_phase, dtype=np.int16)
+
+        blocks = []
+        for start in range(0, len(samples), block_size):
+            blocks.append(resampler.process(samples[start : start + block_size]).copy())
+        blocks.append(resampler.process(tail).copy())
+        return np.concatenate(blocks)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get phrase bank statistics.
+
+        Returns:
+            Dictionary of load and usage counters
+        """
+        return {
+            "ready": self.is_ready,
+            "phrases": len(self._phrases),
+            "loaded": len(self._entries),
+            "loaded_bytes": sum(samples.nbytes for samples in self._entries.values()),
+            "loads": self.loads,
+            "load_failures": self.load_failures,
+            "last_load_ms": self.last_load_ms,
+            "plays": self.plays,
+            "misses": self.misses,
+            "refreshing": bool(self._refresh_task and not self._refresh_task.done()),
+        }
@@ -0,0 +1,122 @@
+"""Single-producer/single-consumer ring buffer for int16 PCM audio.
+
+Used to hand audio from the asyncio thread (producer) to the PortAudio
+callback thread (consumer) without locks: the producer only advances the
+write index and the consumer only advances the read index. Both indices
+grow monotonically, so the fill level is always ``write - read``.
+"""
+
+import logging
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "Audio dependencies not installed. Please run: " "pip install numpy"
+    ) from e
+
+logger = logging.getLogger(__name__)
+
+
+class AudioRingBuffer:
+    """Preallocated lock-free SPSC ring buffer of int16 samples."""
+
+    def __init__(self, capacity: int):
+        """Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of samples held at once
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=np.int16)
+        self._write_index = 0  # Advanced by producer only
+        self._read_index = 0  # Advanced by consumer only
+
+        # Producer-side statistics
+        self.overrun_count = 0
+        self.dropped_samples = 0
+
+    def available(self) -> int:
+        """Number of samples ready to be read."""
+        return self._write_index - self._read_index
+
+    def free_space(self) -> int:
+        """Number of samples that can be written without overrun."""
+        return self.capacity - self.available()
+
+    def write(self, samples: np.ndarray) -> int:
+        """Copy samples into the buffer (producer side).
+
+        Samples that do not fit are dropped and counted as an overrun.
+
+        Args:
+            samples: 1-D int16 array
+
+        Returns:
+            Number of samples written
+        """
+        count = min(len(samples), self.free_space())
+        if count < len(samples):
+            self.overrun_count += 1
+            self.dropped_samples += len(samples) - count
+
+        if count:
+            start = self._write_index % self.capacity
+            first = min(count, self.capacity - start)
+            self._buffer[start : start + first] = samples[:first]
+            if first < count:
+                self._buffer[: count - first] = samples[first:count]
+            # Publish only after the data is in place
+            self._write_index += count
+
+        return count
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Copy available samples into out (consumer side).
+
+        Any part of out that cannot be filled is zeroed (silence).
+
+        Args:
+            out: 1-D int16 destination array
+
+        Returns:
+            Number of real samples copied
+        """
+        count = min(len(out), self.available())
+
+        if count:
+            start = self._read_index % self.capacity
+            first = min(count, self.capacity - start)
+            out[:first] = self._buffer[start : start + first]
+            if first < count:
+                out[first:count] = self._buffer[: count - first]
+            self._read_index += count
+
+        if count < len(out):
+            out[count:] = 0
+
+        return count
+
+    def discard_available(self) -> int:
+        """Drop everything written so far (consumer side).
+
+        Safe to call from the consumer while the producer keeps writing.
+
+        Returns:
+            Number of samples discarded
+        """
+        write_index = self._write_index
+        discarded = write_index - self._read_index
+        self._read_index = write_index
+        return discarded
+
+    def clear(self) -> None:
+        """Discard all buffered samples.
+
+        Must only be called while the consumer is not running
+        (e.g. after the output stream has been stopped or aborted).
+        """
+        self._read_index = self._write_index
@@ -54,7 +54,9 @@ class VoiceSessionManager:
                  model: str = "gemini-2.5-flash-native-audio-preview-09-2025",
                  session_timeout_minutes: int = 30,
                  max_reconnect_attempts: int = 3,
-                 tools: Optional[List[Dict[str, Any]]] = None):
+                 tools: Optional[List[Dict[str, Any]]] = None,
+                 automatic_activity_detection: bool = True,
+                 response_mode: str = "audio"):
         """Initialize session manager.
 
         Args:
@@ -64,6 +66,9 @@ class VoiceSessionManager:
             session_timeout_minutes: Session timeout in minutes
             max_reconnect_attempts: Maximum reconnection attempts
             tools: List of tool declarations for function calling
+            automatic_activity_detection: Use server-side end-pointing; when
+                False, callers send explicit activity start/end markers
+            response_mode: "audio" or "transcription" (speech-to-text only)
         """
         self.auth_manager = VertexAuthManager(project_id)
         self.region = region
@@ -71,6 +76,8 @@ class VoiceSessionManager:
         self.session_timeout_minutes = session_timeout_minutes
         self.max_reconnect_attempts = max_reconnect_attempts
         self.tools = tools or []
+        self.automatic_activity_detection = automatic_activity_detection
+        self.response_mode = response_mode
 
         # Active sessions
         self._sessions: Dict[str, VertexLiveClient] = {}
@@ -85,7 +92,10 @@ class VoiceSessionManager:
         self._on_session_ended: Optional[Callable[[str], None]] = None
         self._on_audio_response: Optional[Callable[[str, bytes], None]] = None
         self._on_text_response: Optional[Callable[[str, str], None]] = None
+        self._on_input_transcription: Optional[Callable[[str, str], None]] = None
+        self._on_turn_event: Optional[Callable[[str, str], None]] = None
         self._on_tool_call: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+        self._on_tool_call_cancellation: Optional[Callable[[str, List[str]], None]] = None
         self._on_error: Optional[Callable[[str, Exception], None]] = None
         
     async def start(self) -> None:
@@ -140,7 +150,9 @@ class VoiceSessionManager:
                 region=self.region,
                 model=self.model,
                 auth_manager=self.auth_manager,
-                tools=self.tools
+                tools=self.tools,
+                automatic_activity_detection=self.automatic_activity_detection,
+                response_mode=self.response_mode
             )
 
             # Set up callbacks
@@ -150,9 +162,18 @@ class VoiceSessionManager:
             client.set_text_response_callback(
                 lambda text: self._handle_text_response(session_id, text)
             )
+            client.set_input_transcription_callback(
+                lambda text: self._handle_input_transcription(session_id, text)
+            )
+            client.set_turn_event_callback(
+                lambda event: self._handle_turn_event(session_id, event)
+            )
             client.set_tool_call_callback(
                 lambda function_calls: self._handle_tool_call(session_id, function_calls)
             )
+            client.set_tool_call_cancellation_callback(
+                lambda call_ids: self._handle_tool_call_cancellation(session_id, call_ids)
+            )
             client.set_error_callback(
                 lambda error: self._handle_error(session_id, error)
             )
@@ -241,6 +262,68 @@ class VoiceSessionManager:
             logger.error(f"Failed to send audio chunk to session {session_id}: {e}")
             await self._handle_connection_error(session_id, e)
             
+    async def send_audio_stream_end(self, session_id: str) -> None:
+        """Signal end of the audio stream for a session.
+
+        Args:
+            session_id: Target session
+
+        Raises:
+            VertexLiveAPIError: If session not found or send fails
+        """
+        client = self._get_session_client(session_id)
+        state = self._session_states[session_id]
+
+        try:
+            await client.send_audio_stream_end()
+            state.update_activity()
+
+        except Exception as e:
+            logger.error(f"Failed to send audio stream end to session {session_id}: {e}")
+            await self._handle_connection_error(session_id, e)
+
+    async def send_activity_start(self, session_id: str) -> None:
+        """Mark the start of user speech for a session.
+
+        Args:
+            session_id: Target session
+
+        Raises:
+            VertexLiveAPIError: If session not found or send fails
+        """
+        client = self._get_session_client(session_id)
+        state = self._session_states[session_id]
+
+        try:
+            await client.send_activity_start()
+            state.is_listening = True
+            state.update_activity()
+
+        except Exception as e:
+            logger.error(f"Failed to send activity start to session {session_id}: {e}")
+            await self._handle_connection_error(session_id, e)
+
+    async def send_activity_end(self, session_id: str) -> None:
+        """Mark the end of user speech for a session.
+
+        Args:
+            session_id: Target session
+
+        Raises:
+            VertexLiveAPIError: If session not found or send fails
+        """
+        client = self._get_session_client(session_id)
+        state = self._session_states[session_id]
+
+        try:
+            await client.send_activity_end()
+            state.is_listening = False
+            state.update_activity()
+
+        except Exception as e:
+            logger.error(f"Failed to send activity end to session {session_id}: {e}")
+            await self._handle_connection_error(session_id, e)
+
     async def send_text_message(self, session_id: str, text: str) -> None:
         """Send text message to a session.
 
@@ -423,6 +506,42 @@ class VoiceSessionManager:
                 # Call sync callback
                 self._on_text_response(session_id, text)
 
+    def _handle_input_transcription(self, session_id: str, text: str) -> None:
+        """Handle transcription of the user's speech from session.
+
+        Args:
+            session_id: Session ID
+            text: Transcript fragment
+        """
+        if session_id in self._session_states:
+            state = self._session_states[session_id]
+            state.update_activity()
+
+        if self._on_input_transcription:
+            # Check if callback is async
+            if asyncio.iscoroutinefunction(self._on_input_transcription):
+                # Schedule async callback
+                asyncio.create_task(self._on_input_transcription(session_id, text))
+            else:
+                # Call sync callback
+                self._on_input_transcription(session_id, text)
+
+    def _handle_turn_event(self, session_id: str, event: str) -> None:
+        """Handle turn signal from session.
+
+        Args:
+            session_id: Session ID
+            event: "interrupted", "generation_complete" or "turn_complete"
+        """
+        if self._on_turn_event:
+            # Check if callback is async
+            if asyncio.iscoroutinefunction(self._on_turn_event):
+                # Schedule async callback
+                asyncio.create_task(self._on_turn_event(session_id, event))
+            else:
+                # Call sync callback
+                self._on_turn_event(session_id, event)
+
     def _handle_tool_call(self, session_id: str, function_calls: List[Dict[str, Any]]) -> None:
         """Handle tool/function call request from session.
 
@@ -443,6 +562,22 @@ class VoiceSessionManager:
                 # Call sync callback
                 self._on_tool_call(session_id, function_calls)
 
+    def _handle_tool_call_cancellation(self, session_id: str, call_ids: List[str]) -> None:
+        """Handle cancellation of tool/function calls from session.
+
+        Args:
+            session_id: Session ID
+            call_ids: IDs of the function calls Gemini no longer needs
+        """
+        if self._on_tool_call_cancellation:
+            # Check if callback is async
+            if asyncio.iscoroutinefunction(self._on_tool_call_cancellation):
+                # Schedule async callback
+                asyncio.create_task(self._on_tool_call_cancellation(session_id, call_ids))
+            else:
+                # Call sync callback
+                self._on_tool_call_cancellation(session_id, call_ids)
+
     def _handle_error(self, session_id: str, error: Exception) -> None:
         """Handle error from session.
         
@@ -498,10 +633,22 @@ class VoiceSessionManager:
         """Set callback for text response events."""
         self._on_text_response = callback
 
+    def set_input_transcription_callback(self, callback: Callable[[str, str], None]) -> None:
+        """Set callback for input transcription events."""
+        self._on_input_transcription = callback
+
+    def set_turn_event_callback(self, callback: Callable[[str, str], None]) -> None:
+        """Set callback for turn signal events."""
+        self._on_turn_event = callback
+
     def set_tool_call_callback(self, callback: Callable[[str, List[Dict[str, Any]]], None]) -> None:
         """Set callback for tool/function call request events."""
         self._on_tool_call = callback
 
+    def set_tool_call_cancellation_callback(self, callback: Callable[[str, List[str]], None]) -> None:
+        """Set callback for tool/function call cancellation events."""
+        self._on_tool_call_cancellation = callback
+
     def set_error_callback(self, callback: Callable[[str, Exception], None]) -> None:
         """Set callback for error events."""
         self._on_error = callback
\ No newline at end of file
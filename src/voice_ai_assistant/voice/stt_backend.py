@@ -0,0 +1,481 @@
+"""Pluggable speech-to-text backends.
+
+The orchestrator normally gets transcripts from the Gemini Live session.
+The backends in this module are an alternative. They receive the same
+16-bit PCM microphone audio and report interim and final hypotheses
+through a transcript callback:
+- GoogleSpeechSTTBackend: Cloud Speech-to-Text streaming recognition
+  with interim results and single-utterance end-pointing
+- FakeSTTBackend: deterministic scripted transcripts for tests
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+try:
+    from google.cloud import speech
+except ImportError:
+    speech = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TranscriptResult:
+    """A recognition hypothesis for the current utterance."""
+
+    text: str
+    is_final: bool = False
+    stability: float = 0.0  # Likelihood an interim result will not change
+    confidence: float = 0.0  # Only populated for final results
+    received_at: float = field(default_factory=time.monotonic)
+
+
+class STTBackend(ABC):
+    """Base class for streaming speech-to-text backends.
+
+    Audio is pushed with send_audio(); hypotheses are delivered to the
+    transcript callback (sync or async) as they arrive.
+    """
+
+    name = "base"
+
+    def __init__(self, sample_rate: int = 16000):
+        """Initialize backend.
+
+        Args:
+            sample_rate: Sample rate of the PCM audio sent to the backend
+        """
+        self.sample_rate = sample_rate
+        self._on_transcript: Optional[Callable[[TranscriptResult], Any]] = None
+        self._utterance_started_at: Optional[float] = None
+        self._interim_in_utterance = 0
+
+        # Statistics
+        self.audio_bytes_sent = 0
+        self.interim_results = 0
+        self.final_results = 0
+        self.utterances = 0
+        self._first_interim_ms: List[float] = []
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start the backend."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop the backend and release resources."""
+
+    @abstractmethod
+    async def send_audio(self, audio_data: bytes) -> None:
+        """Send an audio chunk.
+
+        Args:
+            audio_data: PCM audio data (16-bit, mono)
+        """
+
+    @abstractmethod
+    async def end_utterance(self) -> None:
+        """Signal that the user stopped speaking (local end-pointer)."""
+
+    def set_transcript_callback(
+        self, callback: Callable[[TranscriptResult], Any]
+    ) -> None:
+        """Set callback for interim and final transcripts.
+
+        Args:
+            callback: Function (sync or async) called with each TranscriptResult
+        """
+        self._on_transcript = callback
+
+    def _mark_audio(self, audio_data: bytes) -> None:
+        """Update audio counters and note the start of a new utterance."""
+        self.audio_bytes_sent += len(audio_data)
+        if self._utterance_started_at is None:
+            self._utterance_started_at = time.monotonic()
+
+    async def _emit(self, result: TranscriptResult) -> None:
+        """Update statistics and deliver a transcript to the callback."""
+        if result.is_final:
+            self.final_results += 1
+            self.utterances += 1
+            self._utterance_started_at = None
+            self._interim_in_utterance = 0
+        else:
+            if (
+                self._interim_in_utterance == 0
+                and self._utterance_started_at is not None
+            ):
+                self._first_interim_ms.append(
+                    (result.received_at - self._utterance_started_at) * 1000
+                )
+            self._interim_in_utterance += 1
+            self.interim_results += 1
+
+        if not self._on_transcript:
+            return
+        try:
+            if asyncio.iscoroutinefunction(self._on_transcript):
+                await self._on_transcript(result)
+            else:
+                self._on_transcript(result)
+        except Exception as e:
+            logger.error(f"Error in transcript callback: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics.
+
+        Returns:
+            Dictionary of audio, result and latency counters
+        """
+        return {
+            "backend": self.name,
+            "audio_bytes_sent": self.audio_bytes_sent,
+            "interim_results": self.interim_results,
+            "final_results": self.final_results,
+            "utterances": self.utterances,
+            "avg_first_interim_ms": (
+                sum(self._first_interim_ms) / len(self._first_interim_ms)
+                if self._first_interim_ms
+                else 0.0
+            ),
+        }
+
+
+class GoogleSpeechSTTBackend(STTBackend):
+    """Cloud Speech-to-Text streaming recognition backend.
+
+    A recognition stream is opened when the first audio of an utterance
+    arrives, so silence suppressed by the VAD never keeps an idle stream
+    open. With single_utterance the service end-points the utterance itself;
+    end_utterance() closes the request stream early when the local
+    end-pointer fires first. Either way the stream then ends with a final
+    result and the next utterance opens a new one.
+    """
+
+    name = "google_speech"
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        language_code: str = "en-US",
+        model: str = "latest_short",
+        single_utterance: bool = True,
+        interim_results: bool = True,
+        max_pending_chunks: int = 200,
+        client: Optional[Any] = None,
+    ):
+        """Initialize Speech-to-Text backend.
+
+        Args:
+            sample_rate: Sample rate of the PCM audio
+            language_code: BCP-47 language code
+            model: Recognition model ("latest_short" suits voice commands)
+            single_utterance: Let the service end-point each utterance
+            interim_results: Request partial hypotheses while speaking
+            max_pending_chunks: Audio chunks buffered while no stream is open
+            client: Optional SpeechAsyncClient (created on start if omitted)
+
+        Raises:
+            ImportError: If google-cloud-speech is not installed
+        """
+        if speech is None:
+            raise ImportError(
+                "Speech dependencies not installed. Please run: "
+                "pip install google-cloud-speech"
+            )
+        super().__init__(sample_rate)
+        self.language_code = language_code
+        self.model = model
+        self.single_utterance = single_utterance
+        self.request_interim_results = interim_results
+        self._client = client
+
+        # Pending audio; None marks the end of an utterance
+        self._pending: Deque[Optional[bytes]] = deque(maxlen=max_pending_chunks)
+        self._audio_ready = asyncio.Event()
+        self._stream_task: Optional[asyncio.Task] = None
+        self._is_running = False
+
+        # Statistics
+        self.streams_opened = 0
+        self.stream_errors = 0
+        self.dropped_chunks = 0
+
+    async def start(self) -> None:
+        """Create the client and start the recognition loop."""
+        if self._is_running:
+            return
+
+        if self._client is None:
+            self._client = speech.SpeechAsyncClient()
+        self._is_running = True
+        self._stream_task = asyncio.create_task(self._recognize_loop())
+        logger.info(
+            f"Started Speech-to-Text backend ({self.model}, {self.language_code})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the recognition loop."""
+        if not self._is_running:
+            return
+
+        self._is_running = False
+        if self._stream_task:
+            self._stream_task.cancel()
+            try:
+                await self._stream_task
+            except asyncio.CancelledError:
+                pass
+            self._stream_task = None
+        logger.info(f"Stopped Speech-to-Text backend: {self.get_stats()}")
+
+    async def send_audio(self, audio_data: bytes) -> None:
+        """Queue an audio chunk for the current (or next) recognition stream.
+
+        Args:
+            audio_data: PCM audio data (16-bit, mono)
+        """
+        if not self._is_running:
+            return
+
+        if len(self._pending) == self._pending.maxlen:
+            # Keep the most recent audio if the service falls behind
+            self.dropped_chunks += 1
+        self._mark_audio(audio_data)
+        self._pending.append(bytes(audio_data))
+        self._audio_ready.set()
+
+    async def end_utterance(self) -> None:
+        """Close the request stream so the service returns the final result."""
+        if self._is_running:
+            self._pending.append(None)
+            self._audio_ready.set()
+
+    async def _next_chunk(
+        self, utterance_done: Optional[asyncio.Event] = None
+    ) -> Optional[bytes]:
+        """Wait for the next pending chunk.
+
+        Args:
+            utterance_done: Set when the service has end-pointed the utterance
+
+        Returns:
+            Audio chunk, or None at the end of the utterance
+        """
+        while not self._pending:
+            if utterance_done is not None and utterance_done.is_set():
+                return None
+            self._audio_ready.clear()
+            await self._audio_ready.wait()
+        if utterance_done is not None and utterance_done.is_set():
+            # Leave the audio for the next utterance's stream
+            return None
+        return self._pending.popleft()
+
+    def _streaming_config(self) -> Any:
+        """Build the streaming recognition config."""
+        return speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=self.sample_rate,
+                language_code=self.language_code,
+                model=self.model,
+                enable_automatic_punctuation=True,
+            ),
+            interim_results=self.request_interim_results,
+            single_utterance=self.single_utterance,
+        )
+
+    async def _recognize_loop(self) -> None:
+        """Open one recognition stream per utterance until stopped."""
+        while self._is_running:
+            # Wait for speech before opening a stream
+            first_chunk = await self._next_chunk()
+            if first_chunk is None:
+                continue
+
+            try:
+                await self._recognize_utterance(first_chunk)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stream_errors += 1
+                logger.error(f"Speech-to-Text stream error: {e}")
+                await asyncio.sleep(0.1)
+
+    async def _recognize_utterance(self, first_chunk: bytes) -> None:
+        """Run a single recognition stream and deliver its results."""
+        utterance_done = asyncio.Event()
+        self.streams_opened += 1
+
+        async def requests() -> AsyncIterator[Any]:
+            yield speech.StreamingRecognizeRequest(
+                streaming_config=self._streaming_config()
+            )
+            yield speech.StreamingRecognizeRequest(audio_content=first_chunk)
+            while True:
+                chunk = await self._next_chunk(utterance_done)
+                if chunk is None:
+                    return
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+        end_of_utterance = (
+            speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE
+        )
+        responses = await self._client.streaming_recognize(requests=requests())
+
+        async for response in responses:
+            if response.speech_event_type == end_of_utterance:
+                # Stop sending audio; the final result follows
+                utterance_done.set()
+                self._audio_ready.set()
+                logger.debug("Speech-to-Text end of single utterance")
+
+            for result in response.results:
+                if not result.alternatives:
+                    continue
+                alternative = result.alternatives[0]
+                await self._emit(
+                    TranscriptResult(
+                        text=alternative.transcript,
+                        is_final=result.is_final,
+                        stability=result.stability,
+                        confidence=alternative.confidence,
+                    )
+                )
+
+        utterance_done.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics.
+
+        Returns:
+            Dictionary of audio, result, latency and stream counters
+        """
+        stats = super().get_stats()
+        stats.update(
+            {
+                "streams_opened": self.streams_opened,
+                "stream_errors": self.stream_errors,
+                "dropped_chunks": self.dropped_chunks,
+            }
+        )
+        return stats
+
+
+class FakeSTTBackend(STTBackend):
+    """Deterministic scripted backend for tests.
+
+    Each scripted utterance is revealed one word per `bytes_per_word` of
+    audio as interim results. The final result comes from end_utterance(),
+    or from the audio alone once `final_after_bytes` is reached. No timers
+    or network are involved, so output depends only on the audio sent.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        script: Optional[List[str]] = None,
+        sample_rate: int = 16000,
+        bytes_per_word: int = 6400,
+        final_after_bytes: Optional[int] = None,
+    ):
+        """Initialize fake backend.
+
+        Args:
+            script: Utterances returned in order (cycled when exhausted)
+            sample_rate: Sample rate of the PCM audio
+            bytes_per_word: Audio needed to reveal one more word (200 ms at 16 kHz)
+            final_after_bytes: Emit the final result after this much audio
+                per utterance (None waits for end_utterance())
+        """
+        super().__init__(sample_rate)
+        self.script = script or ["hello"]
+        self.bytes_per_word = bytes_per_word
+        self.final_after_bytes = final_after_bytes
+        self._utterance_index = 0
+        self._utterance_bytes = 0
+        self._words_revealed = 0
+        self._is_running = False
+
+    async def start(self) -> None:
+        """Start the backend."""
+        self._is_running = True
+
+    async def stop(self) -> None:
+        """Stop the backend."""
+        self._is_running = False
+
+    async def send_audio(self, audio_data: bytes) -> None:
+        """Consume audio and emit any interim results it reveals.
+
+        Args:
+            audio_data: PCM audio data (16-bit, mono)
+        """
+        if not self._is_running:
+            return
+
+        self._mark_audio(audio_data)
+        self._utterance_bytes += len(audio_data)
+        words = self._current_words()
+
+        revealed = min(len(words), self._utterance_bytes // self.bytes_per_word)
+        if revealed > self._words_revealed:
+            self._words_revealed = revealed
+            await self._emit(
+                TranscriptResult(text=" ".join(words[:revealed]), stability=0.5)
+            )
+
+        if (
+            self.final_after_bytes is not None
+            and self._utterance_bytes >= self.final_after_bytes
+        ):
+            await self.end_utterance()
+
+    async def end_utterance(self) -> None:
+        """Emit the final result for the current utterance."""
+        if not self._is_running or self._utterance_bytes == 0:
+            return
+
+        text = " ".join(self._current_words())
+        self._utterance_index += 1
+        self._utterance_bytes = 0
+        self._words_revealed = 0
+        await self._emit(
+            TranscriptResult(text=text, is_final=True, stability=1.0, confidence=1.0)
+        )
+
+    def _current_words(self) -> List[str]:
+        """Words of the utterance currently being spoken."""
+        return self.script[self._utterance_index % len(self.script)].split()
+
+
+STT_BACKENDS = {
+    GoogleSpeechSTTBackend.name: GoogleSpeechSTTBackend,
+    FakeSTTBackend.name: FakeSTTBackend,
+}
+
+
+def create_stt_backend(name: str, **kwargs: Any) -> STTBackend:
+    """Create a speech-to-text backend by name.
+
+    Args:
+        name: Backend name ("google_speech" or "fake")
+        **kwargs: Backend constructor arguments
+
+    Returns:
+        New backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name not in STT_BACKENDS:
+        raise ValueError(f"Unknown STT backend: {name}")
+    return STT_BACKENDS[name](**kwargs)
@@ -0,0 +1,348 @@
+"""Two-tier cache for synthesized speech.
+
+Status updates and stock confirmations are spoken with identical text
+again and again. The cache keeps recently used audio in memory under a
+byte budget and stores synthesized clips on disk, addressed by the hash
+of their text and voice settings, so they survive restarts. The disk
+tier has its own byte budget; the least recently used files (by
+modification time, refreshed on every read) are deleted once it is
+exceeded. Concurrent requests for the same clip share a single
+synthesis call.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different strings share an entry."""
+    return " ".join(text.split())
+
+
+class TTSCache:
+    """In-memory LRU backed by a content-addressed disk store."""
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 32 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        """Initialize TTS cache.
+
+        Args:
+            max_memory_bytes: Byte budget of the in-memory tier
+            disk_dir: Directory of the persistent tier (None disables it)
+            max_disk_bytes: Byte budget of the persistent tier
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = os.path.expanduser(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        # Disk usage, updated by executor threads under the lock
+        self._disk_lock = threading.Lock()
+        self._disk_bytes = 0
+        self._disk_entries = 0
+        self.disk_evictions = 0
+        if self.disk_dir:
+            with self._disk_lock:
+                self._disk_scan()
+
+        # Statistics
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.shared_requests = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+        self.disk_errors = 0
+
+    @staticmethod
+    def make_key(text: str, voice: str, audio_config: str) -> str:
+        """Build the content address of a clip.
+
+        Args:
+            text: Text to speak
+            voice: Voice name
+            audio_config: Description of encoding, rate and speaking rate
+
+        Returns:
+            Hex digest identifying the clip
+        """
+        material = "\x1f".join((normalize_text(text), voice, audio_config))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def get_or_synthesize(
+        self, key: str, synthesize: Callable[[], Awaitable[Optional[bytes]]]
+    ) -> Optional[bytes]:
+        """Return cached audio or synthesize it once.
+
+        Args:
+            key: Clip address from make_key()
+            synthesize: Produces the audio on a miss (None on failure)
+
+        Returns:
+            Audio bytes or None if synthesis failed
+        """
+        audio = self._memory_get(key)
+        if audio is not None:
+            self.memory_hits += 1
+            self.bytes_saved += len(audio)
+            return audio
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            # Someone is already fetching this clip; share the result
+            await asyncio.wait({pending})
+            if pending.cancelled():
+                # The fetching request was abandoned (e.g. barge-in); retry
+                return await self.get_or_synthesize(key, synthesize)
+            try:
+                audio = pending.result()
+            except Exception:
+                # The shared synthesis failed; nothing was served from cache
+                self.misses += 1
+                raise
+            self.shared_requests += 1
+            if audio is not None:
+                self.bytes_saved += len(audio)
+            return audio
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            audio = await self._load_or_synthesize(key, synthesize)
+            future.set_result(audio)
+            return audio
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody may be waiting; avoid "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def lookup(self, key: str) -> Optional[bytes]:
+        """Return a cached clip from either tier without synthesizing.
+
+        Args:
+            key: Clip address from make_key()
+
+        Returns:
+            Audio bytes, or None on a miss (counted as one)
+        """
+        audio = self._memory_get(key)
+        if audio is not None:
+            self.memory_hits += 1
+            self.bytes_saved += len(audio)
+            return audio
+
+        if self.disk_dir:
+            audio = await asyncio.get_running_loop().run_in_executor(
+                None, self._disk_read, key
+            )
+            if audio is not None:
+                self.disk_hits += 1
+                self.bytes_saved += len(audio)
+                self._memory_put(key, audio)
+                return audio
+
+        self.misses += 1
+        return None
+
+    async def store(self, key: str, audio: bytes, persist: bool = True) -> None:
+        """Add a clip synthesized outside get_or_synthesize().
+
+        Args:
+            key: Clip address from make_key()
+            audio: Synthesized audio
+            persist: Also write the clip to the disk tier; one-off speech
+                should stay in memory only
+        """
+        if not audio:
+            return
+        self._memory_put(key, audio)
+        if persist and self.disk_dir:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._disk_write, key, audio
+            )
+
+    async def _load_or_synthesize(
+        self, key: str, synthesize: Callable[[], Awaitable[Optional[bytes]]]
+    ) -> Optional[bytes]:
+        """Fill the memory tier from disk or from a fresh synthesis."""
+        loop = asyncio.get_running_loop()
+
+        if self.disk_dir:
+            audio = await loop.run_in_executor(None, self._disk_read, key)
+            if audio is not None:
+                self.disk_hits += 1
+                self.bytes_saved += len(audio)
+                self._memory_put(key, audio)
+                return audio
+
+        self.misses += 1
+        audio = await synthesize()
+        if audio:
+            self._memory_put(key, audio)
+            if self.disk_dir:
+                await loop.run_in_executor(None, self._disk_write, key, audio)
+        return audio
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        """Look up the memory tier and mark the entry recently used."""
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+        return audio
+
+    def _memory_put(self, key: str, audio: bytes) -> None:
+        """Insert into the memory tier, evicting least recently used clips."""
+        if len(audio) > self.max_memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> str:
+        """Path of a clip in the disk tier (sharded by key prefix)."""
+        return os.path.join(self.disk_dir, key[:2], f"{key}.pcm")
+
+    def _disk_read(self, key: str) -> Optional[bytes]:
+        """Read a clip from disk, or None if absent."""
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+            # The modification time orders clips for eviction
+            os.utime(path)
+            return audio
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.disk_errors += 1
+            logger.warning(f"TTS cache read failed for {key}: {e}")
+            return None
+
+    def _disk_write(self, key: str, audio: bytes) -> None:
+        """Write a clip to disk atomically, then enforce the disk budget."""
+        if len(audio) > self.max_disk_bytes:
+            return
+        path = self._disk_path(key)
+        directory = os.path.dirname(path)
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Unique per call: the same clip may be stored by two threads
+            with tempfile.NamedTemporaryFile(
+                dir=directory, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(audio)
+            with self._disk_lock:
+                try:
+                    replaced = os.path.getsize(path)
+                except FileNotFoundError:
+                    replaced = None
+                os.replace(tmp_path, path)
+                tmp_path = None
+                if replaced is None:
+                    self._disk_entries += 1
+                    self._disk_bytes += len(audio)
+                else:
+                    self._disk_bytes += len(audio) - replaced
+                if self._disk_bytes > self.max_disk_bytes:
+                    self._disk_prune()
+        except OSError as e:
+            self.disk_errors += 1
+            logger.warning(f"TTS cache write failed for {key}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _disk_scan(self) -> List[Tuple[float, int, str]]:
+        """Recount the disk tier (caller holds the lock).
+
+        Returns:
+            (mtime, size, path) of every stored clip
+        """
+        entries = []
+        for root, _, names in os.walk(self.disk_dir):
+            for name in names:
+                if not name.endswith(".pcm"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((info.st_mtime, info.st_size, path))
+        self._disk_entries = len(entries)
+        self._disk_bytes = sum(size for _, size, _ in entries)
+        return entries
+
+    def _disk_prune(self) -> None:
+        """Delete least recently used clips until within the disk budget.
+
+        Caller holds the lock.
+        """
+        entries = sorted(self._disk_scan())
+        for _, size, path in entries:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._disk_bytes -= size
+            self._disk_entries -= 1
+            self.disk_evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary of hit/miss counters and memory and disk usage
+        """
+        hits = self.memory_hits + self.disk_hits + self.shared_requests
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "shared_requests": self.shared_requests,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "bytes_saved": self.bytes_saved,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "evictions": self.evictions,
+            "disk_errors": self.disk_errors,
+            "disk_enabled": self.disk_dir is not None,
+            "disk_entries": self._disk_entries,
+            "disk_bytes": self._disk_bytes,
+            "disk_evictions": self.disk_evictions,
+        }
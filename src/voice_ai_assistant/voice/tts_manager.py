@@ -6,23 +6,143 @@ and other non-conversational feedback.
 
 import logging
 import os
-from typing import Optional
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncGenerator, AsyncIterator
 import asyncio
 
+from google.api_core import exceptions as google_exceptions
 from google.cloud import texttospeech
 
+from .tts_cache import TTSCache
+
 logger = logging.getLogger(__name__)
 
+# Voice families served by the streaming synthesis RPC
+STREAMING_VOICE_TYPES = ("Journey", "Chirp3-HD", "Chirp-HD")
+
+# Errors of the streaming RPC that mean the voice or model cannot stream;
+# anything else (timeouts, UNAVAILABLE, cancellation) may be transient
+STREAMING_UNSUPPORTED_ERRORS = (
+    google_exceptions.InvalidArgument,
+    google_exceptions.FailedPrecondition,
+)
+
+# Size of the RIFF/WAVE header the unary API puts in front of LINEAR16 audio
+WAV_HEADER_BYTES = 44
+
+
+def strip_wav_header(audio: bytes) -> bytes:
+    """Remove the WAV header from LINEAR16 audio so only PCM samples remain."""
+    if audio[:4] == b"RIFF" and audio[8:12] == b"WAVE":
+        return audio[WAV_HEADER_BYTES:]
+    return audio
+
+
+class SharedTTSClient:
+    """Process-wide async TTS client with a request concurrency limit.
+
+    gRPC asyncio channels belong to the event loop they were created on,
+    so there is one shared client per running loop. Every TTSManager on
+    that loop reuses its channel and its request slots; the first manager
+    to use it sets the limit.
+    """
+
+    _instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SharedTTSClient]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, max_concurrent_requests: int = 8):
+        """Initialize shared client.
+
+        Args:
+            max_concurrent_requests: Requests allowed in flight at once
+        """
+        self.client = texttospeech.TextToSpeechAsyncClient()
+        self.max_concurrent_requests = max_concurrent_requests
+        self._slots = asyncio.Semaphore(max_concurrent_requests)
+
+        # Statistics
+        self.requests = 0
+        self.queued_requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.queue_wait_ms: deque = deque(maxlen=200)
+
+    @classmethod
+    def for_running_loop(cls, max_concurrent_requests: int = 8) -> "SharedTTSClient":
+        """Get (or create) the shared client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        instance = cls._instances.get(loop)
+        if instance is None:
+            instance = cls(max_concurrent_requests)
+            cls._instances[loop] = instance
+        return instance
+
+    @classmethod
+    def current(cls) -> Optional["SharedTTSClient"]:
+        """Get the running loop's shared client without creating one."""
+        try:
+            return cls._instances.get(asyncio.get_running_loop())
+        except RuntimeError:
+            return None
+
+    @asynccontextmanager
+    async def request_slot(self) -> AsyncIterator[None]:
+        """Hold one of the concurrent request slots, recording the wait."""
+        if self._slots.locked():
+            self.queued_requests += 1
+        started_at = time.monotonic()
+        async with self._slots:
+            self.queue_wait_ms.append((time.monotonic() - started_at) * 1000)
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request and queueing statistics.
+
+        Returns:
+            Dictionary of request counters and queue wait times
+        """
+        waits = sorted(self.queue_wait_ms)
+        return {
+            'max_concurrent_requests': self.max_concurrent_requests,
+            'requests': self.requests,
+            'queued_requests': self.queued_requests,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak_in_flight,
+            'avg_queue_wait_ms': sum(waits) / len(waits) if waits else 0.0,
+            'p95_queue_wait_ms': waits[min(int(0.95 * len(waits)), len(waits) - 1)] if waits else 0.0,
+        }
+
+
 class TTSManager:
     """Manages Text-to-Speech generation."""
 
-    def __init__(self, project_id: Optional[str] = None):
+    def __init__(self,
+                 project_id: Optional[str] = None,
+                 cache: Optional[TTSCache] = None,
+                 streaming: bool = True,
+                 max_concurrent_requests: int = 8):
         """Initialize TTS Manager.
 
         Args:
             project_id: Google Cloud project ID.
+            cache: Cache of synthesized clips (None synthesizes every request).
+            streaming: Use streaming synthesis in synthesize_stream() when
+                the voice supports it.
+            max_concurrent_requests: Process-wide limit on TTS requests in
+                flight (applied by the first manager on the event loop).
         """
-        self.client = texttospeech.TextToSpeechClient()
+        self.cache = cache
+        self.max_concurrent_requests = max_concurrent_requests
         
         # Use a 'Journey' voice if available, otherwise fallback to standard Neural2 or WaveNet
         # Journey voices are expressive and low latency
@@ -38,6 +158,67 @@ class TTSManager:
             speaking_rate=1.0 
         )
 
+        self._update_cache_variant()
+
+        # Streaming synthesis needs a supporting voice and client library
+        self._streaming_requested = streaming
+        self.streaming_enabled = self._streaming_supported()
+
+        # Statistics
+        self.streamed_requests = 0
+        self.unary_requests = 0
+        self.stream_fallbacks = 0
+        self._stream_first_chunk_ms: deque = deque(maxlen=200)
+
+    @property
+    def voice_signature(self) -> str:
+        """Identifies the voice and audio settings used for synthesis."""
+        return f"{self.voice.name}:{self._cache_variant}"
+
+    def set_voice(self, name: str, language_code: Optional[str] = None) -> None:
+        """Switch to another voice.
+
+        Args:
+            name: Voice name (e.g. "en-US-Journey-F")
+            language_code: Language of the voice (defaults to the current one)
+        """
+        self.voice = texttospeech.VoiceSelectionParams(
+            language_code=language_code or self.voice.language_code,
+            name=name
+        )
+        self.streaming_enabled = self._streaming_supported()
+        logger.info(f"TTS voice set to {name}")
+
+    def set_speaking_rate(self, rate: float) -> float:
+        """Change how fast speech is synthesized.
+
+        Args:
+            rate: Speaking rate (1.0 is normal), clamped to 0.25-4.0
+
+        Returns:
+            The rate in effect
+        """
+        rate = round(min(4.0, max(0.25, rate)), 2)
+        self.audio_config.speaking_rate = rate
+        self._update_cache_variant()
+        logger.info(f"TTS speaking rate set to {rate}")
+        return rate
+
+    def _update_cache_variant(self) -> None:
+        """Everything besides the text that changes the synthesized audio."""
+        self._cache_variant = (
+            f"{self.audio_config.audio_encoding}:{self.audio_config.sample_rate_hertz}:"
+            f"{self.audio_config.speaking_rate}"
+        )
+
+    def _streaming_supported(self) -> bool:
+        """Whether streaming synthesis can be used with the current voice."""
+        return (
+            self._streaming_requested
+            and any(voice_type in self.voice.name for voice_type in STREAMING_VOICE_TYPES)
+            and hasattr(texttospeech, "StreamingSynthesizeConfig")
+        )
+
     async def synthesize(self, text: str) -> Optional[bytes]:
         """Synthesize text to audio bytes.
 
@@ -50,23 +231,157 @@ class TTSManager:
         if not text:
             return None
 
+        if self.cache:
+            key = self.cache.make_key(text, self.voice.name, self._cache_variant)
+            return await self.cache.get_or_synthesize(key, lambda: self._synthesize_uncached(text))
+        return await self._synthesize_uncached(text)
+
+    async def synthesize_stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """Synthesize text, yielding PCM chunks as soon as they are available.
+
+        Uses the streaming synthesis RPC when the voice supports it, so
+        playback can start before the whole text is rendered. Falls back to
+        a single chunk from unary synthesis otherwise, or if streaming fails
+        before producing audio. Streaming is only turned off for good when
+        the RPC rejects the voice; other failures affect just this text.
+
+        Response text is rarely spoken twice, so synthesized audio is kept
+        in the cache's memory tier only, never written to disk.
+
+        Args:
+            text: Text to synthesize.
+
+        Yields:
+            PCM audio chunks (LINEAR16, 24 kHz).
+        """
+        if not text:
+            return
+
+        key = None
+        if self.cache:
+            key = self.cache.make_key(text, self.voice.name, self._cache_variant)
+            cached = await self.cache.lookup(key)
+            if cached:
+                yield cached
+                return
+
+        if self.streaming_enabled:
+            chunks = []
+            try:
+                async for chunk in self._stream_chunks(text):
+                    chunks.append(chunk)
+                    yield chunk
+            except Exception as e:
+                if chunks:
+                    logger.error(f"Streaming TTS failed mid-utterance: {e}")
+                    return
+                if isinstance(e, STREAMING_UNSUPPORTED_ERRORS):
+                    logger.warning(
+                        f"Streaming TTS unsupported for {self.voice.name}, "
+                        f"using unary synthesis: {e}"
+                    )
+                    self.streaming_enabled = False
+                else:
+                    logger.warning(
+                        f"Streaming TTS failed, using unary synthesis once: {e}"
+                    )
+                self.stream_fallbacks += 1
+            else:
+                self.streamed_requests += 1
+                if self.cache and chunks:
+                    await self.cache.store(key, b"".join(chunks), persist=False)
+                return
+
+        audio = await self._synthesize_uncached(text)
+        if audio:
+            if self.cache:
+                await self.cache.store(key, audio, persist=False)
+            yield audio
+
+    def _shared_client(self) -> SharedTTSClient:
+        """Get the async client shared by all managers on this event loop."""
+        return SharedTTSClient.for_running_loop(self.max_concurrent_requests)
+
+    async def _stream_chunks(self, text: str) -> AsyncGenerator[bytes, None]:
+        """Relay audio chunks from the streaming synthesis RPC."""
+        shared = self._shared_client()
+
+        config_args = {}
+        if self.audio_config.speaking_rate != 1.0 and hasattr(texttospeech, "StreamingAudioConfig"):
+            config_args["streaming_audio_config"] = texttospeech.StreamingAudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.PCM,
+                sample_rate_hertz=self.audio_config.sample_rate_hertz,
+                speaking_rate=self.audio_config.speaking_rate
+            )
+        streaming_config = texttospeech.StreamingSynthesizeConfig(
+            voice=texttospeech.VoiceSelectionParams(
+                language_code=self.voice.language_code,
+                name=self.voice.name
+            ),
+            **config_args
+        )
+
+        async def requests():
+            yield texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config)
+            yield texttospeech.StreamingSynthesizeRequest(
+                input=texttospeech.StreamingSynthesisInput(text=text)
+            )
+
+        async with shared.request_slot():
+            started_at = time.monotonic()
+            responses = await shared.client.streaming_synthesize(requests=requests())
+
+            first_chunk = True
+            carry = b""
+            async for response in responses:
+                # Only hand whole 16-bit samples to playback
+                item = carry + response.audio_content
+                split = len(item) - len(item) % 2
+                item, carry = item[:split], item[split:]
+                if not item:
+                    continue
+
+                if first_chunk:
+                    self._stream_first_chunk_ms.append((time.monotonic() - started_at) * 1000)
+                    first_chunk = False
+                yield item
+
+    async def _synthesize_uncached(self, text: str) -> Optional[bytes]:
+        """Call the TTS API for text."""
+        self.unary_requests += 1
         try:
-            # Run blocking API call in executor
-            loop = asyncio.get_running_loop()
-            
+            shared = self._shared_client()
             synthesis_input = texttospeech.SynthesisInput(text=text)
-            
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.synthesize_speech(
+
+            async with shared.request_slot():
+                response = await shared.client.synthesize_speech(
                     input=synthesis_input,
                     voice=self.voice,
                     audio_config=self.audio_config
                 )
-            )
-            
-            return response.audio_content
+
+            return strip_wav_header(response.audio_content)
 
         except Exception as e:
             logger.error(f"TTS synthesis failed: {e}")
             return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get TTS statistics.
+
+        Returns:
+            Request counters, streaming latency and cache statistics
+        """
+        first_chunk_ms = self._stream_first_chunk_ms
+        shared = SharedTTSClient.current()
+        return {
+            'streaming_enabled': self.streaming_enabled,
+            'streamed_requests': self.streamed_requests,
+            'unary_requests': self.unary_requests,
+            'stream_fallbacks': self.stream_fallbacks,
+            'avg_stream_first_chunk_ms': (
+                sum(first_chunk_ms) / len(first_chunk_ms) if first_chunk_ms else 0.0
+            ),
+            'cache': self.cache.get_stats() if self.cache else None,
+            'client': shared.get_stats() if shared else None,
+        }
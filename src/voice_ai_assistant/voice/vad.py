@@ -0,0 +1,251 @@
+"""Voice activity detection for microphone audio.
+
+Classifies 16-bit PCM chunks as speech or silence so that silent audio
+does not have to be uploaded to the Live API. Features are computed for
+all frames of a chunk at once with numpy:
+- Short-term energy (dBFS) against an adaptive noise floor
+- Zero-crossing rate
+- Spectral flatness (tonal speech is low, broadband noise is close to 1)
+
+A frame is speech only if it is loud enough and passes both spectral
+checks. The noise floor is a low percentile of the frame energies of the
+last few seconds, updated on every chunk, so steady noise such as a fan
+rises into the floor even if it was first taken for speech.
+
+A hangover keeps forwarding audio for a while after speech stops, and a
+pre-roll buffer replays the audio just before speech onset so the first
+syllable is not clipped.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "Audio dependencies not installed. Please run: " "pip install numpy"
+    ) from e
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VADConfig:
+    """Configuration for voice activity detection."""
+
+    sample_rate: int = 16000
+    frame_ms: int = 20
+    energy_margin_db: float = 12.0  # Required level above the noise floor
+    min_energy_db: float = -50.0  # Absolute minimum level for speech (dBFS)
+    max_flatness: float = 0.45  # Frames flatter than this look like noise
+    max_zero_crossing_rate: float = 0.25
+    min_speech_frames: int = 2  # Speech frames in a chunk needed for onset
+    hangover_ms: int = 400  # Keep sending after the last speech frame
+    pre_roll_ms: int = 300  # Audio replayed from before speech onset
+    noise_window_ms: int = 5000  # History the noise floor is estimated from
+    noise_percentile: float = 10.0  # Speech leaves gaps; steady noise does not
+    initial_noise_floor_db: float = -70.0
+
+
+@dataclass
+class VADResult:
+    """Decision for one processed chunk."""
+
+    audio: Optional[bytes]  # Audio to forward (None if suppressed)
+    is_speech: bool = False  # Whether the chunk itself contained speech
+    speech_started: bool = False
+    speech_ended: bool = False
+
+
+class VoiceActivityDetector:
+    """Stateful per-stream voice activity detector with hangover and pre-roll."""
+
+    def __init__(self, config: Optional[VADConfig] = None):
+        """Initialize detector.
+
+        Args:
+            config: VAD configuration
+        """
+        self.config = config or VADConfig()
+        self.frame_length = int(self.config.sample_rate * self.config.frame_ms / 1000)
+        self._window = np.hanning(self.frame_length).astype(np.float32)
+        self._hangover_samples = int(
+            self.config.sample_rate * self.config.hangover_ms / 1000
+        )
+        self._pre_roll_samples = int(
+            self.config.sample_rate * self.config.pre_roll_ms / 1000
+        )
+
+        self.noise_floor_db = self.config.initial_noise_floor_db
+        # Recent frame energies, seeded with the initial floor so early speech
+        # is not mistaken for noise
+        window_frames = max(1, self.config.noise_window_ms // self.config.frame_ms)
+        self._frame_energies: Deque[float] = deque(
+            [self.config.initial_noise_floor_db] * window_frames, maxlen=window_frames
+        )
+        self.is_speaking = False
+        self._hangover_remaining = 0
+        self._pre_roll: Deque[bytes] = deque()
+        self._pre_roll_bytes = 0
+
+        # Statistics
+        self.chunks_processed = 0
+        self.chunks_forwarded = 0
+        self.bytes_processed = 0
+        self.bytes_suppressed = 0
+        self.speech_segments = 0
+
+    def reset(self) -> None:
+        """Reset detection state (noise floor estimate is kept)."""
+        self.is_speaking = False
+        self._hangover_remaining = 0
+        self._pre_roll.clear()
+        self._pre_roll_bytes = 0
+
+    def analyze(self, samples: np.ndarray) -> Dict[str, np.ndarray]:
+        """Compute per-frame features for a chunk.
+
+        Args:
+            samples: 1-D int16 samples
+
+        Returns:
+            Dictionary of per-frame feature arrays and the speech mask
+        """
+        audio = samples.astype(np.float32) / 32768.0
+        num_frames = len(audio) // self.frame_length
+        if num_frames:
+            frames = audio[: num_frames * self.frame_length].reshape(
+                num_frames, self.frame_length
+            )
+            window = self._window
+        else:
+            frames = audio[np.newaxis, :]
+            window = np.hanning(len(audio)).astype(np.float32)
+
+        energy_db = 10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+
+        signs = np.signbit(frames)
+        zero_crossing_rate = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+        power = np.abs(np.fft.rfft(frames * window, axis=1)) ** 2 + 1e-12
+        flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+
+        threshold_db = max(
+            self.noise_floor_db + self.config.energy_margin_db,
+            self.config.min_energy_db,
+        )
+        speech = (
+            (energy_db > threshold_db)
+            & (flatness < self.config.max_flatness)
+            & (zero_crossing_rate < self.config.max_zero_crossing_rate)
+        )
+
+        return {
+            "energy_db": energy_db,
+            "zero_crossing_rate": zero_crossing_rate,
+            "flatness": flatness,
+            "speech": speech,
+        }
+
+    def process(self, chunk: bytes) -> VADResult:
+        """Classify a chunk and decide whether to forward it.
+
+        Args:
+            chunk: PCM int16 audio (bytes-like)
+
+        Returns:
+            VADResult with the audio to forward and speech boundary events
+        """
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        self.chunks_processed += 1
+        self.bytes_processed += len(chunk)
+
+        if len(samples) == 0:
+            return VADResult(audio=None)
+
+        features = self.analyze(samples)
+        speech_mask = features["speech"]
+        speech_frames = int(speech_mask.sum())
+
+        if self.is_speaking:
+            is_speech = speech_frames > 0
+        else:
+            is_speech = speech_frames >= min(
+                self.config.min_speech_frames, len(speech_mask)
+            )
+
+        self._update_noise_floor(features["energy_db"])
+
+        data = bytes(chunk)
+        result = VADResult(audio=None, is_speech=is_speech)
+
+        if is_speech:
+            self._hangover_remaining = self._hangover_samples
+            if not self.is_speaking:
+                self.is_speaking = True
+                self.speech_segments += 1
+                result.speech_started = True
+                data = b"".join(self._pre_roll) + data
+                self._pre_roll.clear()
+                self._pre_roll_bytes = 0
+            result.audio = data
+        elif self.is_speaking:
+            self._hangover_remaining -= len(samples)
+            if self._hangover_remaining > 0:
+                result.audio = data
+            else:
+                self.is_speaking = False
+                result.speech_ended = True
+                self._add_pre_roll(data)
+        else:
+            self._add_pre_roll(data)
+
+        if result.audio is not None:
+            self.chunks_forwarded += 1
+        else:
+            self.bytes_suppressed += len(chunk)
+
+        return result
+
+    def _update_noise_floor(self, energy_db: np.ndarray) -> None:
+        """Re-estimate the noise floor from the recent frame energies."""
+        self._frame_energies.extend(energy_db.tolist())
+        energies = np.fromiter(self._frame_energies, dtype=np.float32)
+        self.noise_floor_db = float(
+            np.percentile(energies, self.config.noise_percentile)
+        )
+
+    def _add_pre_roll(self, data: bytes) -> None:
+        """Keep the most recent silent audio for replay at speech onset."""
+        self._pre_roll.append(data)
+        self._pre_roll_bytes += len(data)
+        while (
+            self._pre_roll
+            and self._pre_roll_bytes - len(self._pre_roll[0])
+            >= self._pre_roll_samples * 2
+        ):
+            self._pre_roll_bytes -= len(self._pre_roll.popleft())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get detector statistics.
+
+        Returns:
+            Dictionary with forwarding and suppression counters
+        """
+        return {
+            "chunks_processed": self.chunks_processed,
+            "chunks_forwarded": self.chunks_forwarded,
+            "bytes_processed": self.bytes_processed,
+            "bytes_suppressed": self.bytes_suppressed,
+            "suppression_ratio": (
+                self.bytes_suppressed / self.bytes_processed
+                if self.bytes_processed
+                else 0.0
+            ),
+            "speech_segments": self.speech_segments,
+            "noise_floor_db": self.noise_floor_db,
+            "is_speaking": self.is_speaking,
+        }
@@ -23,14 +23,25 @@ class VertexLiveAPIError(Exception):
 
 
 class VertexLiveClient:
-    """Client for Google Vertex AI Live API bidirectional streaming."""
+    """Client for Google Vertex AI Live API bidirectional streaming.
+
+    Supports two response modes:
+    - "audio": the model answers with synthesized speech (and text parts)
+    - "transcription": the session is used for speech-to-text only. Input
+      audio transcription is enabled, no audio output is requested, and
+      model turns are discarded without decoding.
+    """
+
+    RESPONSE_MODES = ("audio", "transcription")
 
     def __init__(self,
                  project_id: Optional[str] = None,
                  region: str = "us-central1",
                  model: str = "gemini-2.5-flash-native-audio-preview-09-2025",
                  auth_manager: Optional[VertexAuthManager] = None,
-                 tools: Optional[List[Dict[str, Any]]] = None):
+                 tools: Optional[List[Dict[str, Any]]] = None,
+                 automatic_activity_detection: bool = True,
+                 response_mode: str = "audio"):
         """Initialize Vertex AI Live API client.
 
         Args:
@@ -39,12 +50,25 @@ class VertexLiveClient:
             model: Gemini model to use for Live API
             auth_manager: Authentication manager instance
             tools: List of tool declarations for function calling
+            automatic_activity_detection: Let the server detect speech
+                boundaries. When False, the client must mark each user turn
+                with send_activity_start() and send_activity_end().
+            response_mode: "audio" for spoken model responses or
+                "transcription" for speech-to-text only sessions
+
+        Raises:
+            ValueError: If response_mode is unknown
         """
+        if response_mode not in self.RESPONSE_MODES:
+            raise ValueError(f"Unknown response mode: {response_mode}")
+
         self.auth_manager = auth_manager or VertexAuthManager(project_id)
         self.project_id = self.auth_manager.get_project_id()
         self.region = region
         self.model = model
         self.tools = tools or []
+        self.automatic_activity_detection = automatic_activity_detection
+        self.response_mode = response_mode
         self.audio_manager = AudioStreamManager()
 
         # WebSocket connection
@@ -56,6 +80,9 @@ class VertexLiveClient:
         self._on_audio_response: Optional[Callable[[bytes], None]] = None
         self._on_text_response: Optional[Callable[[str], None]] = None
         self._on_tool_call: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self._on_tool_call_cancellation: Optional[Callable[[List[str]], None]] = None
+        self._on_input_transcription: Optional[Callable[[str], None]] = None
+        self._on_turn_event: Optional[Callable[[str], None]] = None
         self._on_error: Optional[Callable[[Exception], None]] = None
         
     async def connect(self) -> None:
@@ -108,27 +135,60 @@ class VertexLiveClient:
         self._session_id = None
         logger.info("Disconnected from Vertex AI Live API")
         
-    async def _send_initial_config(self) -> None:
-        """Send initial configuration to the Live API."""
-        # Setup with AUDIO response configuration (camelCase fields required!)
-        config = {
-            "model": "models/gemini-2.5-flash-native-audio-preview-09-2025",
-            "generationConfig": {
-                "responseModalities": "audio",  # Must be camelCase!
-                "speechConfig": {
-                    "voiceConfig": {
-                        "prebuiltVoiceConfig": {
-                            "voiceName": "Puck"
+    def _build_setup_config(self) -> Dict[str, Any]:
+        """Build the setup message body for the configured response mode.
+
+        Returns:
+            Setup configuration (camelCase fields required!)
+        """
+        if self.response_mode == "transcription":
+            # Speech-to-text only: transcribe input audio and keep the model's
+            # own (unused) text reply as short as possible. No audio output
+            # is requested, so nothing is synthesized or streamed back.
+            config = {
+                "model": f"models/{self.model}",
+                "generationConfig": {
+                    "responseModalities": ["TEXT"],
+                    "maxOutputTokens": 1
+                },
+                "inputAudioTranscription": {}
+            }
+        else:
+            # Setup with AUDIO response configuration
+            config = {
+                "model": f"models/{self.model}",
+                "generationConfig": {
+                    "responseModalities": "audio",  # Must be camelCase!
+                    "speechConfig": {
+                        "voiceConfig": {
+                            "prebuiltVoiceConfig": {
+                                "voiceName": "Puck"
+                            }
                         }
                     }
                 }
             }
-        }
 
-        # Add tools if provided
-        if self.tools:
-            config["tools"] = self.tools
-            logger.info(f"Registered {len(self.tools)} tools with Gemini Live API")
+            # Add tools if provided (tool calls need a responding model)
+            if self.tools:
+                config["tools"] = self.tools
+                logger.info(f"Registered {len(self.tools)} tools with Gemini Live API")
+
+        # Client-side end-pointing: the server waits for explicit activity markers
+        if not self.automatic_activity_detection:
+            config["realtimeInputConfig"] = {
+                "automaticActivityDetection": {
+                    "disabled": True
+                }
+            }
+            logger.info("Server-side activity detection disabled, using client activity markers")
+
+        return config
+
+    async def _send_initial_config(self) -> None:
+        """Send initial configuration to the Live API."""
+        config = self._build_setup_config()
+        logger.info(f"Live API session mode: {self.response_mode}")
 
         message = {
             "setup": config
@@ -181,6 +241,82 @@ class VertexLiveClient:
             logger.error(f"Failed to send audio chunk: {e}")
             raise VertexLiveAPIError(f"Send failed: {e}")
             
+    async def send_audio_stream_end(self) -> None:
+        """Signal that the audio stream is paused (e.g. silence suppressed by VAD).
+
+        Lets the server flush buffered audio and close the user's turn
+        without having to receive trailing silence.
+
+        Raises:
+            VertexLiveAPIError: If not connected or send fails
+        """
+        if not self._is_connected or not self._websocket:
+            raise VertexLiveAPIError("Not connected to Live API")
+
+        try:
+            message = {
+                "realtime_input": {
+                    "audio_stream_end": True
+                }
+            }
+
+            await self._websocket.send(json.dumps(message))
+            logger.debug("Sent audio stream end")
+
+        except Exception as e:
+            logger.error(f"Failed to send audio stream end: {e}")
+            raise VertexLiveAPIError(f"Send failed: {e}")
+
+    async def send_activity_start(self) -> None:
+        """Mark the start of user speech.
+
+        Only valid when automatic activity detection is disabled.
+
+        Raises:
+            VertexLiveAPIError: If not connected or send fails
+        """
+        if not self._is_connected or not self._websocket:
+            raise VertexLiveAPIError("Not connected to Live API")
+
+        try:
+            message = {
+                "realtime_input": {
+                    "activity_start": {}
+                }
+            }
+
+            await self._websocket.send(json.dumps(message))
+            logger.debug("Sent activity start")
+
+        except Exception as e:
+            logger.error(f"Failed to send activity start: {e}")
+            raise VertexLiveAPIError(f"Send failed: {e}")
+
+    async def send_activity_end(self) -> None:
+        """Mark the end of user speech so the server responds immediately.
+
+        Only valid when automatic activity detection is disabled.
+
+        Raises:
+            VertexLiveAPIError: If not connected or send fails
+        """
+        if not self._is_connected or not self._websocket:
+            raise VertexLiveAPIError("Not connected to Live API")
+
+        try:
+            message = {
+                "realtime_input": {
+                    "activity_end": {}
+                }
+            }
+
+            await self._websocket.send(json.dumps(message))
+            logger.debug("Sent activity end")
+
+        except Exception as e:
+            logger.error(f"Failed to send activity end: {e}")
+            raise VertexLiveAPIError(f"Send failed: {e}")
+
     async def send_text_message(self, text: str) -> None:
         """Send text message to the Live API.
 
@@ -268,7 +404,8 @@ class VertexLiveClient:
             # Handle toolCall - Gemini requests function execution
             if "toolCall" in data:
                 tool_call = data["toolCall"]
-                function_calls = tool_call.get("function_calls", [])
+                # Server messages use camelCase field names
+                function_calls = tool_call.get("functionCalls") or tool_call.get("function_calls", [])
 
                 if function_calls:
                     logger.info(f"Received tool call request: {len(function_calls)} function(s)")
@@ -281,8 +418,19 @@ class VertexLiveClient:
             elif "serverContent" in data:
                 server_content = data["serverContent"]
 
-                # Check for modelTurn with audio parts
-                if "modelTurn" in server_content:
+                # Transcription of the user's speech, delivered first so the
+                # orchestrator sees it as soon as the fragment arrives
+                input_transcription = server_content.get("inputTranscription")
+                if input_transcription and input_transcription.get("text"):
+                    text_data = input_transcription["text"]
+                    logger.debug(f"Received input transcription: {text_data}")
+
+                    if self._on_input_transcription:
+                        self._on_input_transcription(text_data)
+
+                # Check for modelTurn with audio parts (transcription sessions
+                # never use the model's own reply, so it is not decoded)
+                if "modelTurn" in server_content and self.response_mode != "transcription":
                     model_turn = server_content["modelTurn"]
 
                     if "parts" in model_turn:
@@ -310,9 +458,14 @@ class VertexLiveClient:
                                 if self._on_text_response:
                                     self._on_text_response(text_data)
 
-            # Handle turnComplete
-            elif "turnComplete" in data:
-                logger.debug("Turn complete")
+                # Turn signals, reported after any content in the same message
+                for key, event in (("interrupted", "interrupted"),
+                                   ("generationComplete", "generation_complete"),
+                                   ("turnComplete", "turn_complete")):
+                    if server_content.get(key):
+                        logger.debug(f"Turn event: {event}")
+                        if self._on_turn_event:
+                            self._on_turn_event(event)
 
             # Handle setupComplete
             elif "setupComplete" in data:
@@ -324,6 +477,9 @@ class VertexLiveClient:
                 cancelled_ids = cancellation.get("ids", [])
                 logger.info(f"Tool calls cancelled: {cancelled_ids}")
 
+                if cancelled_ids and self._on_tool_call_cancellation:
+                    self._on_tool_call_cancellation(cancelled_ids)
+
         except Exception as e:
             logger.error(f"Error handling response: {e}")
             if self._on_error:
@@ -345,6 +501,23 @@ class VertexLiveClient:
         """
         self._on_text_response = callback
 
+    def set_input_transcription_callback(self, callback: Callable[[str], None]) -> None:
+        """Set callback for transcriptions of the user's input audio.
+
+        Args:
+            callback: Function to call with each transcript fragment
+        """
+        self._on_input_transcription = callback
+
+    def set_turn_event_callback(self, callback: Callable[[str], None]) -> None:
+        """Set callback for turn signals.
+
+        Args:
+            callback: Function to call with "interrupted",
+                "generation_complete" or "turn_complete"
+        """
+        self._on_turn_event = callback
+
     def set_tool_call_callback(self, callback: Callable[[List[Dict[str, Any]]], None]) -> None:
         """Set callback for tool/function call requests.
 
@@ -353,6 +526,14 @@ class VertexLiveClient:
         """
         self._on_tool_call = callback
 
+    def set_tool_call_cancellation_callback(self, callback: Callable[[List[str]], None]) -> None:
+        """Set callback for cancelled tool/function calls.
+
+        Args:
+            callback: Function to call with the IDs of the cancelled calls
+        """
+        self._on_tool_call_cancellation = callback
+
     def set_error_callback(self, callback: Callable[[Exception], None]) -> None:
         """Set callback for errors.
 
@@ -1,5 +1,7 @@
 """Test for Claude Code tool wrapper."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from voice_ai_assistant.agent.tools import ClaudeCodeTool
@@ -35,3 +37,75 @@ async def test_claude_tool_execution():
         assert result == "Analysis complete."
         
         await tool.stop()
+
+
+@pytest.mark.asyncio
+async def test_claude_tool_cancel_interrupts_query():
+    """Cancelling a task interrupts Claude Code and frees the client."""
+    with patch('voice_ai_assistant.agent.tools.ClaudeSDKClient') as MockClient:
+        mock_client_instance = MockClient.return_value
+        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
+        mock_client_instance.__aexit__ = AsyncMock()
+        mock_client_instance.query = AsyncMock()
+
+        interrupted = asyncio.Event()
+        mock_client_instance.interrupt = AsyncMock(side_effect=interrupted.set)
+
+        # Streams until interrupted, then ends like the SDK's result message
+        async def mock_receive():
+            await interrupted.wait()
+            yield AssistantMessage(content=[TextBlock(text="Stopped.")])
+
+        mock_client_instance.receive_response = mock_receive
+
+        tool = ClaudeCodeTool()
+        await tool.start()
+
+        task = asyncio.create_task(tool.run_coding_task("Refactor everything"))
+        await asyncio.sleep(0.01)
+
+        assert await tool.cancel() == 1
+        assert await asyncio.wait_for(task, timeout=1.0) == "The task was cancelled."
+        mock_client_instance.interrupt.assert_called_once()
+
+        stats = tool.get_stats()
+        assert stats['tasks_cancelled'] == 1
+        assert stats['client_restarts'] == 0
+        # The interrupted client goes back to the pool for reuse
+        assert stats['pool']['clients'] == 1
+        assert stats['pool']['busy_clients'] == 0
+
+        await tool.stop()
+
+
+@pytest.mark.asyncio
+async def test_claude_tool_deadline_stops_task():
+    """A task exceeding its deadline is interrupted and reported."""
+    with patch('voice_ai_assistant.agent.tools.ClaudeSDKClient') as MockClient:
+        mock_client_instance = MockClient.return_value
+        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
+        mock_client_instance.__aexit__ = AsyncMock()
+        mock_client_instance.query = AsyncMock()
+        # Claude Code ignores the interrupt: the client is replaced
+        mock_client_instance.interrupt = AsyncMock()
+
+        async def mock_receive():
+            await asyncio.sleep(10)
+            yield AssistantMessage(content=[TextBlock(text="Too late.")])
+
+        mock_client_instance.receive_response = mock_receive
+
+        tool = ClaudeCodeTool(task_timeout_s=0.05, interrupt_timeout_s=0.05)
+        await tool.start()
+
+        result = await asyncio.wait_for(tool.run_coding_task("Slow task"), timeout=1.0)
+
+        assert "did not finish" in result
+        stats = tool.get_stats()
+        assert stats['tasks_timed_out'] == 1
+        assert stats['client_restarts'] == 1
+        # The unresponsive client was closed instead of returned
+        assert stats['pool']['clients'] == 0
+        mock_client_instance.__aexit__.assert_called_once()
+
+        await tool.stop()
@@ -0,0 +1,146 @@
+"""Tests for the AudioIOManager capture path, playback flush and ducking."""
+
+import tracemalloc
+
+import numpy as np
+
+from voice_ai_assistant.voice.audio_io_manager import AudioIOManager
+
+BLOCK_SIZE = 1024
+
+# Per-block budget for small Python objects (slices, memoryview, scalars).
+# The previous flatten/resample/astype/tobytes path allocated ~19 KB per block.
+ALLOCATION_CEILING_BYTES = 2048
+
+
+class _Status:
+    def __bool__(self):
+        return False
+
+
+def _make_manager(received):
+    manager = AudioIOManager(block_size=BLOCK_SIZE)
+    manager._audio_callback = received.append
+    manager._callback_is_async = False
+    manager._event_loop = object()
+    manager._is_capturing = True
+    return manager
+
+
+def _blocks(count):
+    rng = np.random.default_rng(0)
+    return [
+        rng.integers(-8000, 8000, size=(BLOCK_SIZE, 1), dtype=np.int16)
+        for _ in range(count)
+    ]
+
+
+def test_capture_delivers_memoryviews_of_resampled_pcm():
+    """Each block is resampled 48k -> 16k and handed on as bytes-like memoryview."""
+    received = []
+    manager = _make_manager(received)
+
+    for block in _blocks(3):
+        manager._audio_input_callback(block, BLOCK_SIZE, None, _Status())
+
+    assert len(received) == 3
+    assert all(isinstance(chunk, memoryview) for chunk in received)
+    total_samples = sum(len(chunk) for chunk in received) // 2
+    assert total_samples == 3 * BLOCK_SIZE // 3
+
+
+def test_level_computed_only_for_subscribers():
+    """Level callbacks receive a normalized level once subscribed."""
+    manager = _make_manager([])
+    levels = []
+
+    manager._audio_input_callback(_blocks(1)[0], BLOCK_SIZE, None, _Status())
+    assert levels == []
+
+    manager.add_level_callback(levels.append)
+    manager._audio_input_callback(
+        np.full((BLOCK_SIZE, 1), 16384, dtype=np.int16), BLOCK_SIZE, None, _Status()
+    )
+    assert levels == [0.5]
+
+    manager.remove_level_callback(levels.append)
+    manager._audio_input_callback(_blocks(1)[0], BLOCK_SIZE, None, _Status())
+    assert levels == [0.5]
+
+
+def test_steady_state_allocation_ceiling_per_block():
+    """Capture callback stays under a fixed allocation budget per block."""
+    received = []
+    manager = _make_manager(received)
+    manager._audio_callback = lambda chunk: None
+    blocks = _blocks(200)
+
+    # Warm up lazily-initialized numpy/logging internals
+    for block in blocks[:20]:
+        manager._audio_input_callback(block, BLOCK_SIZE, None, _Status())
+
+    tracemalloc.start()
+    try:
+        worst = 0
+        for block in blocks[20:]:
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            manager._audio_input_callback(block, BLOCK_SIZE, None, _Status())
+            _, peak = tracemalloc.get_traced_memory()
+            worst = max(worst, peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    assert worst < ALLOCATION_CEILING_BYTES
+
+
+class _OutputStatus:
+    output_underflow = False
+
+
+class _ActiveStream:
+    active = True
+    latency = 0.02
+
+
+def test_flush_playback_silences_next_output_block():
+    """A flush drops queued audio at the next output callback."""
+    manager = AudioIOManager(block_size=BLOCK_SIZE)
+    manager._playback_buffer.write(np.full(BLOCK_SIZE * 4, 1000, dtype=np.int16))
+    manager._is_prebuffering = False
+    manager._output_stream = _ActiveStream()
+
+    discarded_ms = manager.flush_playback()
+    assert discarded_ms == BLOCK_SIZE * 4 * 1000 / manager.hardware_sample_rate
+
+    outdata = np.ones((BLOCK_SIZE, 1), dtype=np.int16)
+    manager._audio_output_callback(outdata, BLOCK_SIZE, None, _OutputStatus())
+
+    assert not outdata.any()
+    assert manager._playback_buffer.available() == 0
+    stats = manager.get_playback_stats()
+    assert stats["flush_count"] == 1
+    assert stats["output_latency_ms"] == 20.0
+    assert manager._flush_done_at is not None
+
+
+def test_duck_playback_attenuates_queued_audio_until_restored():
+    """Ducking applies to audio already queued and can be undone."""
+    manager = AudioIOManager(block_size=BLOCK_SIZE)
+    manager._playback_buffer.write(np.full(BLOCK_SIZE * 4, 1000, dtype=np.int16))
+    manager._is_prebuffering = False
+    outdata = np.zeros((BLOCK_SIZE, 1), dtype=np.int16)
+
+    manager._audio_output_callback(outdata, BLOCK_SIZE, None, _OutputStatus())
+    full_level = manager.output_level_db
+    assert (outdata == 1000).all()
+
+    manager.duck_playback(0.1)
+    manager._audio_output_callback(outdata, BLOCK_SIZE, None, _OutputStatus())
+    assert (outdata == 100).all()
+    assert abs(manager.output_level_db - (full_level - 20.0)) < 0.1
+
+    manager.restore_playback()
+    manager._audio_output_callback(outdata, BLOCK_SIZE, None, _OutputStatus())
+    assert (outdata == 1000).all()
+    assert manager.get_playback_stats()["duck_count"] == 1
@@ -0,0 +1,102 @@
+"""Tests for the coalescing audio thread-to-asyncio handoff."""
+
+import asyncio
+import threading
+
+import pytest
+
+from voice_ai_assistant.voice.audio_handoff import AudioHandoff
+
+
+@pytest.mark.asyncio
+async def test_pending_blocks_are_batched_per_wakeup():
+    """Blocks pushed before the loop runs arrive as one batch."""
+    batches = []
+
+    async def consumer(data):
+        batches.append(data)
+
+    handoff = AudioHandoff(consumer, asyncio.get_running_loop())
+    handoff.start()
+
+    def produce():
+        for i in range(5):
+            handoff.push(bytes([i]))
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0.05)
+
+    assert batches == [b"\x00\x01\x02\x03\x04"]
+    assert handoff.get_stats()["batches_delivered"] == 1
+    handoff.stop()
+
+
+@pytest.mark.asyncio
+async def test_stale_blocks_are_dropped():
+    """Audio older than the staleness threshold is not delivered."""
+    batches = []
+
+    async def consumer(data):
+        batches.append(data)
+
+    handoff = AudioHandoff(consumer, asyncio.get_running_loop(), max_staleness_ms=10)
+    handoff.start()
+    await asyncio.sleep(0)
+
+    handoff.push(b"old")
+    # Stall the loop past the threshold before the consumer can run
+    threading.Event().wait(0.05)
+    await asyncio.sleep(0.01)
+
+    assert batches == []
+    assert handoff.dropped_stale == 1
+    handoff.stop()
+
+
+@pytest.mark.asyncio
+async def test_overflow_keeps_newest_blocks():
+    """A bounded queue drops the oldest blocks when the loop falls behind."""
+    batches = []
+
+    async def consumer(data):
+        batches.append(data)
+
+    handoff = AudioHandoff(consumer, asyncio.get_running_loop(), max_pending_blocks=3)
+    handoff.start()
+
+    for i in range(5):
+        handoff.push(bytes([i]))
+    await asyncio.sleep(0.05)
+
+    assert batches == [b"\x02\x03\x04"]
+    assert handoff.dropped_overflow == 2
+    handoff.stop()
+
+
+@pytest.mark.asyncio
+async def test_slots_being_copied_are_not_reused():
+    """A producer cycling through buffers drops audio instead of overwriting."""
+
+    async def consumer(data):
+        pass
+
+    handoff = AudioHandoff(consumer, asyncio.get_running_loop(), max_pending_blocks=2)
+    handoff.start()
+    for i in range(4):
+        assert handoff.claim_slot(4)
+        handoff.push(bytes([i]))
+
+    # The consumer has popped block 2 and is still copying it
+    handoff._busy_from = 2
+    assert handoff.claim_slot(4)
+    handoff.push(b"\x04")
+    assert handoff.claim_slot(4)
+    handoff.push(b"\x05")
+    assert not handoff.claim_slot(4)
+    assert handoff.get_stats()["dropped_in_use"] == 1
+
+    handoff._busy_from = None
+    assert handoff.claim_slot(4)
+    handoff.stop()
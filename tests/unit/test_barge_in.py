@@ -0,0 +1,62 @@
+"""Tests for confirming local barge-in against speaker echo."""
+
+import numpy as np
+
+from voice_ai_assistant.orchestration.barge_in import BargeInGate, level_db
+
+CHUNK_MS = 20.0
+PLAYBACK_DB = -20.0
+
+
+def _tone(level: float, ms: float = CHUNK_MS, rate: int = 16000) -> bytes:
+    """Sine chunk with the given RMS level in dBFS."""
+    amplitude = 32768.0 * np.sqrt(2.0) * 10 ** (level / 20)
+    t = np.arange(int(rate * ms / 1000)) / rate
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.int16).tobytes()
+
+
+def _feed(gate, level, chunks, speech_active=True):
+    """Feed identical chunks; return the onset time once confirmed."""
+    for _ in range(chunks):
+        chunk = _tone(level)
+        confirmed = gate.update(level_db(chunk), CHUNK_MS, speech_active)
+        if confirmed is not None:
+            return confirmed
+    return None
+
+
+def test_level_db():
+    """The level is the RMS in dBFS."""
+    assert abs(level_db(_tone(-20.0)) + 20.0) < 0.5
+    assert level_db(bytes(640)) <= -99.0
+
+
+def test_echo_during_playback_does_not_interrupt():
+    """Speech well below the playback level is treated as echo."""
+    gate = BargeInGate(min_speech_ms=250.0, level_offset_db=-10.0)
+    gate.start(1.0, PLAYBACK_DB)
+
+    assert _feed(gate, PLAYBACK_DB - 25.0, chunks=100) is None
+    assert gate.pending
+
+
+def test_sustained_speech_over_playback_interrupts():
+    """Loud speech confirms after min_speech_ms, reporting the onset time."""
+    gate = BargeInGate(min_speech_ms=250.0, level_offset_db=-10.0)
+    gate.start(1.0, PLAYBACK_DB)
+
+    assert _feed(gate, PLAYBACK_DB - 5.0, chunks=12) is None
+    assert _feed(gate, PLAYBACK_DB - 5.0, chunks=1) == 1.0
+    assert not gate.pending
+    assert gate.get_stats() == {"confirmed": 1, "rejected": 0}
+
+
+def test_short_noise_is_rejected():
+    """A candidate ends when VAD stops hearing speech before confirmation."""
+    gate = BargeInGate(min_speech_ms=250.0, level_offset_db=-10.0)
+    gate.start(1.0, PLAYBACK_DB)
+
+    assert _feed(gate, PLAYBACK_DB, chunks=5) is None
+    assert _feed(gate, PLAYBACK_DB, chunks=1, speech_active=False) is None
+    assert not gate.pending
+    assert gate.get_stats() == {"confirmed": 0, "rejected": 1}
@@ -0,0 +1,135 @@
+"""Tests for the Claude Code client pool."""
+
+import asyncio
+
+import pytest
+
+from voice_ai_assistant.agent.claude_client_pool import ClaudeClientPool
+
+
+class _FakeClient:
+    """Stands in for ClaudeSDKClient; only the lifecycle is used."""
+
+    def __init__(self):
+        self.open = False
+
+    async def __aenter__(self):
+        self.open = True
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.open = False
+
+
+def _pool(**kwargs):
+    clients = []
+
+    def factory():
+        clients.append(_FakeClient())
+        return clients[-1]
+
+    kwargs.setdefault("health_check_interval_s", 3600)
+    return ClaudeClientPool(factory, **kwargs), clients
+
+
+@pytest.mark.asyncio
+async def test_sessions_get_separate_clients_in_parallel():
+    """Two sessions hold different clients at the same time."""
+    pool, clients = _pool(max_clients=2)
+    await pool.start()
+
+    async with pool.acquire("a") as first:
+        async with pool.acquire("b") as second:
+            assert first.client is not second.client
+            assert pool.get_stats()["busy_clients"] == 2
+
+    assert len(clients) == 2
+    await pool.close()
+    assert not any(client.open for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_session_reuses_its_client():
+    """A session's next task runs on the client holding its context."""
+    pool, clients = _pool(max_clients=2)
+    await pool.start()
+
+    async with pool.acquire("a") as worker:
+        first_client = worker.client
+    async with pool.acquire("b"):
+        pass
+    async with pool.acquire("a") as worker:
+        assert worker.client is first_client
+
+    assert pool.get_stats()["affinity_hits"] == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_same_session_tasks_are_serialized():
+    """A second task of a busy session waits instead of forking its context."""
+    pool, clients = _pool(max_clients=3)
+    await pool.start()
+    order = []
+
+    async def task(name, hold):
+        async with pool.acquire("a"):
+            order.append(f"{name}-start")
+            await asyncio.sleep(hold)
+            order.append(f"{name}-end")
+
+    await asyncio.gather(task("one", 0.02), task("two", 0.0))
+
+    assert order == ["one-start", "one-end", "two-start", "two-end"]
+    assert pool.get_stats()["p95_queue_wait_ms"] > 10
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_full_pool_rebinds_idle_client_with_fresh_subprocess():
+    """At the limit, an idle client of another session is restarted, not shared."""
+    pool, clients = _pool(max_clients=1)
+    await pool.start()
+
+    async with pool.acquire("a") as worker:
+        first_client = worker.client
+    async with pool.acquire("b") as worker:
+        assert worker.client is not first_client
+
+    assert not first_client.open
+    assert pool.size == 1
+    assert pool.get_stats()["rebinds"] == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_worker_is_replaced():
+    """A client marked unhealthy is closed when it is returned."""
+    pool, clients = _pool(max_clients=2)
+    await pool.start()
+
+    async with pool.acquire("a") as worker:
+        worker.healthy = False
+
+    assert not clients[0].open
+    assert pool.size == 0
+    async with pool.acquire("a") as worker:
+        assert worker.client is clients[1]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_clients_are_evicted_down_to_minimum():
+    """Idle session clients close; the warm unbound minimum stays."""
+    pool, clients = _pool(max_clients=3, min_clients=1, idle_timeout_s=0.0)
+    await pool.start()
+
+    async with pool.acquire("a"), pool.acquire("b"):
+        pass
+    await asyncio.sleep(0.01)
+
+    assert await pool.evict_idle() == 2
+    assert pool.size == 0
+    await pool.check_health()
+    assert pool.size == 1
+    await pool.close()
@@ -0,0 +1,142 @@
+"""Tests for the bounded agent conversation memory."""
+
+import asyncio
+
+import pytest
+
+from voice_ai_assistant.agent.conversation_memory import (
+    ConversationMemory,
+    message_text,
+)
+
+
+def _turn(index):
+    """One user/assistant exchange including a tool call."""
+    return [
+        {"role": "user", "content": [{"text": f"question {index}"}]},
+        {
+            "role": "assistant",
+            "content": [
+                {
+                    "toolUse": {
+                        "toolUseId": str(index),
+                        "name": "run_coding_task",
+                        "input": {"task_description": f"look {index}"},
+                    }
+                }
+            ],
+        },
+        {
+            "role": "user",
+            "content": [
+                {
+                    "toolResult": {
+                        "toolUseId": str(index),
+                        "status": "success",
+                        "content": [{"text": "x" * 1000}],
+                    }
+                }
+            ],
+        },
+        {"role": "assistant", "content": [{"text": f"answer {index}"}]},
+    ]
+
+
+def _history(turns):
+    return [message for index in range(turns) for message in _turn(index)]
+
+
+@pytest.mark.asyncio
+async def test_old_turns_are_replaced_by_summary():
+    """Past the window, the oldest turns are summarized and trimmed."""
+    transcripts = []
+
+    async def summarize(previous, transcript):
+        transcripts.append(transcript)
+        return "summary of early turns"
+
+    memory = ConversationMemory(summarize, window_turns=4, keep_turns=2)
+    messages = _history(5)
+
+    assert memory.maybe_compact(messages)
+    await asyncio.sleep(0)
+    assert memory.apply(messages)
+
+    assert memory.summary == "summary of early turns"
+    assert len(messages) == 2 * 4
+    assert messages[0]["content"][0]["text"] == "question 3"
+    # Tool results are shortened in the summarization transcript
+    assert "question 0" in transcripts[0]
+    assert len(transcripts[0]) < 3 * 700
+
+
+@pytest.mark.asyncio
+async def test_no_compaction_within_window():
+    """Short histories are left alone."""
+
+    async def summarize(previous, transcript):
+        raise AssertionError("should not summarize")
+
+    memory = ConversationMemory(summarize, window_turns=4)
+    assert not memory.maybe_compact(_history(4))
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_history_discards_summary():
+    """A summary is only applied to the messages it was made from."""
+
+    async def summarize(previous, transcript):
+        return "stale"
+
+    memory = ConversationMemory(summarize, window_turns=2, keep_turns=1)
+    messages = _history(3)
+    memory.maybe_compact(messages)
+    await asyncio.sleep(0)
+
+    messages[:] = _history(3)
+    assert not memory.apply(messages)
+    assert memory.summary == ""
+    assert len(messages) == 12
+
+
+@pytest.mark.asyncio
+async def test_failed_summary_keeps_turns_and_counts():
+    """A summarization error leaves the history intact."""
+
+    async def summarize(previous, transcript):
+        raise RuntimeError("rate limited")
+
+    memory = ConversationMemory(summarize, window_turns=2, keep_turns=1)
+    messages = _history(3)
+    memory.maybe_compact(messages)
+    await asyncio.sleep(0)
+
+    assert not memory.apply(messages)
+    assert memory.get_stats()["compaction_failures"] == 1
+    assert len(messages) == 12
+
+
+@pytest.mark.asyncio
+async def test_tokens_per_turn_before_and_after():
+    """After compaction the prompt is smaller than the full history would be."""
+
+    async def summarize(previous, transcript):
+        return "short"
+
+    memory = ConversationMemory(summarize, window_turns=4, keep_turns=2)
+    messages = _history(5)
+    memory.maybe_compact(messages)
+    await asyncio.sleep(0)
+    memory.apply(messages)
+
+    memory.record_turn(messages)
+    stats = memory.get_stats()
+    assert (
+        stats["last_tokens_per_turn_after"] < stats["last_tokens_per_turn_before"] / 2
+    )
+
+
+def test_message_text_renders_tool_calls():
+    """Tool uses and results appear in the transcript."""
+    text = message_text(_turn(0)[1])
+    assert "run_coding_task" in text and "look 0" in text
@@ -0,0 +1,84 @@
+"""Tests for progress audio during long tool calls."""
+
+import asyncio
+
+import pytest
+
+from voice_ai_assistant.orchestration.filler_scheduler import FillerScheduler
+
+
+def _scheduler(spoken, **kwargs):
+    async def play_phrase(name):
+        spoken.append(("phrase", name))
+
+    async def speak_text(text):
+        spoken.append(("status", text))
+
+    options = dict(first_delay_s=0.02, interval_s=0.03)
+    options.update(kwargs)
+    return FillerScheduler(play_phrase, speak_text, **options)
+
+
+@pytest.mark.asyncio
+async def test_short_tool_call_stays_silent():
+    """Tools returning before the threshold produce no audio."""
+    spoken = []
+    scheduler = _scheduler(spoken)
+
+    scheduler.tool_started()
+    await asyncio.sleep(0.005)
+    await scheduler.tool_finished()
+    await asyncio.sleep(0.04)
+
+    assert spoken == []
+    assert scheduler.get_stats()["long_tool_calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_long_tool_call_plays_fillers_at_intervals():
+    """Fillers follow the phrase order and stop when the tool returns."""
+    spoken = []
+    scheduler = _scheduler(spoken)
+
+    scheduler.tool_started()
+    await asyncio.sleep(0.07)
+    await scheduler.tool_finished()
+    count = len(spoken)
+    await asyncio.sleep(0.05)
+
+    assert spoken[:2] == [("phrase", "working"), ("phrase", "still_working")]
+    assert len(spoken) == count
+    assert not scheduler.is_active
+
+
+@pytest.mark.asyncio
+async def test_latest_status_replaces_filler():
+    """A fresh tool status is spoken instead of a filler; older ones are dropped."""
+    spoken = []
+    scheduler = _scheduler(spoken)
+
+    scheduler.tool_started()
+    scheduler.status("Reading config.py.")
+    scheduler.status("Searching the code.")
+    await asyncio.sleep(0.03)
+    await scheduler.tool_finished()
+
+    assert spoken == [("status", "Searching the code.")]
+    assert scheduler.get_stats()["statuses_dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_waits_for_queued_audio():
+    """Progress audio does not talk over audio still playing."""
+    spoken = []
+    queued = [40.0]
+    scheduler = _scheduler(spoken, queued_ms=lambda: queued[0])
+
+    scheduler.tool_started()
+    await asyncio.sleep(0.03)
+    assert spoken == []
+
+    queued[0] = 0.0
+    await asyncio.sleep(0.04)
+    await scheduler.tool_finished()
+    assert spoken and spoken[0] == ("phrase", "working")
@@ -0,0 +1,71 @@
+"""Tests for local recognition of trivial voice commands."""
+
+import pytest
+
+from voice_ai_assistant.orchestration.local_intents import LocalIntentRecognizer
+
+
+@pytest.mark.parametrize(
+    "text,intent",
+    [
+        ("Stop.", "stop"),
+        ("Okay, stop talking please", "stop"),
+        ("Never mind", "never_mind"),
+        ("What did you say?", "repeat"),
+        ("Could you repeat that?", "repeat"),
+        ("Speak up", "louder"),
+        ("Could you speak a little slower?", "slower"),
+        ("Faster please", "faster"),
+    ],
+)
+def test_commands_are_recognized(text, intent):
+    """Short commands match despite punctuation and politeness words."""
+    match = LocalIntentRecognizer().match(text)
+
+    assert match is not None
+    assert match.intent == intent
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Stop the build from failing",
+        "Can you repeat the tests for the parser module",
+        "Why is the loop so slow",
+        "",
+    ],
+)
+def test_requests_go_to_the_agent(text):
+    """A command word inside a longer request is not a command."""
+    assert LocalIntentRecognizer().match(text) is None
+
+
+def test_long_utterances_are_not_matched():
+    """Utterances over max_words are never treated as commands."""
+    recognizer = LocalIntentRecognizer(max_words=3)
+
+    assert recognizer.match("please please please stop") is None
+    assert recognizer.match("stop") is not None
+
+
+def test_custom_intents():
+    """The command grammar can be replaced."""
+    recognizer = LocalIntentRecognizer(intents={"mute": ("mute", "go silent")})
+
+    assert recognizer.match("Go silent.").intent == "mute"
+    assert recognizer.match("stop") is None
+
+
+def test_stats_count_saved_calls():
+    """Every match counts as an agent call saved."""
+    recognizer = LocalIntentRecognizer()
+    recognizer.match("stop")
+    recognizer.match("repeat that")
+    recognizer.match("stop the build from failing")
+
+    stats = recognizer.get_stats()
+    assert stats["utterances"] == 3
+    assert stats["llm_calls_saved"] == 2
+    assert stats["matches"] == {"stop": 1, "repeat": 1}
+    assert stats["rejected_low_confidence"] == 1
+    assert stats["avg_match_us"] > 0
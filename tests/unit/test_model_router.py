@@ -0,0 +1,148 @@
+"""Tests for routing turns between the conversational path and the coding agent."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from voice_ai_assistant.agent.model_router import (
+    CODING,
+    CONVERSATIONAL,
+    LatencyHistogram,
+    TurnRouter,
+)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Hello there!",
+        "Thanks a lot.",
+        "Sounds good",
+        "What do you mean?",
+        "Could you explain that again?",
+        "How's it going?",
+    ],
+)
+def test_small_talk_is_conversational(text):
+    """Greetings, acknowledgements and clarifications skip the coding agent."""
+    assert TurnRouter().classify(text).route == CONVERSATIONAL
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "What does the main function do?",
+        "Open settings.py",
+        "Why does parse_config fail",
+        "Can you explain how the audio pipeline handles resampling between devices",
+        "Fix it",
+    ],
+)
+def test_code_questions_go_to_the_coding_agent(text):
+    """Anything about code, files or actions on them uses the coding agent."""
+    assert TurnRouter().classify(text).route == CODING
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Undo that",
+        "Try again",
+        "Do it",
+        "Yes, go ahead",
+        "What went wrong?",
+        "Make it faster",
+    ],
+)
+def test_short_commands_go_to_the_coding_agent(text):
+    """Short imperatives refer to the work even without a coding term."""
+    decision = TurnRouter().classify(text, last_reply="I updated the parser.")
+
+    assert decision.route == CODING
+    assert decision.reason == "default"
+
+
+def test_answer_to_agent_question_goes_to_the_coding_agent():
+    """Even small talk may confirm a coding task the agent offered."""
+    router = TurnRouter()
+
+    assert (
+        router.classify("sounds good", last_reply="Should I run the tests?").route
+        == CODING
+    )
+    assert (
+        router.classify("sounds good", last_reply="Done, all tests pass.").route
+        == CONVERSATIONAL
+    )
+
+
+def test_latency_histogram_buckets():
+    """Samples land in the bucket of their upper bound."""
+    histogram = LatencyHistogram(buckets_ms=(100, 500))
+    for latency in (50, 100, 300, 900):
+        histogram.record(latency)
+
+    stats = histogram.get_stats()
+    assert stats["buckets"] == {"le_100": 2, "le_500": 1, "gt_500": 1}
+    assert stats["count"] == 4
+    assert stats["p95_ms"] == 900
+
+
+class _FakeAgent:
+    """Strands agent stand-in that records how it was built and answers."""
+
+    instances = []
+
+    def __init__(
+        self,
+        model=None,
+        tools=None,
+        system_prompt=None,
+        messages=None,
+        callback_handler=None,
+    ):
+        self.tools = tools
+        self.messages = messages if messages is not None else []
+        _FakeAgent.instances.append(self)
+
+    async def stream_async(self, text):
+        self.messages.append({"role": "user", "content": [{"text": text}]})
+        reply = "Looking at the code." if self.tools else "Hi!"
+        self.messages.append({"role": "assistant", "content": [{"text": reply}]})
+        yield {"data": reply}
+
+
+@pytest.mark.asyncio
+async def test_agent_routes_turns(monkeypatch):
+    """Small talk uses a tool-less agent and stays in the coding agent's history."""
+    pytest.importorskip("strands")
+    from voice_ai_assistant.agent.strands_agent import StrandsAgent
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    _FakeAgent.instances = []
+    with (
+        patch("voice_ai_assistant.agent.strands_agent.ClaudeCodeTool") as MockTool,
+        patch("voice_ai_assistant.agent.strands_agent.Agent", _FakeAgent),
+    ):
+        MockTool.return_value.start = AsyncMock()
+        agent = StrandsAgent(memory_window_turns=None)
+        await agent.start()
+
+        assert [chunk async for chunk in agent.process_message("hello")] == ["Hi!"]
+        assert [
+            chunk async for chunk in agent.process_message("What does main.py do?")
+        ] == ["Looking at the code."]
+
+    coding_agent, fast_agent = _FakeAgent.instances
+    assert not fast_agent.tools
+    assert [m["content"][0]["text"] for m in coding_agent.messages] == [
+        "hello",
+        "Hi!",
+        "What does main.py do?",
+        "Looking at the code.",
+    ]
+
+    stats = agent.router.get_stats()
+    assert stats["decisions"] == {CONVERSATIONAL: 1, CODING: 1}
+    assert stats["latency"][CONVERSATIONAL]["total"]["count"] == 1
+    assert stats["latency"][CODING]["ttft"]["count"] == 1
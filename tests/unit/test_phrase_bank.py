@@ -0,0 +1,73 @@
+"""Tests for the pre-synthesized phrase bank."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from voice_ai_assistant.voice.phrase_bank import PhraseBank
+
+
+class FakeTTS:
+    """TTSManager stand-in producing 100 ms of a tone per phrase."""
+
+    def __init__(self, fail=()):
+        self.voice_signature = "voice-a"
+        self.fail = set(fail)
+        self.calls = []
+
+    async def synthesize(self, text):
+        self.calls.append(text)
+        if text in self.fail:
+            return None
+        tone = (np.sin(np.arange(2400) / 10) * 8000).astype(np.int16)
+        return tone.tobytes()
+
+
+@pytest.mark.asyncio
+async def test_phrases_are_resampled_to_hardware_rate():
+    """24 kHz clips are stored as 48 kHz PCM, including the filter tail."""
+    bank = PhraseBank(
+        FakeTTS(),
+        hardware_sample_rate=48000,
+        source_sample_rate=24000,
+        phrases={"ack": "Let me check that."},
+    )
+
+    assert await bank.load() == 1
+
+    samples = bank.get("ack")
+    assert samples.dtype == np.int16
+    assert len(samples) >= 4800
+    assert bank.find("Let me  check that.") == "ack"
+    assert bank.get_stats()["plays"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_phrase_is_skipped():
+    """One failed synthesis does not prevent the others from loading."""
+    bank = PhraseBank(FakeTTS(fail={"Oops."}), phrases={"ok": "Okay.", "bad": "Oops."})
+
+    assert await bank.load() == 1
+    assert bank.get("bad") is None
+    assert bank.get_stats()["load_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_when_voice_or_phrases_change():
+    """Unchanged settings do not trigger a reload; a new voice does."""
+    tts = FakeTTS()
+    bank = PhraseBank(tts, phrases={"ok": "Okay."})
+    await bank.load()
+
+    assert bank.refresh_if_changed() is False
+
+    tts.voice_signature = "voice-b"
+    assert bank.refresh_if_changed() is True
+    await asyncio.wait_for(bank._refresh_task, timeout=1.0)
+    assert bank.get_stats()["loads"] == 2
+
+    bank.set_phrases({"ok": "Okay.", "done": "Done."})
+    await asyncio.wait_for(bank._refresh_task, timeout=1.0)
+    assert bank.get("done") is not None
+    await bank.close()
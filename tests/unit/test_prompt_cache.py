@@ -0,0 +1,126 @@
+"""Tests for prompt caching of the agent's stable prefix."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("strands")
+
+from voice_ai_assistant.agent.prompt_cache import CachingAnthropicModel  # noqa: E402
+from voice_ai_assistant.agent.strands_agent import StrandsAgent  # noqa: E402
+
+TOOL_SPEC = {
+    "name": "run_coding_task",
+    "description": "Perform a coding task.",
+    "inputSchema": {"json": {"type": "object", "properties": {}}},
+}
+
+
+def _model():
+    return CachingAnthropicModel(
+        client_args={"api_key": "test"},
+        model_id="claude-test",
+        max_tokens=100,
+        stable_system_prompt="You are a voice assistant.",
+    )
+
+
+def test_request_marks_tools_and_system_prompt():
+    """The last tool and the system prompt carry cache breakpoints."""
+    request = _model().format_request(
+        [{"role": "user", "content": [{"text": "hi"}]}],
+        [TOOL_SPEC],
+        "You are a voice assistant.",
+    )
+
+    assert request["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert request["system"] == [
+        {
+            "type": "text",
+            "text": "You are a voice assistant.",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+def test_summary_gets_its_own_breakpoint():
+    """A summary appended to the stable prompt is cached separately."""
+    request = _model().format_request(
+        [{"role": "user", "content": [{"text": "hi"}]}],
+        [TOOL_SPEC],
+        "You are a voice assistant.\n\nSummary: fixed the parser.",
+    )
+
+    stable, summary = request["system"]
+    assert stable["text"] == "You are a voice assistant."
+    assert summary["text"] == "\n\nSummary: fixed the parser."
+    assert summary["cache_control"] == {"type": "ephemeral"}
+
+
+def test_usage_keeps_cache_token_counts():
+    """Cache read and write counts survive the usage conversion."""
+    chunk = _model().format_chunk(
+        {
+            "type": "metadata",
+            "usage": {
+                "input_tokens": 20,
+                "output_tokens": 5,
+                "cache_read_input_tokens": 1800,
+                "cache_creation_input_tokens": 0,
+            },
+        }
+    )
+
+    assert chunk["metadata"]["usage"]["cacheReadInputTokens"] == 1800
+    assert chunk["metadata"]["usage"]["cacheWriteInputTokens"] == 0
+
+
+class _FakeCachingModelAgent:
+    """Agent whose model writes the prefix to the cache once, then reads it."""
+
+    def __init__(self, *args, **kwargs):
+        self.messages = []
+        self.calls = 0
+
+    async def stream_async(self, text):
+        cached = self.calls > 0
+        self.calls += 1
+        # A cached prefix is processed faster before the first token
+        await asyncio.sleep(0.005 if cached else 0.05)
+        yield {"data": "Sure."}
+        yield {
+            "event": {
+                "metadata": {
+                    "usage": {
+                        "inputTokens": 30,
+                        "outputTokens": 5,
+                        "cacheReadInputTokens": 2000 if cached else 0,
+                        "cacheWriteInputTokens": 0 if cached else 2000,
+                    }
+                }
+            }
+        }
+
+
+@pytest.mark.asyncio
+async def test_repeated_turns_read_from_cache(monkeypatch):
+    """Per-turn stats show the write, then cheaper and faster cached turns."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    with (
+        patch("voice_ai_assistant.agent.strands_agent.ClaudeCodeTool") as MockTool,
+        patch("voice_ai_assistant.agent.strands_agent.Agent", _FakeCachingModelAgent),
+    ):
+        MockTool.return_value.start = AsyncMock()
+        agent = StrandsAgent(memory_window_turns=None, route_turns=False)
+        await agent.start()
+
+        for text in ["first", "second", "third"]:
+            assert [chunk async for chunk in agent.process_message(text)] == ["Sure."]
+
+    stats = agent.cache_stats.get_stats()
+    assert stats["turns"] == 3
+    assert stats["cache_write_tokens"] == 2000
+    assert stats["cache_hit_turns"] == 2
+    assert stats["cache_read_ratio"] > 0.6
+    assert stats["avg_ttft_ms_cached"] < stats["avg_ttft_ms_uncached"]
@@ -0,0 +1,73 @@
+"""Tests for the streaming polyphase resampler."""
+
+import numpy as np
+import pytest
+
+from voice_ai_assistant.voice.resampler import StreamingResampler
+
+
+def _sine(rate: int, seconds: float = 1.0, freq: float = 440.0) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (8000 * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+
+
+def _process_in_blocks(
+    resampler: StreamingResampler, audio: np.ndarray, sizes
+) -> np.ndarray:
+    outputs = []
+    position = 0
+    for size in sizes:
+        if position >= len(audio):
+            break
+        outputs.append(resampler.process(audio[position : position + size]).copy())
+        position += size
+    return np.concatenate(outputs)
+
+
+@pytest.mark.parametrize("input_rate,output_rate", [(48000, 16000), (24000, 48000)])
+def test_blockwise_matches_single_pass(input_rate, output_rate):
+    """Filter state carried across blocks gives the same result as one big block."""
+    audio = _sine(input_rate)
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(1, 1025, size=len(audio))
+
+    streamed = _process_in_blocks(
+        StreamingResampler(input_rate, output_rate, max_block_size=1024), audio, sizes
+    )
+    single = StreamingResampler(
+        input_rate, output_rate, max_block_size=len(audio)
+    ).process(audio)
+
+    assert len(streamed) == len(audio) * output_rate // input_rate
+    np.testing.assert_array_equal(streamed, single)
+
+
+@pytest.mark.parametrize("input_rate,output_rate", [(48000, 16000), (24000, 48000)])
+def test_sine_is_preserved(input_rate, output_rate):
+    """Resampled tone matches the ideal tone once the filter delay is accounted for."""
+    resampler = StreamingResampler(input_rate, output_rate, max_block_size=1024)
+    output = _process_in_blocks(resampler, _sine(input_rate), [1024] * input_rate)
+
+    t = (np.arange(len(output)) - resampler.delay_samples) / output_rate
+    ideal = 8000 * np.sin(2 * np.pi * 440.0 * t)
+    error = np.abs(output[200:-200] - ideal[200:-200]).max()
+    assert error < 20
+
+
+def test_output_is_view_into_preallocated_buffer():
+    """process() writes into the same int16 buffer on every call."""
+    resampler = StreamingResampler(48000, 16000, max_block_size=1024)
+    block = np.zeros(1024, dtype=np.int16)
+
+    first = resampler.process(block)
+    second = resampler.process(block)
+
+    assert first.dtype == np.int16
+    assert np.shares_memory(first, second)
+
+
+def test_rejects_oversized_block():
+    """Blocks larger than max_block_size are rejected."""
+    resampler = StreamingResampler(48000, 16000, max_block_size=1024)
+    with pytest.raises(ValueError):
+        resampler.process(np.zeros(2048, dtype=np.int16))
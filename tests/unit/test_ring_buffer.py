@@ -0,0 +1,66 @@
+"""Tests for the SPSC playback ring buffer."""
+
+import numpy as np
+
+from voice_ai_assistant.voice.ring_buffer import AudioRingBuffer
+
+
+def test_write_then_read_wraps_around():
+    """Samples come out in order across the wrap-around point."""
+    ring = AudioRingBuffer(8)
+    out = np.zeros(5, dtype=np.int16)
+
+    ring.write(np.arange(5, dtype=np.int16))
+    assert ring.read_into(out) == 5
+
+    ring.write(np.arange(5, 11, dtype=np.int16))
+    assert ring.available() == 6
+
+    out = np.zeros(6, dtype=np.int16)
+    assert ring.read_into(out) == 6
+    np.testing.assert_array_equal(out, np.arange(5, 11))
+
+
+def test_short_read_pads_with_silence():
+    """Reading more than is available zero-fills the remainder."""
+    ring = AudioRingBuffer(16)
+    ring.write(np.full(3, 7, dtype=np.int16))
+
+    out = np.full(6, -1, dtype=np.int16)
+    assert ring.read_into(out) == 3
+    np.testing.assert_array_equal(out, [7, 7, 7, 0, 0, 0])
+
+
+def test_overrun_drops_excess_and_counts():
+    """Writes beyond capacity are dropped and recorded."""
+    ring = AudioRingBuffer(4)
+
+    assert ring.write(np.ones(6, dtype=np.int16)) == 4
+    assert ring.overrun_count == 1
+    assert ring.dropped_samples == 2
+    assert ring.free_space() == 0
+
+
+def test_clear_discards_buffered_audio():
+    """clear() empties the buffer without touching counters."""
+    ring = AudioRingBuffer(8)
+    ring.write(np.ones(5, dtype=np.int16))
+
+    ring.clear()
+
+    assert ring.available() == 0
+    assert ring.free_space() == 8
+
+
+def test_discard_available_drops_written_samples():
+    """The consumer can skip everything written so far."""
+    ring = AudioRingBuffer(8)
+    ring.write(np.arange(6, dtype=np.int16))
+
+    assert ring.discard_available() == 6
+    assert ring.available() == 0
+
+    ring.write(np.array([9], dtype=np.int16))
+    out = np.zeros(1, dtype=np.int16)
+    assert ring.read_into(out) == 1
+    assert out[0] == 9
@@ -0,0 +1,225 @@
+"""Tests for speculative agent execution."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from voice_ai_assistant.orchestration.speculative_agent import (
+    SpeculativeAgentExecutor,
+    transcript_similarity,
+)
+
+
+class FakeAgent:
+    """Agent double that answers by echoing the prompt word by word."""
+
+    def __init__(self, uses_tool: bool = False):
+        self.messages = []
+        self.prompts = []
+        self.tools_run = []
+        self.uses_tool = uses_tool
+
+    def history_length(self):
+        return len(self.messages)
+
+    def truncate_history(self, length):
+        del self.messages[length:]
+
+    async def process_message(self, text, tool_gate=None):
+        self.prompts.append(text)
+        self.messages.append(("user", text))
+        if self.uses_tool:
+            if tool_gate is not None:
+                await tool_gate.wait()
+            self.tools_run.append(text)
+        for word in text.split():
+            await asyncio.sleep(0)
+            yield word + " "
+        self.messages.append(("assistant", text))
+
+
+async def _collect(stream):
+    return "".join([chunk async for chunk in stream])
+
+
+def test_similarity_ignores_case_and_punctuation():
+    """Normalization makes cosmetic differences irrelevant."""
+    assert transcript_similarity("Read the main file.", "read the main file") == 1.0
+    assert transcript_similarity("read the main file", "delete the main file") < 0.85
+
+
+@pytest.mark.asyncio
+async def test_hit_replays_speculative_output():
+    """A matching final reuses the speculative run instead of starting another."""
+    agent = FakeAgent()
+    executor = SpeculativeAgentExecutor(agent, min_stability=0.5)
+
+    assert await executor.speculate("s1", "list the test files", stability=0.9)
+    await asyncio.sleep(0.01)
+
+    output = await _collect(executor.stream("s1", "List the test files."))
+
+    assert output == "list the test files "
+    assert agent.prompts == ["list the test files"]
+    assert executor.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_miss_cancels_and_rolls_back_history():
+    """A diverging final discards the speculative run and its history."""
+    agent = FakeAgent()
+    executor = SpeculativeAgentExecutor(agent, min_stability=0.5)
+
+    await executor.speculate("s1", "open the config module", stability=0.9)
+    await asyncio.sleep(0.01)
+
+    output = await _collect(executor.stream("s1", "close every terminal window now"))
+
+    assert output == "close every terminal window now "
+    assert agent.messages == [
+        ("user", "close every terminal window now"),
+        ("assistant", "close every terminal window now"),
+    ]
+    stats = executor.get_stats()
+    assert stats["misses"] == 1
+    assert stats["wasted_chunks"] == 4
+
+
+@pytest.mark.asyncio
+async def test_unstable_partials_are_ignored():
+    """Low stability or very short partials never start a run."""
+    agent = FakeAgent()
+    executor = SpeculativeAgentExecutor(agent, min_stability=0.8, min_words=3)
+
+    assert not await executor.speculate("s1", "open the file", stability=0.3)
+    assert not await executor.speculate("s1", "open it", stability=0.95)
+    assert agent.prompts == []
+
+
+@pytest.mark.asyncio
+async def test_tools_wait_for_confirmation():
+    """A speculative run never executes a tool before the final transcript."""
+    agent = FakeAgent(uses_tool=True)
+    executor = SpeculativeAgentExecutor(agent, min_stability=0.5)
+
+    await executor.speculate("s1", "run the unit tests", stability=0.9)
+    await asyncio.sleep(0.01)
+    assert agent.tools_run == []
+
+    await executor.cancel("s1")
+
+    assert agent.tools_run == []
+    assert agent.messages == []
+
+
+class _FakeStrandsAgent:
+    """Strands agent stand-in; "tests" prompts call a tool."""
+
+    def __init__(
+        self,
+        model=None,
+        tools=None,
+        system_prompt=None,
+        messages=None,
+        callback_handler=None,
+    ):
+        self.messages = messages if messages is not None else []
+
+    async def stream_async(self, text):
+        self.messages.append({"role": "user", "content": [{"text": text}]})
+        if "tests" in text:
+            tool_use = {"toolUseId": "t1", "name": "claude_code", "input": {}}
+            self.messages.append(
+                {"role": "assistant", "content": [{"toolUse": tool_use}]}
+            )
+            yield {"current_tool_use": tool_use}
+        self.messages.append({"role": "assistant", "content": [{"text": "done"}]})
+        yield {"data": "done"}
+
+
+@pytest.mark.asyncio
+async def test_miss_rolls_back_after_compaction(monkeypatch):
+    """A summary applied by the speculative run does not break its rollback."""
+    pytest.importorskip("strands")
+    from voice_ai_assistant.agent.strands_agent import StrandsAgent
+
+    async def summarize(self, previous, transcript):
+        return "The user said hello."
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    with (
+        patch("voice_ai_assistant.agent.strands_agent.ClaudeCodeTool") as MockTool,
+        patch("voice_ai_assistant.agent.strands_agent.Agent", _FakeStrandsAgent),
+        patch.object(StrandsAgent, "_summarize", summarize),
+    ):
+        MockTool.return_value.start = AsyncMock()
+        agent = StrandsAgent(memory_window_turns=2, route_turns=False)
+        await agent.start()
+        executor = SpeculativeAgentExecutor(agent, min_stability=0.5)
+
+        for text in ("hello one", "hello two", "hello three"):
+            await _collect(agent.process_message(text))
+        await asyncio.sleep(0.01)  # Summary of the first two turns is ready
+
+        # The speculative run applies the summary, then stops at its tool call
+        await executor.speculate("s1", "run the unit tests", stability=0.9)
+        await asyncio.sleep(0.01)
+        assert agent.memory.compactions == 1
+
+        await _collect(executor.stream("s1", "close every terminal window now"))
+
+    assert [message["content"][0].get("text") for message in agent.agent.messages] == [
+        "hello three",
+        "done",
+        "close every terminal window now",
+        "done",
+    ]
+
+
+class _FailingAgent(FakeAgent):
+    """Agent double whose run for one prompt fails after its first word."""
+
+    def __init__(self, failing_prompt):
+        super().__init__()
+        self.failing_prompt = failing_prompt
+
+    async def process_message(self, text, tool_gate=None):
+        if text != self.failing_prompt:
+            async for chunk in super().process_message(text, tool_gate):
+                yield chunk
+            return
+        self.prompts.append(text)
+        yield text.split()[0] + " "
+        raise RuntimeError("model overloaded")
+
+
+@pytest.mark.asyncio
+async def test_speculative_run_error_reaches_the_consumer():
+    """A failed speculative run raises on the hit path instead of going silent."""
+    agent = _FailingAgent("list the test files")
+    executor = SpeculativeAgentExecutor(agent, min_stability=0.5)
+
+    await executor.speculate("s1", "list the test files", stability=0.9)
+    await asyncio.sleep(0.01)
+
+    chunks = []
+    with pytest.raises(RuntimeError, match="model overloaded"):
+        async for chunk in executor.stream("s1", "list the test files"):
+            chunks.append(chunk)
+    assert chunks == ["list "]
+
+
+@pytest.mark.asyncio
+async def test_failed_speculative_run_is_discarded_on_miss():
+    """A miss discards a failed run without raising its error."""
+    agent = _FailingAgent("open the config module")
+    executor = SpeculativeAgentExecutor(agent, min_stability=0.5)
+
+    await executor.speculate("s1", "open the config module", stability=0.9)
+    await asyncio.sleep(0.01)
+
+    output = await _collect(executor.stream("s1", "close every terminal window now"))
+
+    assert output == "close every terminal window now "
+    assert executor.get_stats()['misses'] == 1
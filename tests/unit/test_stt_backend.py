@@ -0,0 +1,125 @@
+"""Tests for pluggable speech-to-text backends."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from voice_ai_assistant.voice.stt_backend import FakeSTTBackend, create_stt_backend
+
+WORD_BYTES = 6400
+
+
+@pytest.mark.asyncio
+async def test_fake_backend_reveals_interim_words_then_final():
+    """Interim hypotheses grow word by word; end_utterance emits the final."""
+    backend = FakeSTTBackend(script=["open the main file"], bytes_per_word=WORD_BYTES)
+    results = []
+    backend.set_transcript_callback(results.append)
+    await backend.start()
+
+    for _ in range(3):
+        await backend.send_audio(b"\x00" * WORD_BYTES)
+    await backend.end_utterance()
+
+    assert [(r.text, r.is_final) for r in results] == [
+        ("open", False),
+        ("open the", False),
+        ("open the main", False),
+        ("open the main file", True),
+    ]
+    stats = backend.get_stats()
+    assert stats["interim_results"] == 3
+    assert stats["final_results"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fake_backend_scripted_utterances_in_order():
+    """Each utterance advances the script; final_after_bytes end-points by itself."""
+    backend = FakeSTTBackend(
+        script=["yes", "no"], bytes_per_word=WORD_BYTES, final_after_bytes=WORD_BYTES
+    )
+    finals = []
+
+    async def on_transcript(result):
+        if result.is_final:
+            finals.append(result.text)
+
+    backend.set_transcript_callback(on_transcript)
+    await backend.start()
+
+    for _ in range(3):
+        await backend.send_audio(b"\x00" * WORD_BYTES)
+
+    assert finals == ["yes", "no", "yes"]
+
+
+@pytest.mark.asyncio
+async def test_end_utterance_without_audio_is_ignored():
+    """A local end-pointer event with no audio sent emits nothing."""
+    backend = FakeSTTBackend()
+    results = []
+    backend.set_transcript_callback(results.append)
+    await backend.start()
+
+    await backend.end_utterance()
+
+    assert results == []
+
+
+def test_unknown_backend_rejected():
+    """The factory only accepts registered backend names."""
+    with pytest.raises(ValueError):
+        create_stt_backend("whisper")
+
+
+@pytest.mark.asyncio
+async def test_google_backend_streams_one_utterance():
+    """Streaming config goes first, audio follows, results are delivered."""
+    speech = pytest.importorskip("google.cloud.speech")
+    from voice_ai_assistant.voice.stt_backend import GoogleSpeechSTTBackend
+
+    sent = []
+    event_types = speech.StreamingRecognizeResponse.SpeechEventType
+
+    class FakeClient:
+        async def streaming_recognize(self, requests):
+            async def responses():
+                async for request in requests:
+                    sent.append(request)
+                    if len(sent) == 3:
+                        break
+                yield SimpleNamespace(
+                    speech_event_type=event_types.END_OF_SINGLE_UTTERANCE,
+                    results=[
+                        SimpleNamespace(
+                            is_final=True,
+                            stability=0.0,
+                            alternatives=[
+                                SimpleNamespace(
+                                    transcript="run the tests", confidence=0.9
+                                )
+                            ],
+                        )
+                    ],
+                )
+
+            return responses()
+
+    backend = GoogleSpeechSTTBackend(client=FakeClient())
+    results = []
+    backend.set_transcript_callback(results.append)
+    await backend.start()
+
+    await backend.send_audio(b"\x01\x00" * 800)
+    await backend.send_audio(b"\x02\x00" * 800)
+    for _ in range(20):
+        if results:
+            break
+        await asyncio.sleep(0.01)
+    await backend.stop()
+
+    assert sent[0].streaming_config.single_utterance
+    assert sent[1].audio_content == b"\x01\x00" * 800
+    assert [(r.text, r.is_final) for r in results] == [("run the tests", True)]
+    assert backend.get_stats()["streams_opened"] == 1
@@ -0,0 +1,87 @@
+"""Tests for incremental sentence segmentation of agent output."""
+
+from voice_ai_assistant.orchestration.text_segmenter import SentenceSegmenter
+
+
+def _segment(text, chunk_size=3, **kwargs):
+    """Feed text in small chunks, as the agent streams it."""
+    segmenter = SentenceSegmenter(**kwargs)
+    segments = []
+    for i in range(0, len(text), chunk_size):
+        segments.extend(segmenter.feed(text[i : i + chunk_size]))
+    remaining = segmenter.flush()
+    if remaining:
+        segments.append(remaining)
+    return segments, segmenter
+
+
+def test_first_segment_ends_at_a_clause():
+    """Speech starts after the first clause instead of a whole sentence."""
+    segments, _ = _segment(
+        "Sure thing, I found the problem. "
+        "The loop never terminates because the counter is reset.",
+        first_segment_min_chars=10,
+        min_segment_chars=10,
+    )
+
+    assert segments == [
+        "Sure thing,",
+        "I found the problem.",
+        "The loop never terminates because the counter is reset.",
+    ]
+
+
+def test_abbreviations_decimals_and_identifiers_do_not_split():
+    """Periods inside abbreviations, numbers and dotted names are not sentence ends."""
+    text = (
+        "Call os.path.join, e.g. with the version 3.11 path. "
+        "Dr. Smith wrote main.py in 2.5 days. Done."
+    )
+    segments, _ = _segment(text, first_segment_min_chars=40, min_segment_chars=10)
+
+    assert segments == [
+        "Call os.path.join, e.g. with the version 3.11 path.",
+        "Dr. Smith wrote main.py in 2.5 days.",
+        "Done.",
+    ]
+
+
+def test_markdown_lists_and_emphasis_become_plain_segments():
+    """List items split at line starts and markdown markers are not spoken."""
+    text = "Here are the **steps**:\n1. Install the package\n2. Run `pytest`\n"
+    segments, _ = _segment(text, first_segment_min_chars=5, min_segment_chars=5)
+
+    assert segments == [
+        "Here are the steps:",
+        "1. Install the package",
+        "2. Run pytest",
+    ]
+
+
+def test_code_block_splits_only_on_lines():
+    """Punctuation inside fenced code does not end segments."""
+    text = "Change it to:\n```\nx = a.b(1, 2). c\n```\nThat fixes it."
+    segments, _ = _segment(text, first_segment_min_chars=5, min_segment_chars=5)
+
+    assert "x = a.b(1, 2). c" in segments
+
+
+def test_segments_grow_with_queued_audio():
+    """With plenty of audio queued, later segments span several sentences."""
+    sentences = "One more thing to check. " * 8
+
+    short, _ = _segment(sentences, queued_ms=lambda: 0.0, min_segment_chars=10)
+    long, _ = _segment(sentences, queued_ms=lambda: 8000.0, min_segment_chars=10)
+
+    assert len(short) == 8
+    assert len(long) < len(short)
+    assert max(len(s) for s in long) >= 100
+
+
+def test_long_text_without_boundaries_is_cut():
+    """Run-on text is split before max_segment_chars at a word boundary."""
+    segments, segmenter = _segment("word " * 100, max_segment_chars=80)
+
+    assert all(len(s) <= 80 for s in segments)
+    assert " ".join(segments) == ("word " * 100).strip()
+    assert segmenter.get_stats()["forced_splits"] >= 1
@@ -0,0 +1,68 @@
+"""Tests for per-session transcript assembly."""
+
+import pytest
+
+from voice_ai_assistant.orchestration.transcript_assembler import TranscriptAssembler
+
+
+@pytest.mark.asyncio
+async def test_fragments_dispatch_once_per_turn():
+    """Several fragments become one utterance and one agent call."""
+    turns = []
+
+    async def on_turn(session_id, text):
+        turns.append((session_id, text))
+
+    assembler = TranscriptAssembler(on_turn=on_turn)
+    for fragment in ["Read", " the main", " file."]:
+        assembler.add_fragment("s1", fragment)
+
+    assert (
+        await assembler.handle_event("s1", "generation_complete")
+        == "Read the main file."
+    )
+    assert await assembler.handle_event("s1", "turn_complete") is None
+
+    assert turns == [("s1", "Read the main file.")]
+    stats = assembler.get_stats("s1")
+    assert stats["turns_dispatched"] == 1
+    assert stats["agent_calls_avoided"] == 2
+    assert stats["empty_completions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupted_keeps_turn_open():
+    """An interruption does not dispatch; later fragments join the same turn."""
+    turns = []
+
+    async def on_turn(session_id, text):
+        turns.append(text)
+
+    assembler = TranscriptAssembler(on_turn=on_turn)
+    assembler.add_fragment("s1", "stop ")
+    await assembler.handle_event("s1", "interrupted")
+    assembler.add_fragment("s1", " and  list the tests")
+    await assembler.handle_event("s1", "turn_complete")
+
+    assert turns == ["stop and list the tests"]
+    assert assembler.get_stats("s1")["interruptions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_isolated():
+    """Fragments from one session never leak into another."""
+    turns = []
+
+    async def on_turn(session_id, text):
+        turns.append((session_id, text))
+
+    assembler = TranscriptAssembler(on_turn=on_turn)
+    assembler.add_fragment("a", "hello")
+    assembler.add_fragment("b", "goodbye")
+    await assembler.handle_event("b", "turn_complete")
+
+    assert turns == [("b", "goodbye")]
+    assert assembler.get_stats("a")["pending_fragments"] == 1
+
+    assembler.cleanup_session("a")
+    assert assembler.get_stats("a") is None
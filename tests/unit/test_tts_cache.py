@@ -0,0 +1,184 @@
+"""Tests for the two-tier synthesized speech cache."""
+
+import asyncio
+import os
+
+import pytest
+
+from voice_ai_assistant.voice.tts_cache import TTSCache
+
+
+class CountingSynthesizer:
+    """Fake TTS that counts API calls."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def for_text(self, text):
+        async def synthesize():
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            return text.encode() * 10
+
+        return synthesize
+
+
+def _key(text):
+    return TTSCache.make_key(text, "en-US-Journey-D", "LINEAR16:24000:1.0")
+
+
+def test_key_ignores_whitespace_but_not_voice():
+    """Normalized text shares a key; a different voice does not."""
+    assert _key("Reading  the file.\n") == _key("Reading the file.")
+    assert _key("Reading the file.") != TTSCache.make_key(
+        "Reading the file.", "en-US-Neural2-A", "LINEAR16:24000:1.0"
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_text_hits_memory():
+    """The second request is served without calling the API."""
+    cache = TTSCache()
+    tts = CountingSynthesizer()
+
+    first = await cache.get_or_synthesize(
+        _key("One moment."), tts.for_text("One moment.")
+    )
+    second = await cache.get_or_synthesize(
+        _key("One moment."), tts.for_text("One moment.")
+    )
+
+    assert first == second
+    assert tts.calls == 1
+    stats = cache.get_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["bytes_saved"] == len(first)
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_respects_byte_budget():
+    """Least recently used clips are evicted once the budget is exceeded."""
+    cache = TTSCache(max_memory_bytes=250)
+    tts = CountingSynthesizer()
+
+    for text in ["aaaaaaaaaa", "bbbbbbbbbb", "aaaaaaaaaa", "cccccccccc"]:
+        await cache.get_or_synthesize(_key(text), tts.for_text(text))
+
+    stats = cache.get_stats()
+    assert stats["memory_bytes"] <= 250
+    assert stats["evictions"] == 1
+    # "a" was used more recently than "b", so "b" was evicted
+    await cache.get_or_synthesize(_key("aaaaaaaaaa"), tts.for_text("aaaaaaaaaa"))
+    assert tts.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(tmp_path):
+    """A new cache instance finds clips written by a previous one."""
+    tts = CountingSynthesizer()
+    await TTSCache(disk_dir=str(tmp_path)).get_or_synthesize(
+        _key("Done."), tts.for_text("Done.")
+    )
+
+    restarted = TTSCache(disk_dir=str(tmp_path))
+    audio = await restarted.get_or_synthesize(_key("Done."), tts.for_text("Done."))
+
+    assert audio == b"Done." * 10
+    assert tts.calls == 1
+    assert restarted.get_stats()["disk_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    """Single-flight: simultaneous misses for one clip call the API once."""
+    cache = TTSCache()
+    tts = CountingSynthesizer(delay=0.02)
+
+    results = await asyncio.gather(
+        *[
+            cache.get_or_synthesize(
+                _key("Working on it."), tts.for_text("Working on it.")
+            )
+            for _ in range(5)
+        ]
+    )
+
+    assert tts.calls == 1
+    assert len(set(results)) == 1
+    assert cache.get_stats()["shared_requests"] == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_synthesis_is_not_cached():
+    """None results are returned but not stored."""
+    cache = TTSCache()
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        return None
+
+    assert await cache.get_or_synthesize(_key("x"), failing) is None
+    assert await cache.get_or_synthesize(_key("x"), failing) is None
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_evicts_least_recently_used(tmp_path):
+    """Clips beyond the disk budget are deleted oldest first."""
+    cache = TTSCache(max_memory_bytes=0, disk_dir=str(tmp_path), max_disk_bytes=120)
+    tts = CountingSynthesizer()
+
+    for age, text in enumerate(["aaaaa", "bbbbb"]):
+        await cache.get_or_synthesize(_key(text), tts.for_text(text))
+        path = cache._disk_path(_key(text))
+        os.utime(path, (1000 + age, 1000 + age))
+    await cache.get_or_synthesize(_key("ccccc"), tts.for_text("ccccc"))
+
+    stats = cache.get_stats()
+    assert stats["disk_entries"] == 2
+    assert stats["disk_bytes"] == 100
+    assert stats["disk_evictions"] == 1
+    assert not os.path.exists(cache._disk_path(_key("aaaaa")))
+    assert TTSCache(disk_dir=str(tmp_path)).get_stats()["disk_bytes"] == 100
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stores_of_one_clip(tmp_path):
+    """Storing the same clip from several threads at once leaves it intact."""
+    cache = TTSCache(disk_dir=str(tmp_path))
+    audio = b"\x01\x02" * 50000
+
+    await asyncio.gather(*[cache.store(_key("Same text."), audio) for _ in range(8)])
+
+    with open(cache._disk_path(_key("Same text.")), "rb") as f:
+        assert f.read() == audio
+    assert cache.get_stats()["disk_entries"] == 1
+    assert not [
+        name
+        for name in os.listdir(tmp_path / _key("Same text.")[:2])
+        if name.endswith(".tmp")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_shared_request_counts_as_miss():
+    """Waiters on a failed synthesis are misses, not hits."""
+    cache = TTSCache()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("quota exceeded")
+
+    results = await asyncio.gather(
+        *[cache.get_or_synthesize(_key("x"), failing) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    stats = cache.get_stats()
+    assert stats["misses"] == 3
+    assert stats["shared_requests"] == 0
+    assert stats["hit_rate"] == 0.0
@@ -0,0 +1,153 @@
+"""Tests for TTSManager streaming synthesis, fallback and request limits."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+texttospeech = pytest.importorskip("google.cloud.texttospeech")
+
+from google.api_core import exceptions as google_exceptions  # noqa: E402
+
+from voice_ai_assistant.voice import tts_manager as tts_module  # noqa: E402
+from voice_ai_assistant.voice.tts_manager import (  # noqa: E402
+    SharedTTSClient,
+    TTSManager,
+    strip_wav_header,
+)
+from voice_ai_assistant.voice.tts_cache import TTSCache  # noqa: E402
+
+WAV_HEADER = b"RIFF" + b"\x00" * 4 + b"WAVE" + b"\x00" * 32
+
+
+class FakeTTSClient:
+    """Stands in for TextToSpeechAsyncClient."""
+
+    def __init__(self, stream_chunks=None, stream_error=None, delay=0.0):
+        self.stream_chunks = stream_chunks or []
+        # Raised by the next streaming call only
+        self.stream_error = stream_error
+        self.delay = delay
+        self.unary_calls = 0
+        self.active = 0
+        self.peak_active = 0
+
+    async def streaming_synthesize(self, requests):
+        async for _ in requests:
+            pass
+        if self.stream_error:
+            error, self.stream_error = self.stream_error, None
+            raise error
+
+        async def responses():
+            for chunk in self.stream_chunks:
+                yield SimpleNamespace(audio_content=chunk)
+
+        return responses()
+
+    async def synthesize_speech(self, input, voice, audio_config):
+        self.unary_calls += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return SimpleNamespace(audio_content=WAV_HEADER + b"\x01\x00" * 4)
+
+
+def _manager(monkeypatch, client, **kwargs):
+    monkeypatch.setattr(
+        tts_module.texttospeech, "TextToSpeechAsyncClient", lambda: client
+    )
+    monkeypatch.setattr(SharedTTSClient, "_instances", {})
+    return TTSManager(**kwargs)
+
+
+async def _collect(manager, text):
+    return [chunk async for chunk in manager.synthesize_stream(text)]
+
+
+def test_strip_wav_header():
+    """Unary LINEAR16 audio loses its header; raw PCM is untouched."""
+    assert strip_wav_header(WAV_HEADER + b"\x01\x00") == b"\x01\x00"
+    assert strip_wav_header(b"\x01\x00") == b"\x01\x00"
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_whole_samples_as_they_arrive(monkeypatch):
+    """Streaming chunks are relayed in order, realigned to 16-bit samples."""
+    client = FakeTTSClient(stream_chunks=[b"\x01\x00\x02", b"\x00\x03\x00"])
+    manager = _manager(monkeypatch, client)
+
+    chunks = await _collect(manager, "Hello there.")
+
+    assert chunks == [b"\x01\x00", b"\x02\x00\x03\x00"]
+    assert manager.get_stats()["streamed_requests"] == 1
+    assert client.unary_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_failure_falls_back_to_unary(monkeypatch):
+    """A voice without streaming support gets one unary chunk instead."""
+    client = FakeTTSClient(
+        stream_error=google_exceptions.InvalidArgument("streaming not supported")
+    )
+    manager = _manager(monkeypatch, client)
+
+    chunks = await _collect(manager, "Hello there.")
+
+    assert chunks == [b"\x01\x00" * 4]
+    stats = manager.get_stats()
+    assert stats["stream_fallbacks"] == 1
+    assert stats["streaming_enabled"] is False
+
+
+@pytest.mark.asyncio
+async def test_transient_stream_error_keeps_streaming(monkeypatch):
+    """A network blip falls back once; the next text streams again."""
+    client = FakeTTSClient(
+        stream_chunks=[b"\x02\x00"],
+        stream_error=google_exceptions.ServiceUnavailable("connection reset"),
+    )
+    manager = _manager(monkeypatch, client)
+
+    assert await _collect(manager, "First sentence.") == [b"\x01\x00" * 4]
+    assert await _collect(manager, "Second sentence.") == [b"\x02\x00"]
+
+    stats = manager.get_stats()
+    assert stats["streaming_enabled"] is True
+    assert stats["stream_fallbacks"] == 1
+    assert stats["streamed_requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_streamed_speech_is_not_written_to_disk(monkeypatch, tmp_path):
+    """Response segments are cached in memory only."""
+    client = FakeTTSClient(stream_chunks=[b"\x02\x00"])
+    manager = _manager(monkeypatch, client, cache=TTSCache(disk_dir=str(tmp_path)))
+
+    await _collect(manager, "Here is what I found.")
+
+    assert await _collect(manager, "Here is what I found.") == [b"\x02\x00"]
+    assert manager.cache.get_stats()["disk_entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_client_and_respect_limit(monkeypatch):
+    """Managers on one loop share the client; excess requests queue."""
+    client = FakeTTSClient(delay=0.02)
+    first = _manager(monkeypatch, client, max_concurrent_requests=2, streaming=False)
+    second = TTSManager(max_concurrent_requests=2, streaming=False)
+
+    await asyncio.gather(
+        *[
+            manager.synthesize(f"status {i}")
+            for i, manager in enumerate([first, second] * 3)
+        ]
+    )
+
+    assert client.unary_calls == 6
+    assert client.peak_active == 2
+    stats = first.get_stats()["client"]
+    assert stats["requests"] == 6
+    assert stats["queued_requests"] >= 4
+    assert stats["avg_queue_wait_ms"] > 0
@@ -0,0 +1,146 @@
+"""Tests for pipelined, order-preserving response synthesis."""
+
+import asyncio
+
+import pytest
+
+from voice_ai_assistant.orchestration.tts_pipeline import TTSSynthesisPipeline
+
+
+def _synthesizer(delays, started=None):
+    """Fake TTS whose latency depends on the text."""
+
+    async def synthesize(text):
+        if started is not None:
+            started.append(text)
+        await asyncio.sleep(delays.get(text, 0.0))
+        return text.encode()
+
+    return synthesize
+
+
+@pytest.mark.asyncio
+async def test_segments_play_in_order_despite_out_of_order_synthesis():
+    """A slow first segment delays playback but never reorders it."""
+    played, spoken = [], []
+    pipeline = TTSSynthesisPipeline(
+        synthesize=_synthesizer({"one": 0.05, "two": 0.0, "three": 0.01}),
+        play=played.append,
+        on_segment_played=spoken.append,
+    )
+
+    for text in ["one", "two", "three"]:
+        await pipeline.submit(text)
+    stats = await pipeline.finish()
+
+    assert played == [b"one", b"two", b"three"]
+    assert spoken == ["one", "two", "three"]
+    assert stats.segments == 3
+    assert len(stats.synthesis_ms) == 3
+    # "two" was ready long before "one" and waited for it
+    assert stats.order_wait_ms[1] > 30
+
+
+@pytest.mark.asyncio
+async def test_submit_does_not_wait_for_synthesis():
+    """Segments synthesize concurrently up to the in-flight limit."""
+    started = []
+    pipeline = TTSSynthesisPipeline(
+        synthesize=_synthesizer({"a": 0.05, "b": 0.05, "c": 0.05}, started),
+        play=lambda audio: None,
+        max_in_flight=2,
+    )
+
+    loop = asyncio.get_running_loop()
+    begin = loop.time()
+    await pipeline.submit("a")
+    await pipeline.submit("b")
+    await asyncio.sleep(0)
+    assert started == ["a", "b"]
+    assert loop.time() - begin < 0.03
+
+    # Window is full: the third segment waits for the first delivery
+    await pipeline.submit("c")
+    assert loop.time() - begin >= 0.04
+    await pipeline.finish()
+
+
+@pytest.mark.asyncio
+async def test_failed_segment_is_skipped():
+    """A synthesis error drops that segment and keeps the rest."""
+
+    async def synthesize(text):
+        if text == "bad":
+            raise RuntimeError("quota exceeded")
+        return text.encode()
+
+    played = []
+    pipeline = TTSSynthesisPipeline(synthesize=synthesize, play=played.append)
+    for text in ["good", "bad", "fine"]:
+        await pipeline.submit(text)
+    stats = await pipeline.finish()
+
+    assert played == [b"good", b"fine"]
+    assert stats.failed_segments == 1
+
+
+@pytest.mark.asyncio
+async def test_speaker_gap_measured_against_queued_audio():
+    """The speaker is idle when a segment arrives after queued audio ran out."""
+    pipeline = TTSSynthesisPipeline(
+        synthesize=_synthesizer({"first": 0.0, "second": 0.05}),
+        play=lambda audio: None,
+        buffered_ms=lambda: 10.0,
+    )
+    await pipeline.submit("first")
+    await pipeline.submit("second")
+    stats = await pipeline.finish()
+
+    assert len(stats.gap_ms) == 1
+    assert 20 < stats.gap_ms[0] < 200
+    assert stats.first_audio_ms is not None
+
+
+@pytest.mark.asyncio
+async def test_cancel_drops_pending_segments():
+    """Barge-in stops synthesis; nothing more is played."""
+    played = []
+    pipeline = TTSSynthesisPipeline(
+        synthesize=_synthesizer({"later": 1.0}), play=played.append, max_in_flight=1
+    )
+    await pipeline.submit("later")
+    blocked = asyncio.create_task(pipeline.submit("never"))
+    await asyncio.sleep(0.01)
+
+    await pipeline.cancel()
+    await asyncio.wait_for(blocked, timeout=1.0)
+
+    assert pipeline.cancelled
+    assert played == []
+
+
+@pytest.mark.asyncio
+async def test_streamed_segment_plays_before_synthesis_finishes():
+    """Chunks of the head segment reach playback as they are produced."""
+    played = []
+    release = asyncio.Event()
+
+    async def synthesize_stream(text):
+        yield text.encode() + b"-1"
+        await release.wait()
+        yield text.encode() + b"-2"
+
+    pipeline = TTSSynthesisPipeline(
+        synthesize_stream=synthesize_stream, play=played.append
+    )
+    await pipeline.submit("a")
+    await pipeline.submit("b")
+    await asyncio.sleep(0.01)
+
+    # "b" is already synthesizing but must wait for "a" to finish playing
+    assert played == [b"a-1"]
+
+    release.set()
+    stats = await pipeline.finish()
+    assert played == [b"a-1", b"a-2", b"b-1", b"b-2"]
+    assert stats.segments == 2
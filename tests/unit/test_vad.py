@@ -0,0 +1,149 @@
+"""Tests for voice activity detection."""
+
+import numpy as np
+import pytest
+
+from voice_ai_assistant.orchestration.pipeline import StreamingPipelineManager
+from voice_ai_assistant.voice.vad import VADConfig, VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+CHUNK = 1600  # 100 ms
+
+
+def _voiced(samples: int = CHUNK, f0: float = 150.0, amplitude: float = 0.1) -> bytes:
+    t = np.arange(samples) / SAMPLE_RATE
+    wave = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 10))
+    return (wave * amplitude * 32768).astype(np.int16).tobytes()
+
+
+def _silence(samples: int = CHUNK, amplitude: float = 0.0003, seed: int = 0) -> bytes:
+    rng = np.random.default_rng(seed)
+    return (rng.normal(0, amplitude, samples) * 32768).astype(np.int16).tobytes()
+
+
+def _loud_noise(samples: int = CHUNK, seed: int = 1) -> bytes:
+    rng = np.random.default_rng(seed)
+    return (rng.normal(0, 0.1, samples) * 32768).astype(np.int16).tobytes()
+
+
+def test_silence_is_suppressed():
+    """Background hiss is never forwarded."""
+    vad = VoiceActivityDetector()
+    results = [vad.process(_silence(seed=i)) for i in range(20)]
+
+    assert all(result.audio is None for result in results)
+    assert vad.get_stats()["suppression_ratio"] == 1.0
+
+
+def test_speech_start_includes_pre_roll():
+    """The first speech chunk is preceded by buffered pre-roll audio."""
+    vad = VoiceActivityDetector(VADConfig(pre_roll_ms=200))
+    for i in range(5):
+        vad.process(_silence(seed=i))
+
+    result = vad.process(_voiced())
+
+    assert result.speech_started
+    assert len(result.audio) == (2 * CHUNK + CHUNK) * 2
+
+
+def test_hangover_then_speech_end():
+    """Audio keeps flowing during the hangover, then speech end fires once."""
+    vad = VoiceActivityDetector(VADConfig(hangover_ms=300))
+    vad.process(_voiced())
+
+    results = [vad.process(_silence(seed=i)) for i in range(4)]
+
+    assert [result.audio is not None for result in results] == [
+        True,
+        True,
+        False,
+        False,
+    ]
+    assert [result.speech_ended for result in results] == [False, False, True, False]
+    assert not vad.is_speaking
+
+
+def test_broadband_noise_is_not_speech():
+    """Loud white noise fails the flatness and zero-crossing checks."""
+    vad = VoiceActivityDetector()
+    results = [vad.process(_loud_noise(seed=i)) for i in range(5)]
+
+    assert not any(result.is_speech for result in results)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_suppresses_silence_and_emits_events():
+    """Pipeline returns None for silence and reports speech boundaries."""
+    events = []
+    pipeline = StreamingPipelineManager(
+        enable_vad=True, vad_config=VADConfig(hangover_ms=100)
+    )
+    pipeline.set_speech_start_callback(
+        lambda session_id: events.append(("start", session_id))
+    )
+    pipeline.set_speech_end_callback(
+        lambda session_id: events.append(("end", session_id))
+    )
+    await pipeline.initialize_session("s1")
+
+    assert await pipeline.process_audio_chunk("s1", _silence()) is None
+    assert await pipeline.process_audio_chunk("s1", _voiced()) is not None
+    assert await pipeline.process_audio_chunk("s1", _silence(seed=2)) is None
+
+    assert events == [("start", "s1"), ("end", "s1")]
+    metrics = pipeline.get_session_state("s1")["metrics"]
+    assert metrics["chunks_suppressed"] == 2
+
+    await pipeline.cleanup_session("s1")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_records_turn_latency_after_speech_end():
+    """First response after speech end yields one turn latency sample."""
+    pipeline = StreamingPipelineManager(
+        enable_vad=True, vad_config=VADConfig(hangover_ms=100)
+    )
+    await pipeline.initialize_session("s1")
+
+    assert pipeline.record_response_start("s1") is None
+
+    await pipeline.process_audio_chunk("s1", _voiced())
+    await pipeline.process_audio_chunk("s1", _silence())
+
+    latency = pipeline.record_response_start("s1")
+    assert latency is not None and latency >= 100
+    assert pipeline.record_response_start("s1") is None
+
+    metrics = pipeline.get_session_state("s1")["metrics"]
+    assert metrics["turns_measured"] == 1
+
+    await pipeline.cleanup_session("s1")
+
+
+def _hum(seconds: float, level_db: float = -40.0, seed: int = 3) -> list:
+    """Low-pass filtered noise (fan, HVAC) in 100 ms chunks."""
+    rng = np.random.default_rng(seed)
+    samples = int(seconds * SAMPLE_RATE)
+    noise = rng.normal(0, 1, samples)
+    spectrum = np.fft.rfft(noise)
+    spectrum[np.fft.rfftfreq(samples, 1 / SAMPLE_RATE) > 300] = 0
+    hum = np.fft.irfft(spectrum, samples)
+    hum *= 10 ** (level_db / 20) / np.sqrt(np.mean(hum**2))
+    audio = (hum * 32768).astype(np.int16)
+    return [audio[i : i + CHUNK].tobytes() for i in range(0, samples, CHUNK)]
+
+
+def test_steady_low_frequency_noise_is_learned():
+    """Stationary hum rises into the noise floor, ends speech and is suppressed."""
+    vad = VoiceActivityDetector(VADConfig(hangover_ms=300))
+    results = [vad.process(chunk) for chunk in _hum(seconds=15)]
+
+    assert sum(result.speech_ended for result in results) == 1
+    assert not vad.is_speaking
+    assert vad.noise_floor_db > -45
+    # Once learned, the hum is no longer forwarded
+    assert all(result.audio is None for result in results[-50:])
+
+    # Speech above the hum is still detected
+    assert vad.process(_voiced()).speech_started
@@ -0,0 +1,170 @@
+"""Tests for VertexLiveClient session setup and response handling."""
+
+import base64
+import json
+
+import pytest
+
+from voice_ai_assistant.voice.auth import VertexAuthManager
+from voice_ai_assistant.voice.vertex_client import VertexLiveClient
+
+
+def _client(**kwargs) -> VertexLiveClient:
+    return VertexLiveClient(auth_manager=VertexAuthManager("test-project"), **kwargs)
+
+
+def _audio_turn() -> str:
+    return json.dumps(
+        {
+            "serverContent": {
+                "modelTurn": {
+                    "parts": [
+                        {
+                            "inlineData": {
+                                "mimeType": "audio/pcm;rate=24000",
+                                "data": base64.b64encode(b"\x00\x01" * 8).decode(),
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+    )
+
+
+def test_audio_mode_requests_spoken_responses():
+    """Default mode keeps the audio setup and registers tools."""
+    client = _client(model="native-audio-model", tools=[{"function_declarations": []}])
+
+    config = client._build_setup_config()
+
+    assert config["model"] == "models/native-audio-model"
+    assert config["generationConfig"]["responseModalities"] == "audio"
+    assert "tools" in config
+    assert "inputAudioTranscription" not in config
+
+
+def test_transcription_mode_requests_no_audio():
+    """Transcription sessions enable input transcription and request text only."""
+    client = _client(
+        model="live-text-model",
+        tools=[{"function_declarations": []}],
+        response_mode="transcription",
+    )
+
+    config = client._build_setup_config()
+
+    assert config["generationConfig"]["responseModalities"] == ["TEXT"]
+    assert "speechConfig" not in config["generationConfig"]
+    assert config["inputAudioTranscription"] == {}
+    assert "tools" not in config
+
+
+def test_client_activity_detection_disables_server_end_pointing():
+    """Disabling automatic detection is reflected in the setup message."""
+    config = _client(automatic_activity_detection=False)._build_setup_config()
+
+    assert (
+        config["realtimeInputConfig"]["automaticActivityDetection"]["disabled"] is True
+    )
+
+
+def test_unknown_response_mode_rejected():
+    """Invalid response modes fail fast."""
+    with pytest.raises(ValueError):
+        _client(response_mode="video")
+
+
+@pytest.mark.asyncio
+async def test_transcription_mode_delivers_transcripts_and_skips_audio():
+    """Input transcripts reach the callback; model audio is never decoded."""
+    client = _client(response_mode="transcription")
+    transcripts, audio = [], []
+    client.set_input_transcription_callback(transcripts.append)
+    client.set_audio_response_callback(audio.append)
+
+    await client._handle_response(
+        json.dumps(
+            {"serverContent": {"inputTranscription": {"text": "read the main file"}}}
+        )
+    )
+    await client._handle_response(_audio_turn())
+
+    assert transcripts == ["read the main file"]
+    assert audio == []
+
+
+@pytest.mark.asyncio
+async def test_audio_mode_decodes_audio():
+    """Audio mode still decodes and delivers model audio."""
+    client = _client()
+    audio = []
+    client.set_audio_response_callback(audio.append)
+
+    await client._handle_response(_audio_turn())
+
+    assert audio == [b"\x00\x01" * 8]
+
+
+@pytest.mark.asyncio
+async def test_turn_signals_reported_in_order():
+    """serverContent turn flags are reported after the message content."""
+    client = _client(response_mode="transcription")
+    events = []
+    client.set_input_transcription_callback(lambda text: events.append(("text", text)))
+    client.set_turn_event_callback(lambda event: events.append(("event", event)))
+
+    await client._handle_response(
+        json.dumps(
+            {
+                "serverContent": {
+                    "inputTranscription": {"text": " file."},
+                    "generationComplete": True,
+                    "turnComplete": True,
+                }
+            }
+        )
+    )
+
+    assert events == [
+        ("text", " file."),
+        ("event", "generation_complete"),
+        ("event", "turn_complete"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_and_cancellations_reported():
+    """Function calls and their cancellations reach the callbacks."""
+    client = _client(response_mode="audio")
+    calls, cancelled = [], []
+    client.set_tool_call_callback(calls.extend)
+    client.set_tool_call_cancellation_callback(cancelled.extend)
+
+    await client._handle_response(
+        json.dumps(
+            {
+                "toolCall": {
+                    "functionCalls": [
+                        {
+                            "id": "call-1",
+                            "name": "run_coding_task",
+                            "args": {"task_description": "List files"},
+                        }
+                    ]
+                }
+            }
+        )
+    )
+    await client._handle_response(
+        json.dumps({"toolCallCancellation": {"ids": ["call-1"]}})
+    )
+
+    assert calls == [
+        {
+            "id": "call-1",
+            "name": "run_coding_task",
+            "args": {"task_description": "List files"},
+        }
+    ]
+    assert cancelled == ["call-1"]